@@ -2,19 +2,14 @@
 from pathlib import Path
 from typing import List, Optional
 
-import pdfplumber
 from docx import Document as DocxDocument
 
+from app.utils.pdf_extractor import extract_text
+
 
 def load_pdf(file_path: str) -> str:
     """Load text content from PDF file."""
-    text_parts = []
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-    return "\n\n".join(text_parts)
+    return extract_text(file_path, separator="\n\n")
 
 
 def load_docx(file_path: str) -> str:
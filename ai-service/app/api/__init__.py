@@ -10,6 +10,7 @@ from . import (
     chatbot_router,
     esg_standards_router,
     issue_pool_router,
+    job_router,
     materiality_router,
     media_router,
     report_router,
@@ -21,6 +22,7 @@ __all__ = [
     "chatbot_router",
     "esg_standards_router",
     "issue_pool_router",
+    "job_router",
     "materiality_router",
     "media_router",
     "report_router",
@@ -5,15 +5,21 @@ Benchmark Analysis Router - ESG 벤치마킹 분석 API
 내부 전용 API (Spring Boot → FastAPI)
 """
 
+import asyncio
+import json
 import os
 import shutil
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from app.core.logging import get_logger
+from app.infra.benchmark_index import get_benchmark_index
+from app.infra.chunk_embedding_store import get_chunk_embedding_store
 from app.infra.file_storage import FileStorageService, get_file_storage_service
+from app.infra.vector_store_pool import get_vector_store_pool
 from app.schemas.benchmark_schema import (
     BenchmarkAnalyzeRequest,
     BenchmarkAnalyzeResponse,
@@ -22,7 +28,18 @@ from app.schemas.benchmark_schema import (
     CompanyPDF,
     KeywordAnalysisResult,
 )
+from app.schemas.job_schema import JOB_STATUS_COMPLETED, JobInfo, JobSubmitResponse
+from app.services.benchmark_jobs import (
+    JOB_KIND_DEDUPE_UPLOADS,
+    JOB_KIND_EMBED_DOCUMENT,
+    JOB_KIND_MIGRATE_INDEX,
+    JOB_KIND_REANALYZE_ALL,
+    JOB_KIND_UPLOAD_AND_ANALYZE,
+)
 from app.services.benchmark_service import get_benchmark_service, reload_benchmark_service
+from app.services.ingestion_jobs import COLLECTION_BENCHMARK, get_document_status, submit_ingestion
+from app.services.job_service import get_job_service
+from app.services.vector_store_gc import release_report_stores, submit_gc
 
 logger = get_logger(__name__)
 
@@ -207,6 +224,100 @@ async def analyze_keyword(
         )
 
 
+class BenchmarkCompanyRef(BaseModel):
+    """Company PDF reference for keyword analysis"""
+    name: str
+    path: str
+
+
+class BenchmarkKeywordStreamRequest(BaseModel):
+    """Request for streaming keyword analysis"""
+    keyword: str
+    companies: List[BenchmarkCompanyRef]
+    max_concurrency: Optional[int] = None
+    timeout_sec: Optional[float] = None
+
+
+@router.post(
+    "/analyze/stream",
+    summary="ESG 키워드 벤치마킹 분석 (스트리밍)",
+    description="""
+    여러 회사를 동시에 분석하고, 회사별 결과를 완료되는 즉시 NDJSON으로 전송합니다.
+
+    **이벤트 형식 (한 줄에 JSON 하나):**
+    - `{"type": "result", "company": ..., "coverage": ..., "response": ..., "source_pages": [...]}`
+    - `{"type": "done", "summary": {...}}`
+
+    느리거나 손상된 PDF는 회사별 제한 시간 후 No로 처리되며 다른 회사 결과를 지연시키지 않습니다.
+    """,
+)
+async def analyze_keyword_stream(request: BenchmarkKeywordStreamRequest) -> StreamingResponse:
+    """키워드 기반 벤치마킹 분석 (회사별 결과 스트리밍)"""
+    logger.info(f"Streaming keyword '{request.keyword}' analysis for {len(request.companies)} companies")
+
+    service = get_benchmark_service()
+    companies_data = [{"name": c.name, "path": c.path} for c in request.companies]
+
+    async def event_stream():
+        results = {}
+        async for company_name, result in service.iter_keyword_for_companies(
+            request.keyword,
+            companies_data,
+            max_concurrency=request.max_concurrency,
+            timeout_sec=request.timeout_sec,
+        ):
+            results[company_name] = result
+            yield json.dumps({"type": "result", "company": company_name, **result}, ensure_ascii=False) + "\n"
+
+        summary = service.get_benchmark_summary(results)
+        yield json.dumps({"type": "done", "keyword": request.keyword, "summary": summary}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+class BenchmarkMatrixRequest(BaseModel):
+    """Request for keyword x company coverage matrix"""
+    keywords: List[str]
+    companies: List[BenchmarkCompanyRef]
+    evidence_per_cell: Optional[int] = None
+
+
+@router.post(
+    "/matrix",
+    summary="키워드 × 회사 커버리지 매트릭스",
+    description="""
+    여러 키워드와 여러 회사의 커버리지 그리드를 한 번에 생성합니다.
+
+    - 키워드를 한 번에 임베딩하고 통합 인덱스에서 모든 회사 청크를 1회 검색
+    - 키워드 출현 통계는 캐시된 페이지 텍스트에서 계산 (출현 0회 셀은 LLM 호출 없이 No)
+    - 셀별 상위 근거만 모아 배치 LLM 호출로 판정/요약
+    """,
+)
+async def analyze_coverage_matrix(request: BenchmarkMatrixRequest):
+    """키워드 × 회사 커버리지 매트릭스"""
+    keywords = [k.strip() for k in request.keywords if k.strip()]
+    if not keywords or not request.companies:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "ESG-AI-BENCH-005", "message": "키워드와 회사 목록이 필요합니다"},
+        )
+
+    service = get_benchmark_service()
+    try:
+        result = await service.build_coverage_matrix(
+            keywords,
+            [{"name": c.name, "path": c.path} for c in request.companies],
+            evidence_per_cell=request.evidence_per_cell,
+        )
+    except Exception as e:
+        logger.error(f"Coverage matrix error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"code": "ESG-AI-BENCH-007", "message": "매트릭스 분석 중 오류가 발생했습니다", "details": str(e)},
+        )
+    return {"success": True, **result}
+
+
 @router.get(
     "/pdfs",
     response_model=BenchmarkPDFListResponse,
@@ -252,30 +363,52 @@ async def get_uploaded_pdfs(
 @router.delete(
     "/pdfs/{filename}",
     summary="업로드된 PDF 삭제",
-    description="특정 PDF 파일을 삭제합니다.",
+    description="""
+    특정 PDF 파일(또는 별칭)을 삭제합니다.
+
+    같은 내용이 여러 별칭으로 공유되면 해당 별칭만 해제되고, 마지막 참조일 때 파일이 삭제됩니다.
+    공유된 문서를 문서 ID로 지정하면 409를 반환하므로 별칭을 지정하거나 all_references=true를 사용하세요.
+    """,
 )
 async def delete_pdf(
     filename: str,
+    all_references: bool = False,
     storage: FileStorageService = Depends(get_file_storage_service),
 ):
     """
     PDF 파일 삭제
 
     Args:
-        filename: 삭제할 파일명
+        filename: 삭제할 파일명 또는 별칭
+        all_references: True면 모든 별칭을 해제하고 파일 삭제
 
     Returns:
         삭제 결과
     """
     try:
-        deleted = storage.delete_by_id(filename, storage.benchmark_dir)
+        filepath = storage.get_file_path(filename)
+        report_hash = get_benchmark_service().get_report_hash(filepath) if filepath else None
+        try:
+            deleted = storage.delete_by_id(filename, storage.benchmark_dir, all_references=all_references)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"code": "ESG-AI-BENCH-008", "message": str(e)},
+            )
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"code": "ESG-AI-BENCH-002", "message": "파일을 찾을 수 없습니다"},
             )
 
-        return {"success": True, "message": f"{filename} 삭제 완료"}
+        # 마지막 참조였으면 벡터 스토어도 함께 정리
+        released = await asyncio.to_thread(release_report_stores, [report_hash] if report_hash else [])
+        return {
+            "success": True,
+            "message": f"{filename} 삭제 완료",
+            "released_stores": list(released),
+            "reclaimed_bytes": sum(released.values()),
+        }
 
     except HTTPException:
         raise
@@ -360,6 +493,31 @@ async def get_cached_data():
     }
 
 
+@router.get(
+    "/coverage",
+    summary="이슈 × 회사 커버리지 매트릭스 조회",
+    description="""
+    분석된 모든 회사의 SK 이슈 커버리지 매트릭스를 반환합니다.
+
+    - cells: {이슈: {회사: Yes/Partially/No}}
+    - by_issue / by_company: Yes/Partially/No 개수와 coverage_rate
+
+    회사 분석/삭제 시 증분 갱신된 매트릭스를 메모리에서 바로 반환하며,
+    If-None-Match 헤더가 현재 ETag와 같으면 304를 반환합니다.
+    """,
+)
+async def get_coverage_matrix(request: Request) -> Response:
+    """커버리지 매트릭스 반환 (ETag 지원)"""
+    service = get_benchmark_service()
+    body, etag = service.get_coverage_matrix()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post(
     "/analyze-issues",
     summary="SK 17개 이슈 기반 벤치마킹 분석",
@@ -403,10 +561,9 @@ async def analyze_company_issues(
         service = get_benchmark_service()
         result = await service.analyze_company_issues(pdf_path, company_name)
 
-        # 요약 통계
-        yes_count = sum(1 for r in result.values() if r["coverage"] == "Yes")
-        partially_count = sum(1 for r in result.values() if r["coverage"] == "Partially")
-        no_count = sum(1 for r in result.values() if r["coverage"] == "No")
+        # 요약 통계 (커버리지 매트릭스 집계)
+        counts = service.get_company_coverage_counts(company_name, result)
+        yes_count, partially_count, no_count = counts["Yes"], counts["Partially"], counts["No"]
 
         return {
             "success": True,
@@ -435,50 +592,91 @@ async def analyze_company_issues(
     description="""
     여러 회사의 PDF를 업로드하고 SK 17개 이슈 기준으로 일괄 분석합니다.
 
-    **주의:** 분석에 회사당 1-2분 소요될 수 있습니다.
+    **주의:**
+    - 분석에 회사당 1-2분 소요될 수 있습니다
+    - 작업이 끝날 때까지 HTTP 요청이 열린 상태로 유지됩니다.
+      즉시 작업 ID를 받으려면 POST /jobs/upload-and-analyze 후 /internal/v1/jobs/{job_id}로 조회하세요
     """,
 )
 async def upload_and_analyze(
     files: List[UploadFile] = File(..., description="PDF 파일들"),
     storage: FileStorageService = Depends(get_file_storage_service),
 ):
-    """PDF 업로드 후 SK 17개 이슈 분석"""
+    """PDF 업로드 후 SK 17개 이슈 분석 (작업 완료까지 대기)"""
     logger.info(f"Received {len(files)} files for upload and analysis")
 
+    job, _ = await _submit_upload_and_analyze(files, storage)
+    if job is None:
+        return {"success": True, "count": 0, "success_companies": [], "failed_companies": [], "data": {}}
+
+    job = await get_job_service().wait(job.job_id)
+    return _job_result(job)
+
+
+def _analysis_event_stream(companies: List[Dict[str, str]], max_concurrency: Optional[int]):
+    """회사별 SK 이슈 분석 이벤트를 NDJSON 줄로 변환 (마지막에 done 요약)"""
     service = get_benchmark_service()
-    success_companies = []
-    failed_companies = []
-    results = {}
 
-    for file in files:
-        if not file.filename or not file.filename.lower().endswith(".pdf"):
-            continue
+    async def event_stream():
+        success_companies, failed_companies = [], []
+        async for event in service.iter_company_issue_analyses(
+            [{"name": c["company_name"], "path": c["path"]} for c in companies],
+            max_concurrency=max_concurrency,
+        ):
+            if event["type"] == "result":
+                success_companies.append(event["company"])
+            elif event["type"] == "error":
+                failed_companies.append(event["company"])
+            yield json.dumps(event, ensure_ascii=False) + "\n"
 
-        company_name = file.filename.rsplit(".", 1)[0]
+        yield json.dumps({
+            "type": "done",
+            "count": len(success_companies),
+            "success_companies": success_companies,
+            "failed_companies": failed_companies,
+        }, ensure_ascii=False) + "\n"
 
-        try:
-            # Delegate file storage to infra layer
-            doc_info = await storage.save_benchmark_file(file, company_name)
-            filepath = doc_info["path"]
+    return event_stream()
 
-            # 분석
-            result = await service.analyze_company_issues(filepath, company_name)
-            results[company_name] = result
-            success_companies.append(company_name)
 
-            logger.info(f"Successfully analyzed: {company_name}")
+@router.post(
+    "/upload-and-analyze/stream",
+    summary="PDF 업로드 및 SK 18개 이슈 분석 (스트리밍)",
+    description="""
+    PDF를 저장한 뒤 회사들을 동시에 분석하며 진행 상황과 결과를 NDJSON으로 전송합니다.
+
+    **이벤트 형식 (한 줄에 JSON 하나):**
+    - `{"type": "uploaded", "company": ..., "document_id": ...}`
+    - `{"type": "progress", "company": ..., "step": "started|extracted|embedded|materiality_found|issue_matched|done", ...}`
+    - `{"type": "result", "company": ..., "data": {...}, "summary": {...}}` - 회사 분석 완료 즉시
+    - `{"type": "error", "company": ..., "message": ...}`
+    - `{"type": "done", "count": ..., "success_companies": [...], "failed_companies": [...]}`
+    """,
+)
+async def upload_and_analyze_stream(
+    files: List[UploadFile] = File(..., description="PDF 파일들"),
+    max_concurrency: Optional[int] = None,
+    storage: FileStorageService = Depends(get_file_storage_service),
+) -> StreamingResponse:
+    """PDF 업로드 후 SK 18개 이슈 분석 (진행 이벤트 스트리밍)"""
+    saved = await _save_analysis_uploads(files, storage)
+    if not saved:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "ESG-AI-BENCH-005", "message": "유효한 PDF 파일이 없습니다"},
+        )
+    logger.info(f"Streaming upload-and-analyze for {len(saved)} files")
 
-        except Exception as e:
-            logger.error(f"Error analyzing {company_name}: {e}")
-            failed_companies.append(company_name)
+    async def event_stream():
+        for item in saved:
+            yield json.dumps(
+                {"type": "uploaded", "company": item["company_name"], "document_id": item["document_id"]},
+                ensure_ascii=False,
+            ) + "\n"
+        async for line in _analysis_event_stream(saved, max_concurrency):
+            yield line
 
-    return {
-        "success": True,
-        "count": len(success_companies),
-        "success_companies": success_companies,
-        "failed_companies": failed_companies,
-        "data": results,
-    }
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
 
 
 @router.delete(
@@ -492,7 +690,16 @@ async def delete_company_data(company_name: str):
 
     if service.delete_company_cache(company_name):
         logger.info(f"Deleted cache for: {company_name}")
-        return {"success": True, "message": f"{company_name} 데이터 삭제 완료"}
+        # 업로드 PDF가 남아 있지 않은 회사 보고서의 스토어/인덱스 항목 정리
+        released = await asyncio.to_thread(
+            release_report_stores, get_benchmark_index().report_hashes_for([company_name])
+        )
+        return {
+            "success": True,
+            "message": f"{company_name} 데이터 삭제 완료",
+            "released_stores": list(released),
+            "reclaimed_bytes": sum(released.values()),
+        }
     else:
         return {"success": False, "message": f"{company_name} 데이터를 찾을 수 없습니다"}
 
@@ -512,6 +719,10 @@ async def health_check():
         "service": "benchmark-analysis",
         "cached_companies": len(cached_companies),
         "sk_issues_count": 18,
+        "vector_store_pool": get_vector_store_pool().stats(),
+        "evidence_packing": service.get_packing_stats(),
+        "chunk_embeddings": get_chunk_embedding_store().stats(),
+        "report_caches": service.get_report_cache_stats(),
     }
 
 
@@ -524,89 +735,22 @@ async def health_check():
     **주의:**
     - 기존 캐시를 모두 삭제합니다
     - 분석에 상당한 시간이 소요됩니다 (회사당 1-2분)
+    - 작업이 끝날 때까지 HTTP 요청이 열린 상태로 유지됩니다.
+      즉시 작업 ID를 받으려면 POST /jobs/reanalyze-all 후 /internal/v1/jobs/{job_id}로 조회하세요
     """,
 )
 async def reanalyze_all():
     """
-    기존 벤치마킹 폴더의 모든 PDF를 새 18개 이슈 기준으로 재분석
-    """
-    from pathlib import Path
-    from app.services.benchmark_service import LEGACY_UPLOADS_DIR, LEGACY_CACHE_FILE
+    기존 벤치마킹 폴더의 모든 PDF를 새 18개 이슈 기준으로 재분석 (작업 완료까지 대기)
 
+    진행 중인 재분석이 있으면 새로 시작하지 않고 해당 작업 결과를 기다립니다.
+    """
     logger.info("Starting full re-analysis with 18 issues...")
 
-    # 1. 기존 캐시 백업 및 삭제
-    if LEGACY_CACHE_FILE.exists():
-        backup_path = LEGACY_CACHE_FILE.with_suffix('.json.bak')
-        shutil.copy(LEGACY_CACHE_FILE, backup_path)
-        logger.info(f"Backed up cache to {backup_path}")
-
-        # 캐시 파일 비우기
-        with open(LEGACY_CACHE_FILE, 'w') as f:
-            f.write('{}')
-        logger.info("Cleared cache file")
-
-    # 2. 서비스 재초기화 (캐시 다시 로드)
-    from app.services import benchmark_service as bs
-    bs._benchmark_service = None
-    service = get_benchmark_service()
-
-    # 3. PDF 파일 목록 수집 (회사별 최신 파일만)
-    if not LEGACY_UPLOADS_DIR.exists():
-        return {
-            "success": False,
-            "message": f"업로드 폴더가 없습니다: {LEGACY_UPLOADS_DIR}",
-        }
-
-    # 회사별 최신 PDF 찾기
-    company_pdfs = {}
-    for pdf_file in LEGACY_UPLOADS_DIR.glob("*.pdf"):
-        filename = pdf_file.name
-        # 회사명 추출 (타임스탬프 제거)
-        parts = filename.rsplit("_", 2)
-        if len(parts) >= 3 and parts[-1].endswith('.pdf'):
-            company_name = parts[0]
-        else:
-            company_name = filename.rsplit(".", 1)[0]
-
-        # 최신 파일 유지
-        if company_name not in company_pdfs or pdf_file.stat().st_mtime > company_pdfs[company_name].stat().st_mtime:
-            company_pdfs[company_name] = pdf_file
-
-    logger.info(f"Found {len(company_pdfs)} companies to analyze")
-
-    # 4. 회사별 재분석
-    success_companies = []
-    failed_companies = []
-
-    for company_name, pdf_path in company_pdfs.items():
-        try:
-            logger.info(f"Analyzing {company_name}...")
-            result = await service.analyze_company_issues(str(pdf_path), company_name)
-
-            yes_count = sum(1 for r in result.values() if r["coverage"] == "Yes")
-            logger.info(f"  -> {company_name}: {yes_count}/18 issues covered")
-
-            success_companies.append({
-                "name": company_name,
-                "yes_count": yes_count,
-            })
-
-        except Exception as e:
-            logger.error(f"Failed to analyze {company_name}: {e}")
-            failed_companies.append({
-                "name": company_name,
-                "error": str(e),
-            })
-
-    return {
-        "success": True,
-        "message": f"{len(success_companies)}개 회사 재분석 완료",
-        "analyzed": len(success_companies),
-        "failed": len(failed_companies),
-        "success_companies": success_companies,
-        "failed_companies": failed_companies,
-    }
+    job_service = get_job_service()
+    job, _ = job_service.submit(JOB_KIND_REANALYZE_ALL, dedupe_key="all")
+    job = await job_service.wait(job.job_id)
+    return _job_result(job)
 
 
 @router.post(
@@ -661,6 +805,7 @@ class BenchmarkDocumentInfo(BaseModel):
     size: int
     uploadedAt: str
     status: str
+    jobId: Optional[str] = None
 
 
 class BenchmarkDocumentListResponse(BaseModel):
@@ -696,15 +841,18 @@ async def get_benchmark_documents(
 ) -> BenchmarkDocumentListResponse:
     """업로드된 벤치마킹 문서 목록 조회"""
     files = storage.list_benchmark_files()
+    statuses = await asyncio.to_thread(
+        lambda: [get_document_status(f["path"], COLLECTION_BENCHMARK) for f in files]
+    )
     documents = [
         BenchmarkDocumentInfo(
             id=f["id"],
             name=f["name"],
             size=f["size"],
             uploadedAt=f["uploadedAt"],
-            status=f["status"],
+            status=doc_status,
         )
-        for f in files
+        for f, doc_status in zip(files, statuses)
     ]
 
     logger.info(f"Retrieved {len(documents)} benchmark documents")
@@ -730,6 +878,7 @@ async def upload_benchmark_documents(
     """벤치마킹 문서 업로드"""
     logger.info(f"Received {len(files)} files for benchmark upload")
 
+    service = get_benchmark_service()
     uploaded_docs = []
 
     for file in files:
@@ -743,12 +892,22 @@ async def upload_benchmark_documents(
         # Delegate to infra layer
         doc_info = await storage.save_benchmark_file(file)
 
+        # 동일 내용 재업로드: 기존 분석 결과가 있으면 즉시 분석 완료 상태로 반환
+        company_name = file.filename.rsplit(".", 1)[0]
+        job = None
+        if doc_info.get("duplicate") and service.reuse_cached_analysis(company_name, doc_info["aliases"]):
+            doc_status = "embedded"
+        else:
+            # 추출/청크/임베딩을 업로드 시점에 백그라운드로 진행
+            job, doc_status = submit_ingestion(doc_info["id"], doc_info["path"], COLLECTION_BENCHMARK, company_name)
+
         uploaded_docs.append(BenchmarkDocumentInfo(
             id=doc_info["id"],
             name=doc_info["name"],
             size=doc_info["size"],
             uploadedAt=doc_info["uploadedAt"],
-            status=doc_info["status"]
+            status=doc_status,
+            jobId=job.job_id if job else None,
         ))
 
     if not uploaded_docs:
@@ -770,24 +929,46 @@ async def upload_benchmark_documents(
     "/documents/{document_id}",
     status_code=status.HTTP_200_OK,
     summary="벤치마킹 문서 삭제",
-    description="업로드된 벤치마킹 문서를 삭제합니다.",
+    description="업로드된 벤치마킹 문서(또는 별칭)를 삭제합니다. 공유된 문서는 별칭 또는 all_references=true로 지정합니다.",
 )
 async def delete_benchmark_document(
     document_id: str,
+    all_references: bool = False,
     storage: FileStorageService = Depends(get_file_storage_service),
 ) -> dict:
     """벤치마킹 문서 삭제"""
-    deleted = storage.delete_by_id(document_id, storage.benchmark_dir)
-    if deleted:
-        return {"success": True, "message": f"Document {document_id} deleted"}
-    return {"success": False, "message": f"Document {document_id} not found"}
+    filepath = storage.get_file_path(document_id)
+    report_hash = get_benchmark_service().get_report_hash(filepath) if filepath else None
+    try:
+        deleted = storage.delete_by_id(document_id, storage.benchmark_dir, all_references=all_references)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"code": "ESG-AI-BENCH-008", "message": str(e)},
+        )
+    if not deleted:
+        return {"success": False, "message": f"Document {document_id} not found"}
+
+    # 마지막 참조였으면 벡터 스토어도 함께 정리
+    released = await asyncio.to_thread(release_report_stores, [report_hash] if report_hash else [])
+    return {
+        "success": True,
+        "message": f"Document {document_id} deleted",
+        "released_stores": list(released),
+        "reclaimed_bytes": sum(released.values()),
+    }
 
 
 @router.post(
     "/documents/embed",
     status_code=status.HTTP_200_OK,
     summary="벤치마킹 문서 임베딩 및 SK 18개 이슈 분석",
-    description="특정 벤치마킹 문서의 임베딩 처리 및 SK 18개 이슈 기반 분석을 시작합니다.",
+    description="""
+    특정 벤치마킹 문서의 임베딩 처리 및 SK 18개 이슈 기반 분석을 수행합니다.
+
+    **주의:** 작업이 끝날 때까지 HTTP 요청이 열린 상태로 유지됩니다.
+    즉시 작업 ID를 받으려면 POST /jobs/documents/embed 후 /internal/v1/jobs/{job_id}로 조회하세요
+    """,
 )
 async def embed_benchmark_document(
     request: BenchmarkEmbedRequest,
@@ -800,9 +981,8 @@ async def embed_benchmark_document(
     logger.info(f"Starting embedding and analysis for benchmark document: {document_id} ({document_name})")
 
     try:
-        filepath = storage.get_file_path(document_id)
-
-        if not filepath or not os.path.exists(filepath):
+        job, _ = _submit_embed_document(request, storage)
+        if job is None:
             return {
                 "success": False,
                 "document_id": document_id,
@@ -810,34 +990,15 @@ async def embed_benchmark_document(
                 "message": f"파일을 찾을 수 없습니다: {document_id}"
             }
 
-        # Extract company name from document name (remove .pdf extension)
-        company_name = document_name.rsplit(".", 1)[0] if "." in document_name else document_name
-
-        # Perform SK 18 issues analysis
-        service = get_benchmark_service()
-        result = await service.analyze_company_issues(filepath, company_name)
-
-        # Calculate summary
-        yes_count = sum(1 for r in result.values() if r["coverage"] == "Yes")
-        partially_count = sum(1 for r in result.values() if r["coverage"] == "Partially")
-        no_count = sum(1 for r in result.values() if r["coverage"] == "No")
-
-        logger.info(f"Analysis completed for {company_name}: Yes={yes_count}, Partially={partially_count}, No={no_count}")
-
-        return {
-            "success": True,
-            "document_id": document_id,
-            "company_name": company_name,
-            "status": "embedded",
-            "message": f"Document {document_name} analyzed successfully",
-            "summary": {
-                "total_issues": 18,
-                "full_coverage": yes_count,
-                "partial_coverage": partially_count,
-                "no_coverage": no_count,
-                "coverage_rate": round((yes_count + partially_count * 0.5) / 18 * 100, 1),
+        job = await get_job_service().wait(job.job_id)
+        if job.status != JOB_STATUS_COMPLETED:
+            return {
+                "success": False,
+                "document_id": document_id,
+                "status": "error",
+                "message": job.error or f"작업 상태: {job.status}",
             }
-        }
+        return job.result
 
     except Exception as e:
         logger.error(f"Embedding/analysis error for {document_id}: {e}", exc_info=True)
@@ -850,6 +1011,36 @@ async def embed_benchmark_document(
         }
 
 
+@router.post(
+    "/documents/embed/stream",
+    summary="벤치마킹 문서 임베딩 및 SK 18개 이슈 분석 (스트리밍)",
+    description="""
+    `/documents/embed`와 같은 분석을 진행하며 단계별 이벤트를 NDJSON으로 전송합니다
+    (이벤트 형식은 `/upload-and-analyze/stream`과 동일).
+    """,
+)
+async def embed_benchmark_document_stream(
+    request: BenchmarkEmbedRequest,
+    storage: FileStorageService = Depends(get_file_storage_service),
+) -> StreamingResponse:
+    """벤치마킹 문서 임베딩 및 SK 18개 이슈 분석 (진행 이벤트 스트리밍)"""
+    filepath = storage.get_file_path(request.document_id)
+    if not filepath or not os.path.exists(filepath):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ESG-AI-BENCH-002", "message": f"파일을 찾을 수 없습니다: {request.document_id}"},
+        )
+
+    company_name = request.document_name.rsplit(".", 1)[0] if "." in request.document_name else request.document_name
+    get_benchmark_service().reuse_cached_analysis(company_name, storage.get_aliases(request.document_id))
+    logger.info(f"Streaming embedding and analysis for {request.document_id} ({company_name})")
+
+    return StreamingResponse(
+        _analysis_event_stream([{"company_name": company_name, "path": filepath}], max_concurrency=1),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post(
     "/cache/reload",
     status_code=status.HTTP_200_OK,
@@ -877,3 +1068,283 @@ async def reload_cache():
             "success": False,
             "message": f"캐시 리로드 중 오류: {str(e)}",
         }
+
+
+# ============ Background Job Endpoints ============
+# 장시간 분석을 HTTP 요청과 분리: 작업 ID를 즉시 반환하고 /internal/v1/jobs/{job_id}로 진행률 조회
+
+
+def _job_result(job: JobInfo) -> Dict[str, Any]:
+    """완료된 작업 결과를 기존 동기 API 응답 형식으로 변환"""
+    if job.status == JOB_STATUS_COMPLETED:
+        return job.result
+    return {
+        "success": False,
+        "job_id": job.job_id,
+        "message": job.error or f"작업 상태: {job.status}",
+    }
+
+
+def _submit_response(job: JobInfo, deduplicated: bool) -> JobSubmitResponse:
+    return JobSubmitResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        deduplicated=deduplicated,
+        message="동일한 작업이 이미 진행 중입니다" if deduplicated else "작업이 등록되었습니다",
+    )
+
+
+async def _save_analysis_uploads(
+    files: List[UploadFile],
+    storage: FileStorageService,
+) -> List[Dict[str, str]]:
+    """분석용 업로드 PDF 저장 (동일 내용 보고서는 기존 분석 결과 재사용)"""
+    service = get_benchmark_service()
+    saved = []
+    for file in files:
+        if not file.filename or not file.filename.lower().endswith(".pdf"):
+            continue
+        company_name = file.filename.rsplit(".", 1)[0]
+        doc_info = await storage.save_benchmark_file(file, company_name)
+        if doc_info.get("duplicate"):
+            # 동일 내용 보고서의 분석 결과를 재사용 → 분석이 캐시 히트로 즉시 완료
+            service.reuse_cached_analysis(company_name, doc_info["aliases"])
+        saved.append({"company_name": company_name, "path": doc_info["path"], "document_id": doc_info["id"]})
+    return saved
+
+
+async def _submit_upload_and_analyze(
+    files: List[UploadFile],
+    storage: FileStorageService,
+):
+    """업로드 파일 저장 후 분석 작업 제출 (같은 보고서 집합이면 진행 중 작업 재사용)"""
+    service = get_benchmark_service()
+    saved = await _save_analysis_uploads(files, storage)
+    if not saved:
+        return None, False
+
+    dedupe_key = ",".join(sorted(
+        f"{item['company_name']}:{service.get_report_hash(item['path'])}" for item in saved
+    ))
+    return get_job_service().submit(JOB_KIND_UPLOAD_AND_ANALYZE, {"files": saved}, dedupe_key=dedupe_key)
+
+
+def _submit_embed_document(
+    request: BenchmarkEmbedRequest,
+    storage: FileStorageService,
+):
+    """문서 임베딩/분석 작업 제출 (같은 보고서 해시면 진행 중 작업 재사용)"""
+    filepath = storage.get_file_path(request.document_id)
+    if not filepath or not os.path.exists(filepath):
+        return None, False
+
+    company_name = request.document_name.rsplit(".", 1)[0] if "." in request.document_name else request.document_name
+    service = get_benchmark_service()
+    service.reuse_cached_analysis(company_name, storage.get_aliases(request.document_id))
+    report_hash = service.get_report_hash(filepath)
+    return get_job_service().submit(
+        JOB_KIND_EMBED_DOCUMENT,
+        {
+            "document_id": request.document_id,
+            "document_name": request.document_name,
+            "company_name": company_name,
+            "path": filepath,
+        },
+        dedupe_key=f"{company_name}:{report_hash}",
+    )
+
+
+@router.post(
+    "/jobs/reanalyze-all",
+    response_model=JobSubmitResponse,
+    summary="전체 회사 재분석 작업 등록",
+    description="""
+    전체 재분석을 백그라운드 작업으로 등록하고 작업 ID를 즉시 반환합니다.
+
+    - 진행 중인 재분석이 있으면 해당 작업 ID를 반환합니다 (deduplicated=true)
+    - 회사 단위 체크포인트가 저장되어 서버 재시작 후 이어서 진행합니다
+    - 진행률 조회/취소: `/internal/v1/jobs/{job_id}`
+    """,
+)
+async def submit_reanalyze_all_job() -> JobSubmitResponse:
+    """전체 재분석 작업 등록"""
+    job, deduplicated = get_job_service().submit(JOB_KIND_REANALYZE_ALL, dedupe_key="all")
+    return _submit_response(job, deduplicated)
+
+
+@router.post(
+    "/jobs/upload-and-analyze",
+    response_model=JobSubmitResponse,
+    summary="PDF 업로드 및 분석 작업 등록",
+    description="PDF를 저장한 뒤 SK 18개 이슈 분석을 백그라운드 작업으로 등록합니다.",
+)
+async def submit_upload_and_analyze_job(
+    files: List[UploadFile] = File(..., description="PDF 파일들"),
+    storage: FileStorageService = Depends(get_file_storage_service),
+) -> JobSubmitResponse:
+    """업로드 후 분석 작업 등록"""
+    job, deduplicated = await _submit_upload_and_analyze(files, storage)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "ESG-AI-BENCH-005", "message": "유효한 PDF 파일이 없습니다"},
+        )
+    return _submit_response(job, deduplicated)
+
+
+@router.post(
+    "/jobs/documents/embed",
+    response_model=JobSubmitResponse,
+    summary="문서 임베딩 및 분석 작업 등록",
+    description="벤치마킹 문서의 임베딩 및 SK 18개 이슈 분석을 백그라운드 작업으로 등록합니다.",
+)
+async def submit_embed_document_job(
+    request: BenchmarkEmbedRequest,
+    storage: FileStorageService = Depends(get_file_storage_service),
+) -> JobSubmitResponse:
+    """문서 임베딩/분석 작업 등록"""
+    job, deduplicated = _submit_embed_document(request, storage)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ESG-AI-BENCH-002", "message": f"파일을 찾을 수 없습니다: {request.document_id}"},
+        )
+    return _submit_response(job, deduplicated)
+
+
+@router.post(
+    "/jobs/index/migrate",
+    response_model=JobSubmitResponse,
+    summary="통합 벤치마킹 인덱스 마이그레이션 작업 등록",
+    description=(
+        "보고서별 벡터 스토어를 회사/연도/보고서/페이지 메타데이터가 있는 단일 컬렉션으로 복사합니다. "
+        "인덱스와 임베딩 provider가 다른 스토어(분석 시 인덱스 등록을 건너뛴 보고서)는 이 작업에서 재임베딩합니다."
+    ),
+)
+async def submit_migrate_index_job() -> JobSubmitResponse:
+    """통합 인덱스 마이그레이션 작업 등록"""
+    job, deduplicated = get_job_service().submit(JOB_KIND_MIGRATE_INDEX, dedupe_key="all")
+    return _submit_response(job, deduplicated)
+
+
+@router.post(
+    "/jobs/uploads/dedupe",
+    response_model=JobSubmitResponse,
+    summary="기존 중복 업로드 정리 작업 등록",
+    description="""
+    내용 해시 인덱스에 등록되지 않은 기존 벤치마킹 PDF를 등록하고 같은 내용의 사본을 삭제합니다.
+
+    - 가장 오래된 사본을 유지하고, 삭제된 사본의 문서 ID는 별칭으로 남습니다
+    - dry_run=true: 삭제 없이 대상 목록과 회수 가능한 용량만 보고
+    """,
+)
+async def submit_dedupe_uploads_job(dry_run: bool = False) -> JobSubmitResponse:
+    """중복 업로드 정리 작업 등록"""
+    job, deduplicated = get_job_service().submit(
+        JOB_KIND_DEDUPE_UPLOADS, {"dry_run": dry_run}, dedupe_key="dry_run" if dry_run else "dedupe"
+    )
+    return _submit_response(job, deduplicated)
+
+
+@router.post(
+    "/vector-stores/gc",
+    summary="벡터 스토어 GC 실행",
+    description="""
+    업로드 PDF가 참조하지 않는 보고서 벡터 스토어를 삭제하고 남은 스토어를 압축합니다.
+
+    - dry_run=true: 삭제/압축 없이 회수 가능한 용량만 보고
+    - 진행 중인 수집 작업의 스토어와 최근 수정된 스토어는 건너뜁니다
+    - BATCH_SCHEDULER_ENABLED=true인 프로세스에서는 매일 VECTOR_STORE_GC_CRON_HOUR시에 배치 스케줄러로도 실행됩니다
+    - 작업이 끝날 때까지 HTTP 요청이 열린 상태로 유지됩니다.
+      즉시 작업 ID를 받으려면 POST /jobs/vector-stores/gc 후 /internal/v1/jobs/{job_id}로 조회하세요
+    """,
+)
+async def run_vector_store_gc(dry_run: bool = False):
+    """벡터 스토어 GC (작업 완료까지 대기, 회수 바이트 보고)"""
+    job_service = get_job_service()
+    job, _ = submit_gc(dry_run)
+    job = await job_service.wait(job.job_id)
+    return _job_result(job)
+
+
+@router.post(
+    "/jobs/vector-stores/gc",
+    response_model=JobSubmitResponse,
+    summary="벡터 스토어 GC 작업 등록",
+    description="벡터 스토어 GC를 백그라운드 작업으로 등록합니다. 결과: `/internal/v1/jobs/{job_id}`",
+)
+async def submit_vector_store_gc_job(dry_run: bool = False) -> JobSubmitResponse:
+    """벡터 스토어 GC 작업 등록"""
+    job, deduplicated = submit_gc(dry_run)
+    return _submit_response(job, deduplicated)
+
+
+# ============ Consolidated Index Endpoints ============
+# 모든 보고서 청크를 하나의 컬렉션에 두고 회사/연도 필터로 한 번에 검색
+
+
+class BenchmarkSearchRequest(BaseModel):
+    """Request for cross-company search"""
+    query: str
+    companies: Optional[List[str]] = None
+    year: Optional[int] = None
+    k_per_company: int = 5
+
+
+@router.get(
+    "/index",
+    summary="통합 벤치마킹 인덱스 보고서 목록",
+    description="통합 인덱스에 등록된 보고서(회사, 연도, 청크 수)를 조회합니다.",
+)
+async def get_index_reports():
+    """통합 인덱스 보고서 목록"""
+    index = get_benchmark_index()
+    reports = index.list_reports()
+    return {
+        "success": True,
+        "provider": index.provider,
+        "reports": reports,
+        "count": len(reports),
+    }
+
+
+@router.post(
+    "/search",
+    summary="회사 간 통합 검색",
+    description="""
+    전체 회사 또는 지정한 회사/연도에 대해 회사별로 필터링한 벡터 검색을 수행해
+    회사마다 최대 k_per_company개의 결과를 반환합니다 (질의 임베딩은 한 번).
+    """,
+)
+async def search_index(request: BenchmarkSearchRequest):
+    """통합 인덱스 검색 (회사별 그룹화)"""
+    try:
+        grouped = await asyncio.to_thread(
+            get_benchmark_index().search_grouped,
+            request.query,
+            request.k_per_company,
+            request.companies,
+            request.year,
+        )
+    except Exception as e:
+        logger.error(f"Benchmark index search error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"code": "ESG-AI-BENCH-006", "message": "통합 검색 중 오류가 발생했습니다", "details": str(e)},
+        )
+
+    results = {
+        company: [
+            {
+                "page": doc.metadata.get("page"),
+                "year": doc.metadata.get("year"),
+                "report_hash": doc.metadata.get("report_hash"),
+                "distance": score,
+                "content": doc.page_content,
+            }
+            for doc, score in hits
+        ]
+        for company, hits in grouped.items()
+    }
+    return {"success": True, "query": request.query, "results": results}
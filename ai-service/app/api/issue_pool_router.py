@@ -6,14 +6,13 @@ Endpoints for ESG issue pool generation and topic scoring.
 IMPORTANT: These are internal APIs called only by Spring Boot, not by the frontend.
 """
 
-import os
-from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, UploadFile, status
 from pydantic import BaseModel
 
 from app.core.logging import get_logger
+from app.infra.file_storage import FileStorageService, get_file_storage_service
 from app.schemas.common_schema import APIResponse
 from app.schemas.issue_pool_schema import (
     GenerateIssuePoolRequest,
@@ -21,6 +20,7 @@ from app.schemas.issue_pool_schema import (
     ScoreTopicRequest,
     ScoreTopicResponse,
 )
+from app.services.ingestion_jobs import COLLECTION_BENCHMARK, submit_ingestion
 from app.services.issue_pool_service import IssuePoolService
 
 logger = get_logger(__name__)
@@ -31,20 +31,6 @@ router = APIRouter(
     tags=["이슈풀 생성"],
 )
 
-# Upload directories
-STANDARDS_UPLOAD_FOLDER = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-    "data",
-    "esg_uploads",
-)
-BENCHMARK_UPLOAD_FOLDER = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-    "data",
-    "benchmark_uploads",
-)
-os.makedirs(STANDARDS_UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(BENCHMARK_UPLOAD_FOLDER, exist_ok=True)
-
 
 # ============ Document Upload Schemas ============
 
@@ -55,6 +41,7 @@ class UploadedDocumentInfo(BaseModel):
     size: int
     uploadedAt: str
     status: str
+    jobId: Optional[str] = None
 
 
 class DocumentUploadResponse(BaseModel):
@@ -209,6 +196,7 @@ async def health_check() -> dict:
 )
 async def upload_standards_documents(
     files: List[UploadFile] = File(..., description="PDF 파일들"),
+    storage: FileStorageService = Depends(get_file_storage_service),
 ) -> DocumentUploadResponse:
     """
     표준 문서 업로드 API (ISS-001)
@@ -227,28 +215,17 @@ async def upload_standards_documents(
             logger.warning(f"Skipping non-PDF file: {file.filename}")
             continue
 
-        # Generate unique ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        doc_id = f"std_{timestamp}_{file.filename.rsplit('.', 1)[0]}"
-        filename = f"{doc_id}.pdf"
-        filepath = os.path.join(STANDARDS_UPLOAD_FOLDER, filename)
-
-        # Read and save file
-        content = await file.read()
-        file_size = len(content)
-
-        with open(filepath, "wb") as buffer:
-            buffer.write(content)
+        doc_info = await storage.save_esg_file(file, prefix="std")
 
         uploaded_docs.append(UploadedDocumentInfo(
-            id=doc_id,
-            name=file.filename,
-            size=file_size,
-            uploadedAt=datetime.now().isoformat(),
-            status="pending"
+            id=doc_info["id"],
+            name=doc_info["name"],
+            size=doc_info["size"],
+            uploadedAt=doc_info["uploadedAt"],
+            status=doc_info["status"],
         ))
 
-        logger.info(f"Uploaded standards document: {file.filename} -> {filepath}")
+        logger.info(f"Uploaded standards document: {file.filename} -> {doc_info['path']}")
 
     if not uploaded_docs:
         return DocumentUploadResponse(
@@ -277,10 +254,14 @@ async def upload_standards_documents(
     **지원 형식:** PDF
     **파일명 규칙:** 파일명에서 회사명을 추출합니다 (예: 삼성전자_2023.pdf → 삼성전자)
     **용도:** 이슈풀 생성 시 벤치마킹 기반 이슈 도출에 사용
+
+    업로드 후 페이지 추출/청크/임베딩이 백그라운드로 진행되어, 첫 분석 요청은
+    바로 검색/LLM 단계부터 시작합니다 (진행률: `/internal/v1/jobs/{jobId}`).
     """,
 )
 async def upload_benchmark_documents(
     files: List[UploadFile] = File(..., description="PDF 파일들"),
+    storage: FileStorageService = Depends(get_file_storage_service),
 ) -> DocumentUploadResponse:
     """
     벤치마킹 문서 업로드 API (ISS-002)
@@ -299,29 +280,23 @@ async def upload_benchmark_documents(
             logger.warning(f"Skipping non-PDF file: {file.filename}")
             continue
 
-        # Generate unique ID (extract company name from filename)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 파일명에서 회사명 추출
         company_name = file.filename.rsplit(".", 1)[0]
-        doc_id = f"bench_{timestamp}_{company_name}"
-        filename = f"{doc_id}.pdf"
-        filepath = os.path.join(BENCHMARK_UPLOAD_FOLDER, filename)
-
-        # Read and save file
-        content = await file.read()
-        file_size = len(content)
-
-        with open(filepath, "wb") as buffer:
-            buffer.write(content)
+        doc_info = await storage.save_benchmark_file(file, company_name)
+        job, doc_status = submit_ingestion(
+            doc_info["id"], doc_info["path"], COLLECTION_BENCHMARK, company_name
+        )
 
         uploaded_docs.append(UploadedDocumentInfo(
-            id=doc_id,
-            name=file.filename,
-            size=file_size,
-            uploadedAt=datetime.now().isoformat(),
-            status="pending"
+            id=doc_info["id"],
+            name=doc_info["name"],
+            size=doc_info["size"],
+            uploadedAt=doc_info["uploadedAt"],
+            status=doc_status,
+            jobId=job.job_id if job else None,
         ))
 
-        logger.info(f"Uploaded benchmark document: {file.filename} -> {filepath}")
+        logger.info(f"Uploaded benchmark document: {file.filename} -> {doc_info['path']}")
 
     if not uploaded_docs:
         return DocumentUploadResponse(
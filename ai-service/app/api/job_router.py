@@ -0,0 +1,71 @@
+"""
+Background Job Router - 백그라운드 작업 조회/취소 API
+
+장시간 작업(벤치마킹 재분석, 업로드 후 분석 등)의 진행률 조회 및 취소
+내부 전용 API (Spring Boot → FastAPI)
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status
+
+from app.core.logging import get_logger
+from app.schemas.job_schema import JobInfo, JobListResponse
+from app.services.job_service import get_job_service
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/internal/v1/jobs",
+    tags=["백그라운드 작업"],
+)
+
+
+@router.get(
+    "",
+    response_model=JobListResponse,
+    summary="작업 목록 조회",
+    description="등록된 백그라운드 작업 목록을 최신순으로 조회합니다.",
+)
+async def list_jobs(
+    kind: Optional[str] = None,
+    job_status: Optional[str] = None,
+) -> JobListResponse:
+    """작업 목록 조회"""
+    jobs = get_job_service().list_jobs(kind=kind, status=job_status)
+    return JobListResponse(jobs=jobs, count=len(jobs))
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobInfo,
+    summary="작업 상태 조회",
+    description="작업 상태, 단계별 진행률, 체크포인트 및 결과를 조회합니다.",
+)
+async def get_job(job_id: str) -> JobInfo:
+    """작업 상태 조회"""
+    job = get_job_service().get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ESG-AI-JOB-001", "message": f"작업을 찾을 수 없습니다: {job_id}"},
+        )
+    return job
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobInfo,
+    summary="작업 취소",
+    description="대기 중이거나 실행 중인 작업을 취소합니다.",
+)
+async def cancel_job(job_id: str) -> JobInfo:
+    """작업 취소"""
+    job = get_job_service().cancel(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ESG-AI-JOB-001", "message": f"작업을 찾을 수 없습니다: {job_id}"},
+        )
+    logger.info(f"Cancel requested for job {job_id} (status={job.status})")
+    return job
@@ -4,17 +4,26 @@ Report Assistant Router - ESG 보고서 생성 API
 내부 전용 API (Spring Boot → FastAPI)
 """
 
+import json
+from typing import Any, Dict, Optional
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
+from app.core.exceptions import NotFoundException
 from app.core.logging import get_logger
+from app.repositories.report_document_repository import get_report_document_repository
 from app.schemas.common_schema import APIResponse
+from app.schemas.job_schema import JobSubmitResponse
 from app.schemas.report_schema import (
+    ReportBatchRequest,
     ReportGenerationRequest,
     ReportGenerationResponse,
     ReportModifyRequest,
     ReportModifyResponse,
 )
 from app.services.report_assistant_service import get_report_assistant_service
+from app.services.report_batch_jobs import submit_report_batch
 
 logger = get_logger(__name__)
 
@@ -89,6 +98,123 @@ async def generate_report(
         )
 
 
+@router.post(
+    "/generate/stream",
+    summary="ESG 보고서 생성 (스트리밍)",
+    description="""
+    `/generate`와 같은 보고서를 생성하되, 섹션이 완성되는 즉시 NDJSON으로 전송합니다.
+
+    **이벤트 형식 (한 줄에 JSON 하나):**
+    - `{"type": "start", "sections": [{"issue_id", "issue_name", "materiality_type", "priority_rank"}]}`
+    - `{"type": "delta", "issue_id", "materiality_type", "priority_rank", "text"}` - stream_tokens=true일 때 섹션 HTML 토큰
+    - `{"type": "section", "section": SectionData, "timing": {...}}` - 섹션 완료 즉시 (완료 순서)
+    - `{"type": "done", "report": ReportGenerationResponse}` - 통합 HTML + 메타데이터
+    - `{"type": "error", "code", "message", "details"}` - 생성 실패 시 마지막 이벤트
+    """,
+)
+async def generate_report_stream(
+    request: ReportGenerationRequest,
+    stream_tokens: bool = False,
+):
+    """
+    ESG 보고서 스트리밍 생성
+
+    Args:
+        request: 보고서 생성 요청 (이슈 목록, KPI 데이터 포함)
+        stream_tokens: 섹션 HTML을 토큰 단위로도 전송할지 여부
+    """
+    logger.info(
+        f"Received streaming report generation request for company: "
+        f"{request.company_context.company_id}",
+        extra={
+            "company_id": request.company_context.company_id,
+            "year": request.company_context.year,
+            "issue_count": len(request.issues),
+        },
+    )
+    service = get_report_assistant_service()
+
+    async def event_stream():
+        try:
+            async for event in service.iter_report_events(request, stream_tokens=stream_tokens):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logger.error(f"Unexpected error in streaming report generation: {str(e)}", exc_info=True)
+            yield json.dumps({
+                "type": "error",
+                "code": "ESG-AI-RPT-001",
+                "message": "보고서 생성 중 오류가 발생했습니다",
+                "details": str(e),
+            }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/generate/batch",
+    response_model=JobSubmitResponse,
+    summary="ESG 보고서 일괄 생성 (백그라운드 작업)",
+    description="""
+    여러 회사의 보고서 초안을 백그라운드 작업 하나로 생성합니다.
+
+    - 모든 회사의 섹션이 하나의 동시 생성 슬롯과 호출 속도 상한을 공유
+    - 입력이 같은 섹션은 섹션 캐시에서 재사용
+    - 초안이 완성될 때마다 보고서 저장소에 기록 (`/drafts`로 조회)
+    - 진행률/결과(회사별 report_id, sections/min): `/internal/v1/jobs/{job_id}`
+    """,
+)
+async def generate_report_batch(request: ReportBatchRequest) -> JobSubmitResponse:
+    """보고서 일괄 생성 작업 등록"""
+    logger.info(f"Received batch report generation request: {len(request.requests)} companies")
+    job, deduplicated = submit_report_batch(
+        request.requests,
+        concurrency=request.concurrency,
+        sections_per_minute=request.sections_per_minute,
+    )
+    return JobSubmitResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        deduplicated=deduplicated,
+        message="동일한 작업이 이미 진행 중입니다" if deduplicated else "작업이 등록되었습니다",
+    )
+
+
+@router.get(
+    "/drafts",
+    summary="저장된 보고서 초안 목록",
+    description="보고서 저장소의 초안 메타데이터를 최신순으로 조회합니다 (`next_cursor`로 다음 페이지).",
+)
+async def list_report_drafts(
+    company_id: Optional[str] = None,
+    year: Optional[int] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """저장된 보고서 초안 목록 (페이지 단위)"""
+    return await get_report_document_repository().list_reports_page(
+        company_id=company_id, year=year, limit=max(1, min(limit, 500)), cursor=cursor
+    )
+
+
+@router.get(
+    "/drafts/{report_id}",
+    summary="저장된 보고서 초안 조회",
+    description="보고서 초안 JSON을 압축 해제하며 스트리밍으로 전송합니다.",
+)
+async def get_report_draft(report_id: str):
+    """저장된 보고서 초안 본문 (스트리밍)"""
+    store = get_report_document_repository()
+    try:
+        await store.get_report_metadata(report_id)
+    except NotFoundException:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ESG-AI-RPT-003", "message": f"보고서를 찾을 수 없습니다: {report_id}"},
+        )
+    return StreamingResponse(store.iter_report_bytes(report_id), media_type="application/json")
+
+
 @router.post(
     "/modify",
     response_model=ReportModifyResponse,
@@ -96,6 +222,9 @@ async def generate_report(
     description="""
     자연어 명령으로 보고서를 수정합니다.
 
+    생성 보고서 HTML은 지시가 가리키는 섹션(이슈명/제목, 임베딩 유사도 또는 `section_ids`)만
+    LLM에 보내고 원래 위치에 다시 끼워 넣습니다. 응답의 `token_usage`에 전체 전송 대비 절감 토큰을 표시합니다.
+
     **예시 명령어:**
     - "ESG Letter를 더 전문적인 어조로 수정해줘"
     - "환경 섹션에 탄소배출 저감 목표를 2030년 50% 감축으로 수정해줘"
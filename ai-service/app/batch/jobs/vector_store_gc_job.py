@@ -0,0 +1,17 @@
+"""Vector store garbage collection batch job."""
+from app.core.logging import get_logger
+from app.services.vector_store_gc import submit_gc
+
+logger = get_logger(__name__)
+
+
+async def run_vector_store_gc_job() -> None:
+    """Submit the vector store GC as a background job.
+
+    This job:
+    1. Removes report vector stores no uploaded PDF references
+    2. Compacts the remaining stores
+    3. Records reclaimed bytes in the job result (/internal/v1/jobs/{job_id})
+    """
+    job, deduplicated = submit_gc()
+    logger.info(f"Vector store GC job {'already running' if deduplicated else 'submitted'}: {job.job_id}")
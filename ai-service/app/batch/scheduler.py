@@ -1,10 +1,19 @@
-"""Batch job scheduler."""
+"""Batch job scheduler.
+
+The scheduler runs inside the API process, so every uvicorn/gunicorn worker
+starts its own copy and each scheduled job fires once per worker. It is off by
+default (BATCH_SCHEDULER_ENABLED=false); with more than one worker, enable it on
+a single process only so the vector store GC does not run concurrently against
+the same data directory.
+"""
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app.config.config import settings
 from app.core.logging import get_logger
 from app.batch.jobs.news_ingest_job import run_news_ingest_job
 from app.batch.jobs.embedding_refresh_job import run_embedding_refresh_job
+from app.batch.jobs.vector_store_gc_job import run_vector_store_gc_job
 
 logger = get_logger(__name__)
 
@@ -13,26 +22,38 @@ scheduler = AsyncIOScheduler()
 
 def setup_scheduler() -> None:
     """Configure and start the job scheduler."""
-    # News ingestion: Run every 6 hours
-    scheduler.add_job(
-        run_news_ingest_job,
-        CronTrigger(hour="*/6"),
-        id="news_ingest",
-        name="News Ingestion Job",
-        replace_existing=True,
-    )
-
-    # Embedding refresh: Run daily at 2 AM
-    scheduler.add_job(
-        run_embedding_refresh_job,
-        CronTrigger(hour=2, minute=0),
-        id="embedding_refresh",
-        name="Embedding Refresh Job",
-        replace_existing=True,
-    )
+    # News ingestion / embedding refresh are not implemented yet (TODO stubs)
+    if settings.BATCH_PLACEHOLDER_JOBS_ENABLED:
+        # News ingestion: Run every 6 hours
+        scheduler.add_job(
+            run_news_ingest_job,
+            CronTrigger(hour="*/6"),
+            id="news_ingest",
+            name="News Ingestion Job",
+            replace_existing=True,
+        )
+
+        # Embedding refresh: Run daily at 2 AM
+        scheduler.add_job(
+            run_embedding_refresh_job,
+            CronTrigger(hour=2, minute=0),
+            id="embedding_refresh",
+            name="Embedding Refresh Job",
+            replace_existing=True,
+        )
+
+    # Vector store GC: Run daily (VECTOR_STORE_GC_CRON_HOUR)
+    if settings.VECTOR_STORE_GC_CRON_HOUR is not None:
+        scheduler.add_job(
+            run_vector_store_gc_job,
+            CronTrigger(hour=settings.VECTOR_STORE_GC_CRON_HOUR, minute=30),
+            id="vector_store_gc",
+            name="Vector Store GC Job",
+            replace_existing=True,
+        )
 
     scheduler.start()
-    logger.info("Batch scheduler started")
+    logger.info(f"Batch scheduler started: jobs={[job.id for job in scheduler.get_jobs()]}")
 
 
 def shutdown_scheduler() -> None:
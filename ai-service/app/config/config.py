@@ -1,7 +1,7 @@
 """
 Application configuration using Pydantic Settings
 """
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -76,6 +76,22 @@ class Settings(BaseSettings):
     MAX_RETRIES: int = 3
     RETRY_BACKOFF_FACTOR: int = 2
 
+    # LLM Gateway Settings (모든 OpenAI 호출 공통)
+    LLM_MAX_CONCURRENCY: int = 16  # 전체 동시 LLM/임베딩 요청 수
+    LLM_DEFAULT_MODEL_CONCURRENCY: int = 8  # 모델별 동시 요청 수 기본값
+    LLM_MODEL_CONCURRENCY: Dict[str, int] = {}  # 모델별 동시 요청 수 (예: {"gpt-4o": 4})
+    LLM_POOL_MAX_CONNECTIONS: int = 32
+    LLM_TIMEOUT_SEC: float = 120.0
+    LLM_RETRY_MAX_WAIT_SEC: float = 30.0  # 재시도 대기 상한 (retry-after 포함)
+    LLM_COALESCE_ENABLED: bool = True  # 동시에 들어온 동일 채팅/임베딩 요청을 업스트림 호출 1회로 합침
+    LLM_PROXY_MODE: str = "off"  # off | record (응답 녹화) | replay (녹화 응답 재생, 네트워크 없이 동작)
+    LLM_RECORDING_FILE: str = "data/llm_recordings.sqlite3"
+    LLM_REPLAY_LATENCY: str = "recorded"  # recorded | distribution | fixed | none
+    LLM_REPLAY_FIXED_LATENCY_MS: float = 500.0  # fixed 모드 지연, 녹화 표본이 없을 때 기본값
+    LLM_REPLAY_LATENCY_SCALE: float = 1.0  # 재생 지연 배율
+    LLM_REPLAY_ON_MISS: str = "stub"  # 녹화 없는 채팅 요청: stub (대체 응답) | error (404). 임베딩은 항상 결정적 가짜 벡터
+    LLM_REPLAY_EMBEDDING_DIM: int = 1536  # 알 수 없는 임베딩 모델의 가짜 벡터 차원
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
@@ -85,7 +101,71 @@ class Settings(BaseSettings):
     BENCHMARK_UPLOADS_DIR: str = "data/benchmark_uploads"
     BENCHMARK_VECTORS_DIR: str = "data/benchmark_vectors"
     BENCHMARK_CACHE_FILE: str = "data/benchmark_cache.json"
+    BENCHMARK_INDEX_DIR: str = "data/benchmark_index"
+    BENCHMARK_INDEX_COLLECTION: str = "benchmark_reports"
+    BENCHMARK_PAGES_DIR: str = "data/benchmark_pages"
     ESG_UPLOADS_DIR: str = "data/esg_uploads"
+    CHUNK_EMBEDDING_STORE_FILE: str = "data/chunk_embeddings.sqlite3"
+
+    # Benchmark Analysis Settings
+    BENCHMARK_MAX_CONCURRENCY: int = 4
+    BENCHMARK_COMPANY_TIMEOUT_SEC: float = 180.0
+    BENCHMARK_WORKER_THREADS: int = 8  # 벤치마킹 블로킹 작업 전용 스레드 수 (시간 초과 작업이 기본 스레드 풀을 점유하지 않도록)
+    BENCHMARK_EVIDENCE_TOKEN_BUDGET: int = 6000  # RetrievalQA 프롬프트에 넣을 근거 토큰 상한
+    BENCHMARK_EVIDENCE_MMR_LAMBDA: float = 0.7
+    BENCHMARK_EVIDENCE_DEDUP_THRESHOLD: float = 0.85
+    BENCHMARK_MATRIX_EVIDENCE_PER_CELL: int = 3
+    BENCHMARK_MATRIX_CELLS_PER_CALL: int = 60
+    BENCHMARK_EMBEDDING_PROVIDER: str = "openai"  # openai | bge-m3 (로컬)
+    BENCHMARK_CHUNK_REUSE: bool = True  # 청크 해시가 같으면 보고서 간 임베딩 재사용
+    BENCHMARK_PAGE_CACHE_SIZE: int = 32  # 메모리에 유지할 보고서 페이지 텍스트 수 (나머지는 디스크 캐시)
+    BENCHMARK_KEYWORD_INDEX_CACHE_SIZE: int = 32  # 메모리에 유지할 보고서 키워드 역색인 수
+    LOCAL_EMBEDDING_BATCH_SIZE: int = 32
+    LOCAL_EMBEDDING_DEVICE: Optional[str] = None  # None이면 자동 선택 (cuda 없으면 cpu)
+
+    # Vector Store Pool Settings (열린 벤치마킹 Chroma 스토어 재사용)
+    VECTOR_STORE_POOL_MAX_STORES: int = 16
+    VECTOR_STORE_POOL_MEMORY_MB: int = 1024
+    VECTOR_STORE_POOL_IDLE_SEC: float = 900.0  # 0이면 유휴 제거 안 함
+
+    # PDF Extraction Settings (app/utils/pdf_extractor.py)
+    PDF_EXTRACT_ENGINE: str = "auto"  # auto (pypdf → 빈 페이지만 pdfplumber) | pypdf | pdfplumber
+    PDF_EXTRACT_WORKERS: Optional[int] = None  # None이면 CPU 수, 1이면 프로세스 풀 사용 안 함
+    PDF_EXTRACT_BATCH_PAGES: int = 8  # 워커 작업 단위의 최소 페이지 수
+    PDF_EXTRACT_PARALLEL_MIN_PAGES: int = 16  # 이보다 짧은 문서는 현재 프로세스에서 추출
+
+    # Vector Store GC Settings (app/services/vector_store_gc.py)
+    VECTOR_STORE_GC_MIN_AGE_SEC: float = 3600.0  # 최근 수정된 스토어는 생성 중일 수 있으므로 보존
+    VECTOR_STORE_GC_COMPACT: bool = True  # 남은 스토어 VACUUM + 고아 세그먼트 삭제
+    VECTOR_STORE_GC_MIN_FREE_PAGES: int = 64  # 여유 페이지가 이보다 적으면 VACUUM 생략
+    VECTOR_STORE_GC_CRON_HOUR: Optional[int] = 4  # 매일 실행 시각 (BATCH_SCHEDULER_ENABLED일 때만, None이면 스케줄 안 함)
+
+    # Report Generation Settings
+    REPORT_SECTION_CONCURRENCY: int = 5  # 동시에 생성할 보고서 섹션 수
+    REPORT_SECTION_CACHE_ENABLED: bool = True  # 입력이 같은 섹션은 캐시에서 재사용
+    REPORT_SECTION_CACHE_FILE: str = "data/report_section_cache.sqlite3"
+    REPORT_SECTION_CACHE_MAX_ENTRIES: int = 5000
+    REPORT_BATCH_CONCURRENCY: int = 8  # 일괄 생성 시 모든 회사가 공유하는 섹션 동시 생성 수
+    REPORT_BATCH_SECTIONS_PER_MIN: int = 0  # 일괄 생성 섹션 LLM 호출 속도 상한 (0이면 제한 없음)
+    REPORT_MODIFY_MAX_SECTIONS: int = 3  # 임베딩 유사도로 찾을 때 수정할 최대 섹션 수
+    REPORT_MODIFY_SIMILARITY_THRESHOLD: float = 0.3
+    PROMPT_RELOAD_CHECK_SEC: float = 5.0  # 프롬프트 파일 mtime 확인 간격 (0이면 핫 리로드 안 함)
+
+    # Report Document Store (app/repositories/report_document_repository.py)
+    REPORT_STORE_DIR: str = "storage/reports"
+    REPORT_STORE_CODEC: str = "auto"  # auto (zstd 설치 시 zstd, 없으면 gzip) | zstd | gzip
+    REPORT_STORE_COMPRESSION_LEVEL: int = 6
+
+    # Batch Scheduler
+    # 스케줄러는 API 프로세스마다 실행되므로 기본은 꺼 둠 (워커가 여러 개면 한 프로세스에서만 켜세요)
+    BATCH_SCHEDULER_ENABLED: bool = False
+    BATCH_PLACEHOLDER_JOBS_ENABLED: bool = False  # 미구현 news_ingest/embedding_refresh 작업 등록 여부
+
+    # Background Job Settings
+    JOBS_DIR: str = "data/jobs"
+    JOB_MAX_WORKERS: int = 2
+    JOB_HISTORY_LIMIT: int = 100
+    JOB_PERSIST_INTERVAL_SEC: float = 1.0  # 진행률/체크포인트 파일 저장 최소 간격
 
 
 settings = Settings()
@@ -0,0 +1,330 @@
+"""
+Benchmark Index Infrastructure Adapter
+
+모든 벤치마킹 보고서 청크를 하나의 Chroma 컬렉션에 저장하는 멀티테넌트 인덱스
+- 청크 메타데이터: company, year, report_hash, page
+- 전체 회사 또는 일부 회사/연도/보고서로 필터링한 단일 ANN 검색
+- 회사별 그룹 검색 (회사 필터 단일 ANN 검색을 넉넉히 가져와 회사당 상위 k개로 자르고,
+  결과가 없는 회사만 회사별 검색으로 보충)
+- 기존 보고서별 스토어(data/benchmark_vectors/<hash>)에서 벡터 복사로 마이그레이션
+  (같은 임베딩 모델이면 재임베딩 없이 복사)
+
+보고서별 스토어는 그대로 유지되며 단일 보고서 분석(페이지 필터 검색, 스토어 풀)의
+읽기 경로입니다. 이 인덱스는 회사 간 검색(커버리지 매트릭스, 그룹 검색)용 사본이므로
+청크가 두 곳에 저장되고, 보고서 삭제/GC는 두 저장소를 함께 정리합니다.
+"""
+
+import json
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.llm.clients.embedding_provider import get_embeddings, provider_id
+
+logger = get_logger(__name__)
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+BENCHMARK_INDEX_DIR = _BASE_DIR / settings.BENCHMARK_INDEX_DIR
+
+REGISTRY_FILE = "reports.json"
+_UPSERT_BATCH_SIZE = 1000
+_GROUP_OVERSAMPLE = 4  # 그룹 검색 시 (회사 수 × k) 대비 추가로 가져올 배수
+
+_TIMESTAMP_PATTERN = re.compile(r"\d{8}_\d{6}")
+_YEAR_PATTERN = re.compile(r"(?<!\d)(20\d{2})(?!\d)")
+
+
+def parse_report_year(name: str) -> Optional[int]:
+    """파일명/회사명에서 보고서 연도 추출 (업로드 타임스탬프는 제외)"""
+    match = _YEAR_PATTERN.search(_TIMESTAMP_PATTERN.sub("", name))
+    return int(match.group(1)) if match else None
+
+
+def build_where(
+    companies: Optional[List[str]] = None,
+    report_hashes: Optional[List[str]] = None,
+    year: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Chroma 메타데이터 필터 생성"""
+    conditions: List[Dict[str, Any]] = []
+    if companies:
+        conditions.append({"company": {"$in": list(companies)}})
+    if report_hashes:
+        conditions.append({"report_hash": {"$in": list(report_hashes)}})
+    if year is not None:
+        conditions.append({"year": year})
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+class BenchmarkIndex:
+    """Consolidated multi-tenant Chroma collection for benchmark reports."""
+
+    def __init__(self, index_dir: Path = BENCHMARK_INDEX_DIR):
+        self.index_dir = index_dir
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._registry = self._load_registry()
+        # 컬렉션은 하나의 임베딩 공간만 가질 수 있으므로 최초 생성 시 provider 고정
+        self.provider = self._registry.setdefault("provider", provider_id())
+        self._reports: Dict[str, Dict[str, Any]] = self._registry.setdefault("reports", {})
+        self._store = Chroma(
+            collection_name=settings.BENCHMARK_INDEX_COLLECTION,
+            persist_directory=str(self.index_dir),
+            embedding_function=get_embeddings(self.provider),
+        )
+        self._save_registry()
+        logger.info(f"BenchmarkIndex initialized: {len(self._reports)} reports, embeddings={self.provider}")
+
+    # =========================================================================
+    # 레지스트리 (보고서 해시 → 회사/연도/청크 수)
+    # =========================================================================
+
+    def _load_registry(self) -> Dict[str, Any]:
+        registry_path = self.index_dir / REGISTRY_FILE
+        if registry_path.exists():
+            try:
+                with open(registry_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to load benchmark index registry: {e}")
+        return {}
+
+    def _save_registry(self) -> None:
+        registry_path = self.index_dir / REGISTRY_FILE
+        tmp_path = registry_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._registry, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(registry_path)
+
+    def has_report(self, report_hash: str) -> bool:
+        return report_hash in self._reports
+
+    def list_reports(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self._reports)
+
+    def report_hashes_for(self, companies: List[str]) -> List[str]:
+        """회사명 목록 → 인덱스에 등록된 보고서 해시"""
+        wanted = set(companies)
+        return [h for h, info in self._reports.items() if info["company"] in wanted]
+
+    # =========================================================================
+    # 등록
+    # =========================================================================
+
+    def _chunk_metadata(self, report_hash: str, company: str, year: Optional[int], page: int) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {"company": company, "report_hash": report_hash, "page": page}
+        if year is not None:
+            metadata["year"] = year
+        return metadata
+
+    def _upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        embeddings: Optional[List[List[float]]] = None,
+    ) -> None:
+        if embeddings is None:
+            embeddings = get_embeddings(self.provider).embed_documents(documents)
+        for start in range(0, len(ids), _UPSERT_BATCH_SIZE):
+            end = start + _UPSERT_BATCH_SIZE
+            self._store._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+            )
+
+    def _register(self, report_hash: str, company: str, year: Optional[int], chunks: int, source: str) -> None:
+        self._reports[report_hash] = {
+            "company": company,
+            "year": year,
+            "chunks": chunks,
+            "source": source,
+            "indexed_at": datetime.now().isoformat(),
+        }
+        self._save_registry()
+        logger.info(f"Indexed report {report_hash} ({company}, {year}): {chunks} chunks from {source}")
+
+    def add_chunks(
+        self,
+        report_hash: str,
+        company: str,
+        year: Optional[int],
+        chunks: List[Dict[str, Any]],
+    ) -> int:
+        """
+        보고서 청크 임베딩 후 등록
+
+        Args:
+            chunks: [{"text": str, "page": int}, ...]
+        """
+        with self._lock:
+            documents = [c["text"] for c in chunks]
+            metadatas = [self._chunk_metadata(report_hash, company, year, c["page"]) for c in chunks]
+            ids = [f"{report_hash}:{i}" for i in range(len(chunks))]
+            self._upsert(ids, documents, metadatas)
+            self._register(report_hash, company, year, len(chunks), "text")
+            return len(chunks)
+
+    def import_store(
+        self,
+        store: Chroma,
+        store_provider: str,
+        report_hash: str,
+        company: str,
+        year: Optional[int],
+    ) -> int:
+        """
+        보고서별 스토어의 청크를 인덱스로 복사
+
+        같은 임베딩 provider면 벡터를 그대로 복사하고, 다르면 인덱스 provider로 재임베딩합니다.
+        """
+        with self._lock:
+            if report_hash in self._reports:
+                return self._reports[report_hash]["chunks"]
+
+            same_space = store_provider == self.provider
+            include = ["documents", "metadatas"] + (["embeddings"] if same_space else [])
+            data = store._collection.get(include=include)
+            documents = data["documents"] or []
+            metadatas = [
+                self._chunk_metadata(report_hash, company, year, (meta or {}).get("page", 0))
+                for meta in (data["metadatas"] or [{}] * len(documents))
+            ]
+            ids = [f"{report_hash}:{i}" for i in range(len(documents))]
+            embeddings = [list(e) for e in data["embeddings"]] if same_space else None
+            if documents:
+                self._upsert(ids, documents, metadatas, embeddings)
+            self._register(
+                report_hash, company, year, len(documents),
+                "copy" if same_space else f"re-embedded from {store_provider}",
+            )
+            return len(documents)
+
+    def delete_report(self, report_hash: str) -> bool:
+        with self._lock:
+            if report_hash not in self._reports:
+                return False
+            self._store._collection.delete(where={"report_hash": report_hash})
+            del self._reports[report_hash]
+            self._save_registry()
+            return True
+
+    # =========================================================================
+    # 검색
+    # =========================================================================
+
+    def as_retriever(self, report_hash: str, k: int):
+        """단일 보고서로 필터링된 retriever"""
+        return self._store.as_retriever(search_kwargs={"k": k, "filter": {"report_hash": report_hash}})
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        companies: Optional[List[str]] = None,
+        report_hashes: Optional[List[str]] = None,
+        year: Optional[int] = None,
+    ) -> List[tuple[Document, float]]:
+        """전체 또는 필터링된 보고서 집합에 대한 단일 ANN 검색 (거리 오름차순)"""
+        where = build_where(companies, report_hashes, year)
+        return self._store.similarity_search_with_score(query, k=k, filter=where)
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """여러 질의를 인덱스 임베딩 모델로 한 번에 임베딩"""
+        return get_embeddings(self.provider).embed_documents(queries)
+
+    def search_by_vectors(
+        self,
+        embeddings: List[List[float]],
+        k: int = 10,
+        report_hashes: Optional[List[str]] = None,
+    ) -> List[List[tuple[Document, float]]]:
+        """미리 계산한 질의 벡터들로 한 번에 ANN 검색 (질의별 결과, 거리 오름차순)"""
+        if not embeddings:
+            return []
+        return self._query(embeddings, k, build_where(report_hashes=report_hashes))
+
+    def _query(
+        self,
+        embeddings: List[List[float]],
+        k: int,
+        where: Optional[Dict[str, Any]],
+    ) -> List[List[tuple[Document, float]]]:
+        results = self._store._collection.query(
+            query_embeddings=embeddings,
+            n_results=k,
+            where=where,
+            include=["documents", "metadatas", "distances"],
+        )
+        return [
+            [
+                (Document(page_content=doc, metadata=meta or {}), distance)
+                for doc, meta, distance in zip(docs, metas, distances)
+            ]
+            for docs, metas, distances in zip(
+                results["documents"], results["metadatas"], results["distances"]
+            )
+        ]
+
+    def search_grouped(
+        self,
+        query: str,
+        k_per_company: int = 5,
+        companies: Optional[List[str]] = None,
+        year: Optional[int] = None,
+    ) -> Dict[str, List[tuple[Document, float]]]:
+        """
+        회사별로 그룹화한 검색 결과
+
+        질의를 한 번 임베딩해 대상 회사 전체에 단일 ANN 검색을 하고(회사 수 × k의
+        _GROUP_OVERSAMPLE배), 회사당 k_per_company개로 자릅니다. 관련도가 높은 회사가
+        상위 결과를 독점해 결과가 없는 회사만 회사별 검색으로 보충합니다.
+        """
+        target = companies or sorted({info["company"] for info in self._reports.values()})
+        if not target:
+            return {}
+
+        # 회사별 청크 수 (검색할 청크가 없는 회사는 보충 검색에서 제외)
+        available = {company: 0 for company in target}
+        for info in self._reports.values():
+            if info["company"] in available and (year is None or info["year"] == year):
+                available[info["company"]] += info["chunks"]
+        n_results = min(len(target) * k_per_company * _GROUP_OVERSAMPLE, sum(available.values()))
+        grouped: Dict[str, List[tuple[Document, float]]] = {company: [] for company in target}
+        if n_results <= 0:
+            return grouped
+
+        embedding = get_embeddings(self.provider).embed_query(query)
+        for doc, distance in self._query([embedding], n_results, build_where(companies, year=year))[0]:
+            hits = grouped.get(doc.metadata.get("company"))
+            if hits is not None and len(hits) < k_per_company:
+                hits.append((doc, distance))
+
+        for company in [c for c, hits in grouped.items() if not hits and available[c]]:
+            grouped[company] = self._query([embedding], k_per_company, build_where([company], year=year))[0]
+        return grouped
+
+
+# Singleton instance
+_benchmark_index: Optional[BenchmarkIndex] = None
+_benchmark_index_lock = threading.Lock()
+
+
+def get_benchmark_index() -> BenchmarkIndex:
+    """Get or create BenchmarkIndex singleton."""
+    global _benchmark_index
+    with _benchmark_index_lock:
+        if _benchmark_index is None:
+            _benchmark_index = BenchmarkIndex()
+        return _benchmark_index
@@ -0,0 +1,161 @@
+"""
+Chunk Embedding Store Infrastructure Adapter
+
+청크 텍스트 해시 → 임베딩 벡터를 보고서 간에 공유하는 SQLite 저장소
+- 키: (임베딩 provider id, 청크 SHA-256)
+- 값: float32 벡터 + 출처 (처음 임베딩한 보고서 해시, 페이지)
+- 정정판/국영문판/다음 연도판처럼 대부분의 페이지가 같은 보고서는
+  바뀐 청크만 새로 임베딩
+"""
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+CHUNK_EMBEDDING_STORE_FILE = _BASE_DIR / settings.CHUNK_EMBEDDING_STORE_FILE
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+def chunk_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ChunkEmbeddingStore:
+    """Content-addressed embedding cache shared by all report vector stores."""
+
+    def __init__(self, db_path: Path = CHUNK_EMBEDDING_STORE_FILE):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunk_embeddings (
+                provider TEXT NOT NULL,
+                chunk_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                report_hash TEXT,
+                page INTEGER,
+                created_at TEXT,
+                PRIMARY KEY (provider, chunk_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seeded_stores (provider TEXT NOT NULL, report_hash TEXT NOT NULL, "
+            "PRIMARY KEY (provider, report_hash))"
+        )
+        self._conn.commit()
+
+    def get_many(self, provider: str, hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        청크 해시 목록 조회
+
+        Returns:
+            {chunk_hash: {"embedding": List[float], "report_hash": str, "page": int}} (있는 것만)
+        """
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for start in range(0, len(unique), _SQLITE_MAX_VARIABLES):
+                batch = unique[start:start + _SQLITE_MAX_VARIABLES]
+                rows = self._conn.execute(
+                    f"SELECT chunk_hash, embedding, report_hash, page FROM chunk_embeddings "
+                    f"WHERE provider = ? AND chunk_hash IN ({','.join('?' * len(batch))})",
+                    [provider, *batch],
+                ).fetchall()
+                for hash_, blob, report_hash, page in rows:
+                    found[hash_] = {
+                        "embedding": array("f", blob).tolist(),
+                        "report_hash": report_hash,
+                        "page": page,
+                    }
+        return found
+
+    def put_many(
+        self,
+        provider: str,
+        rows: List[Tuple[str, List[float], Optional[str], Optional[int]]],
+    ) -> None:
+        """(chunk_hash, embedding, report_hash, page) 저장 (이미 있으면 최초 출처 유지)"""
+        if not rows:
+            return
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO chunk_embeddings "
+                "(provider, chunk_hash, embedding, report_hash, page, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (provider, hash_, array("f", embedding).tobytes(), report_hash, page, now)
+                    for hash_, embedding, report_hash, page in rows
+                ],
+            )
+            self._conn.commit()
+
+    def is_seeded(self, provider: str, report_hash: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seeded_stores WHERE provider = ? AND report_hash = ?", (provider, report_hash)
+            ).fetchone()
+        return row is not None
+
+    def seed_from_store(self, store: Any, provider: str, report_hash: str) -> int:
+        """
+        기존 보고서 스토어의 벡터를 청크 캐시에 등록 (기능 도입 전에 만든 스토어 재사용, 스토어당 1회)
+
+        Returns:
+            등록한 청크 수
+        """
+        if self.is_seeded(provider, report_hash):
+            return 0
+        data = store._collection.get(include=["documents", "metadatas", "embeddings"])
+        documents = data["documents"] or []
+        metadatas = data["metadatas"] or [{}] * len(documents)
+        rows = [
+            (chunk_hash(doc), list(embedding), (meta or {}).get("reused_from", report_hash), (meta or {}).get("page"))
+            for doc, meta, embedding in zip(documents, metadatas, data["embeddings"])
+        ]
+        self.put_many(provider, rows)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO seeded_stores (provider, report_hash) VALUES (?, ?)", (provider, report_hash)
+            )
+            self._conn.commit()
+        logger.info(f"Seeded chunk embedding store from {report_hash}: {len(rows)} chunks")
+        return len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT provider, COUNT(*) FROM chunk_embeddings GROUP BY provider"
+            ).fetchall()
+        return {
+            "chunks": {provider: count for provider, count in rows},
+            "size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+        }
+
+
+# Singleton instance
+_chunk_embedding_store: Optional[ChunkEmbeddingStore] = None
+_chunk_embedding_store_lock = threading.Lock()
+
+
+def get_chunk_embedding_store() -> ChunkEmbeddingStore:
+    """Get or create ChunkEmbeddingStore singleton."""
+    global _chunk_embedding_store
+    with _chunk_embedding_store_lock:
+        if _chunk_embedding_store is None:
+            _chunk_embedding_store = ChunkEmbeddingStore()
+        return _chunk_embedding_store
@@ -5,11 +5,13 @@ Handles file upload, storage, and retrieval operations.
 This keeps file I/O logic out of API routers (RULE F-LAYER-001).
 """
 
+import hashlib
+import json
 import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import UploadFile
 
@@ -22,6 +24,242 @@ logger = get_logger(__name__)
 _BASE_DIR = Path(__file__).parent.parent.parent
 
 
+class ContentIndex:
+    """
+    Content-addressed upload index for a directory.
+
+    같은 내용의 PDF는 SHA-256 기준으로 한 번만 저장하고, 업로드 이름(별칭)을
+    단일 blob 파일에 매핑합니다. 각 별칭은 blob에 대한 참조 1개이며,
+    마지막 참조가 해제될 때 실제 파일을 삭제합니다.
+
+    별칭은 blob 간에 겹치지 않습니다. 내용이 다른 파일이 같은 이름으로 올라오면
+    (예: 연도만 다른 ``LG전자.pdf``) ``<이름>@<해시 앞 8자리>`` 별칭을 받습니다.
+
+    Manifest (``.manifest.json``)::
+
+        {"blobs": {"<sha256>": {"id", "filename", "size", "uploadedAt", "aliases": [...]}}}
+    """
+
+    MANIFEST_NAME = ".manifest.json"
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.manifest_path = directory / self.MANIFEST_NAME
+        self._blobs: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    # =========================================================================
+    # 영속화
+    # =========================================================================
+
+    def _load(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self._blobs = json.load(f).get("blobs", {})
+        except Exception as e:
+            logger.error(f"Failed to load upload manifest {self.manifest_path}: {e}")
+            self._blobs = {}
+            return
+        self._disambiguate_aliases()
+
+    def _disambiguate_aliases(self) -> None:
+        """여러 blob이 같은 별칭을 가진 기존 manifest 정리 (먼저 업로드된 blob이 이름 유지)"""
+        owners: Dict[str, str] = {}
+        changed = False
+        for content_hash, entry in sorted(self._blobs.items(), key=lambda item: item[1].get("uploadedAt", "")):
+            for i, alias in enumerate(entry["aliases"]):
+                if owners.setdefault(alias, content_hash) != content_hash:
+                    entry["aliases"][i] = self._suffixed(alias, content_hash)
+                    logger.warning(f"Upload alias {alias} is shared by several files; renamed to {entry['aliases'][i]}")
+                    changed = True
+        if changed:
+            self._save()
+
+    def _save(self) -> None:
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"blobs": self._blobs}, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.manifest_path)
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    @staticmethod
+    def hash_bytes(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def hash_file(filepath: Path) -> str:
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """blob 항목 조회 (파일이 외부에서 삭제된 경우 항목 정리 후 None)"""
+        entry = self._blobs.get(content_hash)
+        if entry is None:
+            return None
+        if not (self.directory / entry["filename"]).exists():
+            del self._blobs[content_hash]
+            self._save()
+            return None
+        return entry
+
+    def resolve(self, key: str) -> Optional[str]:
+        """문서 ID, 파일명 또는 별칭 → content hash"""
+        for content_hash, entry in self._blobs.items():
+            if key in (entry["id"], entry["filename"]) or key in entry["aliases"]:
+                return content_hash
+        return None
+
+    @staticmethod
+    def _suffixed(name: str, content_hash: str) -> str:
+        return f"{name}@{content_hash[:8]}"
+
+    def unique_alias(self, content_hash: str, name: str) -> str:
+        """content_hash blob에 붙일 별칭 (다른 blob이 같은 이름을 쓰면 해시 접두사를 붙임)"""
+        owner = self.resolve(name)
+        return name if owner in (None, content_hash) else self._suffixed(name, content_hash)
+
+    def path_of(self, content_hash: str) -> Path:
+        return self.directory / self._blobs[content_hash]["filename"]
+
+    def is_tracked(self, filename: str) -> bool:
+        return any(entry["filename"] == filename for entry in self._blobs.values())
+
+    # =========================================================================
+    # 등록 / 해제
+    # =========================================================================
+
+    def register(self, content_hash: str, doc_id: str, filename: str, size: int, alias: str) -> Dict[str, Any]:
+        """새 blob 등록"""
+        entry = {
+            "id": doc_id,
+            "filename": filename,
+            "size": size,
+            "uploadedAt": datetime.now().isoformat(),
+            "aliases": [alias],
+        }
+        self._blobs[content_hash] = entry
+        self._save()
+        return entry
+
+    def add_alias(self, content_hash: str, alias: str) -> Dict[str, Any]:
+        """기존 blob에 별칭(참조) 추가"""
+        entry = self._blobs[content_hash]
+        if alias not in entry["aliases"]:
+            entry["aliases"].append(alias)
+            self._save()
+        return entry
+
+    def release(self, key: str, all_references: bool = False) -> Optional[Tuple[Path, bool]]:
+        """
+        참조 해제
+
+        Args:
+            key: 해제할 별칭. 문서 ID/파일명은 남은 별칭이 하나일 때만 허용
+            all_references: True면 모든 참조를 해제하고 blob 삭제
+
+        Returns:
+            (blob 경로, blob 삭제 여부) 또는 매칭되는 항목이 없으면 None
+
+        Raises:
+            ValueError: 문서 ID로 요청했는데 별칭이 여러 개라 어느 참조인지 알 수 없는 경우
+        """
+        content_hash = self.resolve(key)
+        if content_hash is None:
+            return None
+
+        entry = self._blobs[content_hash]
+        blob_path = self.directory / entry["filename"]
+        if all_references:
+            entry["aliases"].clear()
+        elif key in entry["aliases"]:
+            entry["aliases"].remove(key)
+        elif len(entry["aliases"]) <= 1:
+            entry["aliases"].clear()
+        else:
+            raise ValueError(
+                f"{key} is shared by aliases {entry['aliases']}; delete by alias or release all references"
+            )
+
+        removed = not entry["aliases"]
+        if removed:
+            del self._blobs[content_hash]
+            blob_path.unlink(missing_ok=True)
+        self._save()
+        return blob_path, removed
+
+    def hash_untracked(self) -> List[Tuple[Path, str]]:
+        """manifest에 없는 기존 PDF와 내용 해시 (오래된 순, 파일 읽기만 수행)"""
+        untracked = sorted(
+            (p for p in self.directory.glob("*.pdf") if not self.is_tracked(p.name)),
+            key=lambda p: (p.stat().st_mtime, p.name),
+        )
+        return [(pdf_file, self.hash_file(pdf_file)) for pdf_file in untracked]
+
+    def deduplicate_existing(
+        self,
+        hashed: List[Tuple[Path, str]],
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        manifest에 없는 기존 PDF를 등록하고 중복 사본 제거 (hash_untracked() 결과 사용)
+
+        가장 오래된 사본을 blob으로 유지하고, 나머지 사본의 문서 ID는 별칭으로
+        남겨 기존 ID로의 조회/삭제가 계속 동작하도록 합니다.
+
+        Args:
+            hashed: (PDF 경로, 내용 해시) 목록
+            dry_run: True면 manifest/파일을 변경하지 않고 결과만 계산
+
+        Returns:
+            등록/제거 수, 회수 바이트, 제거된 사본 → 유지된 문서 ID 목록
+        """
+        registered = 0
+        duplicates: List[Dict[str, Any]] = []
+        kept: Dict[str, str] = {}
+        for pdf_file, content_hash in hashed:
+            if not pdf_file.exists():
+                continue
+            doc_id = pdf_file.stem
+            entry = self.get(content_hash)
+            kept_id = entry["id"] if entry is not None else kept.get(content_hash)
+            if kept_id is None:
+                registered += 1
+                kept[content_hash] = doc_id
+                if not dry_run:
+                    entry = self.register(content_hash, doc_id, pdf_file.name, pdf_file.stat().st_size, doc_id)
+                    entry["uploadedAt"] = datetime.fromtimestamp(pdf_file.stat().st_mtime).isoformat()
+                continue
+
+            duplicates.append({"document_id": doc_id, "kept": kept_id, "bytes": pdf_file.stat().st_size})
+            if not dry_run:
+                self._blobs[content_hash]["aliases"].append(doc_id)
+                pdf_file.unlink()
+                logger.info(f"Removed duplicate upload {pdf_file.name} (alias of {kept_id})")
+
+        if hashed and not dry_run:
+            self._save()
+        reclaimed = sum(d["bytes"] for d in duplicates)
+        logger.info(
+            f"Upload dedupe{' (dry run)' if dry_run else ''} in {self.directory}: "
+            f"registered={registered}, duplicates={len(duplicates)}, reclaimed={reclaimed / 1024 / 1024:.1f} MB"
+        )
+        return {
+            "dry_run": dry_run,
+            "registered": registered,
+            "removed": len(duplicates),
+            "duplicates": duplicates,
+            "reclaimed_bytes": reclaimed,
+        }
+
+
 class FileStorageService:
     """
     File storage service for handling document uploads.
@@ -38,6 +276,10 @@ class FileStorageService:
         self.benchmark_dir.mkdir(parents=True, exist_ok=True)
         self.esg_dir.mkdir(parents=True, exist_ok=True)
 
+        # 벤치마킹 업로드는 내용 해시 기준으로 한 번만 저장
+        # (기존 중복 파일 정리는 benchmark.dedupe_uploads 작업으로 명시적으로 실행)
+        self.benchmark_index = ContentIndex(self.benchmark_dir)
+
         logger.info(f"FileStorageService initialized: benchmark={self.benchmark_dir}, esg={self.esg_dir}")
 
     async def save_benchmark_file(
@@ -53,24 +295,29 @@ class FileStorageService:
             company_name: Optional company name (extracted from filename if not provided)
 
         Returns:
-            Dict with file info: id, name, path, size, uploadedAt
+            Dict with file info: id, name, path, size, uploadedAt,
+            contentHash, aliases, duplicate (True if the same content was already stored)
         """
-        return await self._save_file(file, self.benchmark_dir, "bench", company_name)
+        return await self._save_file(
+            file, self.benchmark_dir, "bench", company_name, index=self.benchmark_index
+        )
 
     async def save_esg_file(
         self,
         file: UploadFile,
+        prefix: str = "esg",
     ) -> dict:
         """
         Save an ESG standards PDF file.
 
         Args:
             file: Uploaded file
+            prefix: Document ID prefix (issue pool uploads use 'std')
 
         Returns:
             Dict with file info: id, name, path, size, uploadedAt
         """
-        return await self._save_file(file, self.esg_dir, "esg")
+        return await self._save_file(file, self.esg_dir, prefix)
 
     async def _save_file(
         self,
@@ -78,6 +325,7 @@ class FileStorageService:
         target_dir: Path,
         prefix: str,
         company_name: Optional[str] = None,
+        index: Optional[ContentIndex] = None,
     ) -> dict:
         """
         Internal method to save a file.
@@ -87,6 +335,7 @@ class FileStorageService:
             target_dir: Target directory path
             prefix: ID prefix (e.g., 'bench', 'esg')
             company_name: Optional company name
+            index: Content index; if given, identical content is stored once
 
         Returns:
             Dict with file info
@@ -97,23 +346,42 @@ class FileStorageService:
         if not file.filename.lower().endswith(".pdf"):
             raise ValueError(f"Only PDF files are allowed: {file.filename}")
 
+        base_name = company_name or file.filename.rsplit(".", 1)[0]
+        content = await file.read()
+        file_size = len(content)
+
+        content_hash = None
+        if index is not None:
+            content_hash = index.hash_bytes(content)
+            entry = index.get(content_hash)
+            if entry is not None:
+                # 동일 내용 재업로드: 파일을 다시 쓰지 않고 기존 문서에 별칭만 추가
+                entry = index.add_alias(content_hash, index.unique_alias(content_hash, base_name))
+                logger.info(f"Duplicate upload: {file.filename} -> existing {entry['id']} (aliases={entry['aliases']})")
+                return {
+                    "id": entry["id"],
+                    "name": file.filename,
+                    "path": str(target_dir / entry["filename"]),
+                    "size": entry["size"],
+                    "uploadedAt": entry["uploadedAt"],
+                    "status": "pending",
+                    "contentHash": content_hash,
+                    "aliases": list(entry["aliases"]),
+                    "duplicate": True,
+                }
+
         # Generate unique ID
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = company_name or file.filename.rsplit(".", 1)[0]
         doc_id = f"{prefix}_{timestamp}_{base_name}"
         filename = f"{doc_id}.pdf"
         filepath = target_dir / filename
 
-        # Read and save file
-        content = await file.read()
-        file_size = len(content)
-
         with open(filepath, "wb") as buffer:
             buffer.write(content)
 
         logger.info(f"Saved file: {file.filename} -> {filepath} ({file_size} bytes)")
 
-        return {
+        info = {
             "id": doc_id,
             "name": file.filename,
             "path": str(filepath),
@@ -121,6 +389,11 @@ class FileStorageService:
             "uploadedAt": datetime.now().isoformat(),
             "status": "pending",
         }
+        if index is not None:
+            alias = index.unique_alias(content_hash, base_name)
+            entry = index.register(content_hash, doc_id, filename, file_size, alias)
+            info.update(contentHash=content_hash, aliases=list(entry["aliases"]), duplicate=False)
+        return info
 
     def delete_file(self, filepath: str) -> bool:
         """
@@ -139,19 +412,40 @@ class FileStorageService:
             return True
         return False
 
-    def delete_by_id(self, doc_id: str, target_dir: Optional[Path] = None) -> bool:
+    def delete_by_id(
+        self,
+        doc_id: str,
+        target_dir: Optional[Path] = None,
+        all_references: bool = False,
+    ) -> bool:
         """
         Delete a file by document ID.
 
+        Content-addressed uploads are reference counted: deleting by alias releases
+        that alias, and the stored file is removed only when no alias remains.
+        A document ID shared by several aliases raises ValueError unless
+        all_references is set.
+
         Args:
-            doc_id: Document ID
+            doc_id: Document ID or alias
             target_dir: Optional specific directory to search
+            all_references: Release every alias of a content-addressed upload
 
         Returns:
             True if deleted, False if not found
+
+        Raises:
+            ValueError: doc_id names a shared upload without identifying one alias
         """
         search_dirs = [target_dir] if target_dir else [self.benchmark_dir, self.esg_dir]
 
+        if self.benchmark_dir in search_dirs:
+            released = self.benchmark_index.release(doc_id, all_references=all_references)
+            if released is not None:
+                blob_path, removed = released
+                logger.info(f"Released upload reference: {doc_id} -> {blob_path} (file removed={removed})")
+                return True
+
         for directory in search_dirs:
             for filename in os.listdir(directory):
                 if filename.startswith(doc_id) or doc_id in filename:
@@ -179,14 +473,20 @@ class FileStorageService:
                     file_stat = filepath.stat()
                     doc_id = filename.rsplit(".", 1)[0]
 
-                    files.append({
+                    info = {
                         "id": doc_id,
                         "name": filename,
                         "path": str(filepath),
                         "size": file_stat.st_size,
                         "uploadedAt": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
                         "status": "embedded",
-                    })
+                    }
+                    if target_dir == self.benchmark_dir:
+                        content_hash = self.benchmark_index.resolve(doc_id)
+                        if content_hash is not None:
+                            info["contentHash"] = content_hash
+                            info["aliases"] = list(self.benchmark_index.get(content_hash)["aliases"])
+                    files.append(info)
         return files
 
     def list_benchmark_files(self) -> list:
@@ -197,16 +497,34 @@ class FileStorageService:
         """List all ESG PDF files."""
         return self.list_files(self.esg_dir)
 
+    def get_aliases(self, doc_id: str) -> list:
+        """
+        Get all aliases sharing the same stored benchmark file.
+
+        Args:
+            doc_id: Document ID or alias
+
+        Returns:
+            Alias list (empty if the document is not content-addressed)
+        """
+        content_hash = self.benchmark_index.resolve(doc_id)
+        entry = self.benchmark_index.get(content_hash) if content_hash else None
+        return list(entry["aliases"]) if entry else []
+
     def get_file_path(self, doc_id: str) -> Optional[str]:
         """
         Get file path by document ID.
 
         Args:
-            doc_id: Document ID
+            doc_id: Document ID or alias
 
         Returns:
             File path or None if not found
         """
+        content_hash = self.benchmark_index.resolve(doc_id)
+        if content_hash is not None and self.benchmark_index.get(content_hash) is not None:
+            return str(self.benchmark_index.path_of(content_hash))
+
         for directory in [self.benchmark_dir, self.esg_dir]:
             for filename in os.listdir(directory):
                 if filename.startswith(doc_id) or doc_id in filename:
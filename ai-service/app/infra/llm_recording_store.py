@@ -0,0 +1,179 @@
+"""
+LLM Recording Store Infrastructure Adapter
+
+LLM 게이트웨이 record 모드에서 캡처한 요청→응답 쌍을 보관하는 SQLite 저장소
+- 키: 엔드포인트 + 정규화한 요청 JSON의 SHA-256 (API 키는 저장하지 않음)
+- 값: 상태 코드, 응답 헤더, 원본 응답 바이트(스트리밍은 SSE 그대로), 첫 바이트/전체 지연 시간
+- replay 모드는 이 저장소로 응답과 지연 분포(엔드포인트·모델별)를 재현
+"""
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+LLM_RECORDING_FILE = _BASE_DIR / settings.LLM_RECORDING_FILE
+
+
+@dataclass(frozen=True)
+class LLMRecording:
+    request_key: str
+    endpoint: str
+    model: str
+    stream: bool
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    ttfb_ms: float
+    latency_ms: float
+
+
+class LLMRecordingStore:
+    """Request→response pairs captured from the OpenAI API, with their latencies."""
+
+    def __init__(self, db_path: Path = LLM_RECORDING_FILE):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_recordings (
+                request_key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                model TEXT NOT NULL,
+                stream INTEGER NOT NULL,
+                request_json TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers_json TEXT NOT NULL,
+                body BLOB NOT NULL,
+                ttfb_ms REAL NOT NULL,
+                latency_ms REAL NOT NULL,
+                recorded_at TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_recordings_model ON llm_recordings (endpoint, model, stream)"
+        )
+        self._conn.commit()
+        # replay 중 같은 요청을 반복 조회하므로 메모리에 보관
+        self._recordings: Dict[str, Optional[LLMRecording]] = {}
+        self._latencies: Dict[Tuple[str, Optional[str]], List[Tuple[float, float]]] = {}
+        self._keys_by_model: Dict[Tuple[str, str, bool], List[str]] = {}
+
+    def put(self, recording: LLMRecording, request_json: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_recordings "
+                "(request_key, endpoint, model, stream, request_json, status_code, headers_json, body, "
+                "ttfb_ms, latency_ms, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    recording.request_key,
+                    recording.endpoint,
+                    recording.model,
+                    int(recording.stream),
+                    request_json,
+                    recording.status_code,
+                    json.dumps(recording.headers),
+                    recording.body,
+                    recording.ttfb_ms,
+                    recording.latency_ms,
+                    datetime.now().isoformat(),
+                ),
+            )
+            self._conn.commit()
+            self._recordings[recording.request_key] = recording
+            self._latencies.clear()
+            self._keys_by_model.clear()
+
+    def get(self, request_key: str) -> Optional[LLMRecording]:
+        with self._lock:
+            if request_key not in self._recordings:
+                row = self._conn.execute(
+                    "SELECT request_key, endpoint, model, stream, status_code, headers_json, body, ttfb_ms, latency_ms "
+                    "FROM llm_recordings WHERE request_key = ?",
+                    (request_key,),
+                ).fetchone()
+                self._recordings[request_key] = self._from_row(row) if row else None
+            return self._recordings[request_key]
+
+    def latencies(self, endpoint: str, model: Optional[str] = None) -> List[Tuple[float, float]]:
+        """(ttfb_ms, latency_ms) 표본 (model=None이면 엔드포인트 전체)"""
+        key = (endpoint, model)
+        with self._lock:
+            if key not in self._latencies:
+                query = "SELECT ttfb_ms, latency_ms FROM llm_recordings WHERE endpoint = ?"
+                params: List[Any] = [endpoint]
+                if model is not None:
+                    query += " AND model = ?"
+                    params.append(model)
+                self._latencies[key] = [tuple(row) for row in self._conn.execute(query, params).fetchall()]
+            return self._latencies[key]
+
+    def pick(self, endpoint: str, model: str, stream: bool, seed: int) -> Optional[LLMRecording]:
+        """같은 엔드포인트·모델·스트리밍 여부의 녹화 중 seed로 고른 하나 (없으면 None)"""
+        key = (endpoint, model, stream)
+        with self._lock:
+            if key not in self._keys_by_model:
+                rows = self._conn.execute(
+                    "SELECT request_key FROM llm_recordings WHERE endpoint = ? AND model = ? AND stream = ? "
+                    "ORDER BY request_key",
+                    (endpoint, model, int(stream)),
+                ).fetchall()
+                self._keys_by_model[key] = [row[0] for row in rows]
+            keys = self._keys_by_model[key]
+        return self.get(keys[seed % len(keys)]) if keys else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT endpoint, COUNT(*), AVG(latency_ms) FROM llm_recordings GROUP BY endpoint"
+            ).fetchall()
+        return {
+            "entries": sum(count for _, count, _ in rows),
+            "endpoints": {
+                endpoint: {"entries": count, "avg_latency_ms": round(avg or 0.0, 1)}
+                for endpoint, count, avg in rows
+            },
+            "size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+        }
+
+    @staticmethod
+    def _from_row(row: tuple) -> LLMRecording:
+        request_key, endpoint, model, stream, status_code, headers_json, body, ttfb_ms, latency_ms = row
+        return LLMRecording(
+            request_key=request_key,
+            endpoint=endpoint,
+            model=model,
+            stream=bool(stream),
+            status_code=status_code,
+            headers=[tuple(pair) for pair in json.loads(headers_json)],
+            body=bytes(body),
+            ttfb_ms=ttfb_ms,
+            latency_ms=latency_ms,
+        )
+
+
+# Singleton instance
+_llm_recording_store: Optional[LLMRecordingStore] = None
+_llm_recording_store_lock = threading.Lock()
+
+
+def get_llm_recording_store() -> LLMRecordingStore:
+    """Get or create LLMRecordingStore singleton."""
+    global _llm_recording_store
+    with _llm_recording_store_lock:
+        if _llm_recording_store is None:
+            _llm_recording_store = LLMRecordingStore()
+        return _llm_recording_store
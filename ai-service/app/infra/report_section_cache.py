@@ -0,0 +1,169 @@
+"""
+Report Section Cache Infrastructure Adapter
+
+생성된 보고서 섹션을 입력 해시로 저장하는 SQLite 저장소
+- 키: (회사, 연도, 이슈 ID, 중대성 유형, 순위, 이슈/KPI 입력 해시, 프롬프트 버전, 모델)의 SHA-256
+- 값: SectionData JSON (생성에 성공한 섹션만)
+- KPI 하나를 고치거나 순위를 바꿔 다시 생성하면 입력이 바뀐 섹션만 LLM 호출
+- REPORT_SECTION_CACHE_MAX_ENTRIES 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+REPORT_SECTION_CACHE_FILE = _BASE_DIR / settings.REPORT_SECTION_CACHE_FILE
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+def section_cache_key(**inputs: Any) -> str:
+    """섹션 입력 → 캐시 키 (키 순서와 무관한 JSON 정규화 후 SHA-256)"""
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportSectionCache:
+    """Content-addressed cache of generated report sections."""
+
+    def __init__(self, db_path: Path = REPORT_SECTION_CACHE_FILE, max_entries: Optional[int] = None):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.max_entries = max_entries or settings.REPORT_SECTION_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS report_sections (
+                cache_key TEXT PRIMARY KEY,
+                company_id TEXT,
+                year INTEGER,
+                issue_id TEXT,
+                materiality_type TEXT,
+                section_json TEXT NOT NULL,
+                created_at TEXT,
+                last_used_at TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_report_sections_company ON report_sections (company_id, year)"
+        )
+        self._conn.commit()
+        self._hits = 0
+        self._misses = 0
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시 키 목록 조회 (조회된 항목은 최근 사용 시각 갱신)
+
+        Returns:
+            {cache_key: SectionData dict} (있는 것만)
+        """
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        now = datetime.now().isoformat()
+        with self._lock:
+            for start in range(0, len(unique), _SQLITE_MAX_VARIABLES):
+                batch = unique[start:start + _SQLITE_MAX_VARIABLES]
+                rows = self._conn.execute(
+                    f"SELECT cache_key, section_json FROM report_sections "
+                    f"WHERE cache_key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for key, section_json in rows:
+                    found[key] = json.loads(section_json)
+            if found:
+                self._conn.executemany(
+                    "UPDATE report_sections SET last_used_at = ? WHERE cache_key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+            self._hits += len(found)
+            self._misses += len(unique) - len(found)
+        return found
+
+    def put_many(self, rows: List[Tuple[str, str, int, Dict[str, Any]]]) -> None:
+        """(cache_key, company_id, year, SectionData dict) 저장"""
+        if not rows:
+            return
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO report_sections "
+                "(cache_key, company_id, year, issue_id, materiality_type, section_json, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        key,
+                        company_id,
+                        year,
+                        section.get("issue_id"),
+                        section.get("materiality_type"),
+                        json.dumps(section, ensure_ascii=False),
+                        now,
+                        now,
+                    )
+                    for key, company_id, year, section in rows
+                ],
+            )
+            self._prune_locked()
+            self._conn.commit()
+
+    def invalidate(self, company_id: str, year: Optional[int] = None) -> int:
+        """회사(연도) 섹션 캐시 삭제"""
+        query = "DELETE FROM report_sections WHERE company_id = ?"
+        params: List[Any] = [company_id]
+        if year is not None:
+            query += " AND year = ?"
+            params.append(year)
+        with self._lock:
+            removed = self._conn.execute(query, params).rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM report_sections").fetchone()[0]
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+            }
+
+    def _prune_locked(self) -> None:
+        excess = self._conn.execute("SELECT COUNT(*) FROM report_sections").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM report_sections WHERE cache_key IN "
+                "(SELECT cache_key FROM report_sections ORDER BY last_used_at LIMIT ?)",
+                (excess,),
+            )
+            logger.info(f"Pruned {excess} report section cache entries")
+
+
+# Singleton instance
+_report_section_cache: Optional[ReportSectionCache] = None
+_report_section_cache_lock = threading.Lock()
+
+
+def get_report_section_cache() -> ReportSectionCache:
+    """Get or create ReportSectionCache singleton."""
+    global _report_section_cache
+    with _report_section_cache_lock:
+        if _report_section_cache is None:
+            _report_section_cache = ReportSectionCache()
+        return _report_section_cache
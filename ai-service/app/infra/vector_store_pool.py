@@ -0,0 +1,312 @@
+"""
+Vector Store Pool Infrastructure Adapter
+
+Keeps opened benchmark Chroma stores in memory so repeated queries against the
+same report reuse the loaded SQLite connection and HNSW index.
+
+- LRU order, keyed by report hash
+- Memory budget (estimated from on-disk store size) and max store count
+- Idle eviction (stores unused for VECTOR_STORE_POOL_IDLE_SEC)
+- Leases: acquire()/release() 참조 수를 세어 사용 중인 스토어는 축출하지 않고,
+  축출/삭제 요청된 스토어는 마지막 사용자가 반환할 때 해제
+- discard_if_idle(): 사용 중이 아닐 때만 스토어를 제거하고 디스크 삭제까지 수행
+  (삭제 중 같은 키의 acquire는 삭제가 끝날 때까지 대기)
+- Thread-safe: stores are opened from worker threads (asyncio.to_thread)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_community.vectorstores import Chroma
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# loader: 스토어를 열거나 생성하고 (store, persist_dir) 반환
+StoreLoader = Callable[[], Tuple[Chroma, Path]]
+
+
+@dataclass
+class _PoolEntry:
+    key: str
+    store: Chroma
+    persist_dir: Path
+    size_bytes: int
+    last_used: float = field(default_factory=time.monotonic)
+    in_use: int = 0
+    retired: bool = False  # 풀에서 제거됨, 마지막 반환 시 해제
+
+
+def _dir_size(path: Path) -> int:
+    """스토어 디렉토리 크기 (메모리 사용량 추정치)"""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _release_store(persist_dir: Path) -> None:
+    """
+    Chroma 시스템 캐시에서 스토어 제거 (사용 중인 lease가 없을 때만 호출)
+
+    chromadb는 persist 경로별 System을 프로세스 전역에 캐시하므로, 풀에서 참조만
+    버려서는 인덱스 메모리가 해제되지 않습니다. 클라이언트는 질의마다 이 캐시에서
+    System을 찾으므로 사용 중에 제거하면 안 됩니다.
+
+    공개 API가 없어 chromadb 내부 캐시(SharedSystemClient._identifier_to_system)를
+    사용하며, requirements.txt의 chromadb 버전 고정(1.1.0)을 전제로 합니다.
+    캐시 구조가 다르면 경고만 남기고 해제를 건너뜁니다.
+    """
+    try:
+        from chromadb.api.shared_system_client import SharedSystemClient
+
+        systems = getattr(SharedSystemClient, "_identifier_to_system", None)
+        if not isinstance(systems, dict):
+            logger.warning(f"Unsupported chromadb system cache; vector store {persist_dir} stays loaded")
+            return
+        systems.pop(str(persist_dir), None)
+    except Exception as e:
+        logger.warning(f"Failed to release vector store {persist_dir}: {e}")
+
+
+class VectorStorePool:
+    """LRU pool of opened Chroma stores with a memory budget and idle eviction."""
+
+    def __init__(
+        self,
+        max_stores: Optional[int] = None,
+        memory_budget_mb: Optional[int] = None,
+        idle_ttl_sec: Optional[float] = None,
+    ):
+        self.max_stores = max(1, max_stores or settings.VECTOR_STORE_POOL_MAX_STORES)
+        self.memory_budget_bytes = (memory_budget_mb or settings.VECTOR_STORE_POOL_MEMORY_MB) * 1024 * 1024
+        self.idle_ttl_sec = idle_ttl_sec if idle_ttl_sec is not None else settings.VECTOR_STORE_POOL_IDLE_SEC
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        # 풀에서 제거됐지만 아직 사용 중인 스토어 (id(store) → entry)
+        self._retired: Dict[int, _PoolEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def acquire(self, key: str, loader: StoreLoader) -> Chroma:
+        """
+        열린 스토어를 빌려옴 (없으면 loader로 열어서 풀에 등록), 사용 후 release(key) 필수
+
+        같은 키를 동시에 요청하면 한 스레드만 로드하고 나머지는 결과를 공유합니다.
+        """
+        with self._lock:
+            self._evict_idle_locked()
+            entry = self._touch_locked(key)
+            if entry is not None:
+                self._hits += 1
+                entry.in_use += 1
+                return entry.store
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._touch_locked(key)
+                if entry is not None:
+                    self._hits += 1
+                    entry.in_use += 1
+                    return entry.store
+
+            started = time.perf_counter()
+            store, persist_dir = loader()
+            size_bytes = _dir_size(persist_dir) if persist_dir.exists() else 0
+
+            with self._lock:
+                self._misses += 1
+                self._entries[key] = _PoolEntry(key, store, persist_dir, size_bytes, in_use=1)
+                self._key_locks.pop(key, None)
+                released = self._enforce_budget_locked()
+
+            for entry in released:
+                _release_store(entry.persist_dir)
+            logger.info(
+                f"Vector store pooled: {key} ({size_bytes / 1024 / 1024:.1f} MB, "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms to open)"
+            )
+            return store
+
+    def release(self, key: str, store: Chroma) -> None:
+        """acquire()로 빌린 스토어 반환 (축출 대기 중이던 스토어는 마지막 반환 시 해제)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.store is not store:
+                entry = self._retired.get(id(store))
+            if entry is None:
+                return
+            entry.in_use = max(0, entry.in_use - 1)
+            entry.last_used = time.monotonic()
+            released = self._enforce_budget_locked() if entry.in_use == 0 else []
+            if entry.retired and entry.in_use == 0:
+                self._retired.pop(id(store), None)
+                # 같은 경로를 다시 연 스토어가 풀에 있으면 chromadb System을 공유하므로 유지
+                if not any(e.persist_dir == entry.persist_dir for e in self._entries.values()):
+                    released.append(entry)
+        for entry in released:
+            _release_store(entry.persist_dir)
+
+    @contextmanager
+    def lease(self, key: str, loader: StoreLoader) -> Iterator[Chroma]:
+        """with 블록 동안 스토어를 빌려옴"""
+        store = self.acquire(key, loader)
+        try:
+            yield store
+        finally:
+            self.release(key, store)
+
+    def evict(self, key: str) -> bool:
+        """특정 스토어 제거 (스토어 삭제/재생성 전 호출, 사용 중이면 반환 후 해제)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            released = self._evict_locked(key, "explicit")
+        if released:
+            _release_store(entry.persist_dir)
+        return True
+
+    def discard_if_idle(self, key: str, remove: Callable[[], None]) -> bool:
+        """
+        빌려간 스토어가 없으면 풀에서 제거하고 remove()로 디스크 스토어 삭제
+
+        remove() 실행 중에는 같은 키의 acquire가 로드 단계에서 대기하므로, 삭제 중인
+        디렉토리를 여는 일이 없습니다.
+
+        Returns:
+            삭제했으면 True, 사용 중이라 건너뛰었으면 False
+        """
+        with self._lock:
+            if self._in_use_locked(key):
+                return False
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # 잠금을 기다리는 동안 열린 풀 항목으로 빌려갔을 수 있으므로 다시 확인
+                if self._in_use_locked(key):
+                    return False
+                entry = self._entries.get(key)
+                released = entry is not None and self._evict_locked(key, "discard")
+            if released:
+                _release_store(entry.persist_dir)
+            try:
+                remove()
+            finally:
+                with self._lock:
+                    if self._key_locks.get(key) is key_lock:
+                        del self._key_locks[key]
+        return True
+
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def is_in_use(self, key: str) -> bool:
+        """빌려간 스토어가 있는지 (축출 후 반환 대기 중인 것 포함)"""
+        with self._lock:
+            return self._in_use_locked(key)
+
+    def evict_idle(self) -> int:
+        """유휴 시간이 지난 스토어 제거"""
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def clear(self) -> None:
+        """모든 스토어 제거 (사용 중인 스토어는 반환 후 해제)"""
+        with self._lock:
+            released = [self._entries[key] for key in list(self._entries) if self._evict_locked(key, "clear")]
+        for entry in released:
+            _release_store(entry.persist_dir)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "stores": len(self._entries),
+                "in_use": sum(1 for e in self._entries.values() if e.in_use),
+                "pending_release": len(self._retired),
+                "max_stores": self.max_stores,
+                "memory_bytes": sum(e.size_bytes for e in self._entries.values()),
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    # =========================================================================
+    # 내부 (self._lock 보유 상태에서 호출)
+    # =========================================================================
+
+    def _in_use_locked(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        if entry is not None and entry.in_use:
+            return True
+        return any(e.key == key for e in self._retired.values())
+
+    def _touch_locked(self, key: str) -> Optional[_PoolEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            self._entries.move_to_end(key)
+        return entry
+
+    def _evict_locked(self, key: str, reason: str) -> bool:
+        """풀에서 제거, 지금 해제해도 되면 True (사용 중이면 마지막 반환 시 해제)"""
+        entry = self._entries.pop(key)
+        self._evictions += 1
+        logger.info(f"Vector store evicted ({reason}): {key}")
+        if entry.in_use:
+            entry.retired = True
+            self._retired[id(entry.store)] = entry
+            return False
+        # 축출 전 빌려간 같은 경로의 스토어가 아직 사용 중이면 해제는 그쪽 반환 시로 미룸
+        return not any(e.persist_dir == entry.persist_dir for e in self._retired.values())
+
+    def _evict_idle_locked(self) -> int:
+        """유휴 스토어 제거 (사용 중인 스토어 제외)"""
+        if self.idle_ttl_sec <= 0:
+            return 0
+        now = time.monotonic()
+        idle = [
+            k for k, e in self._entries.items()
+            if not e.in_use and now - e.last_used > self.idle_ttl_sec
+        ]
+        for key in idle:
+            persist_dir = self._entries[key].persist_dir
+            if self._evict_locked(key, "idle"):
+                _release_store(persist_dir)
+        return len(idle)
+
+    def _enforce_budget_locked(self) -> List[_PoolEntry]:
+        """최대 개수/메모리 예산 초과 시 사용 중이지 않은 스토어를 오래된 순으로 제거 (해제할 항목 반환)"""
+        def over_budget() -> bool:
+            used = sum(e.size_bytes for e in self._entries.values())
+            return len(self._entries) > self.max_stores or used > self.memory_budget_bytes
+
+        released = []
+        for key, entry in list(self._entries.items()):
+            if not over_budget():
+                break
+            if not entry.in_use and self._evict_locked(key, "budget"):
+                released.append(entry)
+        return released
+
+
+# Singleton instance
+_vector_store_pool: Optional[VectorStorePool] = None
+
+
+def get_vector_store_pool() -> VectorStorePool:
+    """Get or create VectorStorePool singleton."""
+    global _vector_store_pool
+    if _vector_store_pool is None:
+        _vector_store_pool = VectorStorePool()
+    return _vector_store_pool
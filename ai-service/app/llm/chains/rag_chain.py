@@ -8,6 +8,7 @@ from langchain_core.runnables import RunnablePassthrough
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.llm.clients.llm_gateway import get_llm_gateway
 from app.llm.prompts.chatbot_prompts import RAG_SYSTEM_PROMPT, RAG_USER_PROMPT
 
 logger = get_logger(__name__)
@@ -23,9 +24,8 @@ class RAGChain:
     def _get_llm(self) -> ChatOpenAI:
         """Get or create LLM instance."""
         if self._llm is None:
-            self._llm = ChatOpenAI(
+            self._llm = get_llm_gateway().chat_model(
                 model=settings.OPENAI_MODEL,
-                api_key=settings.OPENAI_API_KEY,
                 temperature=0.7,
             )
         return self._llm
@@ -33,9 +33,7 @@ class RAGChain:
     def _get_embeddings(self) -> OpenAIEmbeddings:
         """Get or create embeddings instance."""
         if self._embeddings is None:
-            self._embeddings = OpenAIEmbeddings(
-                api_key=settings.OPENAI_API_KEY,
-            )
+            self._embeddings = get_llm_gateway().embeddings()
         return self._embeddings
 
     async def run(
@@ -7,6 +7,7 @@ from langchain_core.output_parsers import StrOutputParser
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.llm.clients.llm_gateway import get_llm_gateway
 from app.llm.prompts.report_prompts import (
     REPORT_SECTION_SYSTEM_PROMPT,
     REPORT_SECTION_USER_PROMPT,
@@ -24,9 +25,8 @@ class ReportChain:
     def _get_llm(self) -> ChatOpenAI:
         """Get or create LLM instance."""
         if self._llm is None:
-            self._llm = ChatOpenAI(
+            self._llm = get_llm_gateway().chat_model(
                 model=settings.OPENAI_MODEL,
-                api_key=settings.OPENAI_API_KEY,
                 temperature=0.5,
             )
         return self._llm
@@ -0,0 +1,125 @@
+"""
+Embedding provider registry.
+
+벤치마킹 벡터 스토어용 임베딩 모델을 교체 가능하게 제공
+- openai: OpenAIEmbeddings (원격 API, LLM 게이트웨이 경유)
+- bge-m3: 로컬 SentenceTransformer (CPU 배치 인코딩, 모델 1회 로드 후 공유)
+
+벡터 스토어에는 생성 시 사용한 provider id를 기록하고, 조회 시 같은 provider로만
+질의해 서로 다른 임베딩 공간이 섞이지 않도록 합니다.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from sentence_transformers import SentenceTransformer
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+EMBEDDING_PROVIDER_OPENAI = "openai"
+EMBEDDING_PROVIDER_BGE_M3 = "bge-m3"
+
+_model_lock = threading.Lock()
+_sentence_transformers: Dict[str, SentenceTransformer] = {}
+_providers: Dict[str, Embeddings] = {}
+# 동시에 들어온 같은 질의 임베딩은 한 번만 인코딩 (OpenAI 질의는 LLM 게이트웨이에서 합침)
+_query_flight = SingleFlight()
+
+
+def get_sentence_transformer(model_name: Optional[str] = None, device: Optional[str] = None) -> SentenceTransformer:
+    """
+    SentenceTransformer 모델 공유 로더 (프로세스당 모델별 1회 로드)
+
+    Args:
+        model_name: 모델 이름 (기본 settings.EMBEDDING_MODEL)
+        device: 실행 디바이스 (기본 settings.LOCAL_EMBEDDING_DEVICE, None이면 자동 선택)
+    """
+    model_name = model_name or settings.EMBEDDING_MODEL
+    device = device or settings.LOCAL_EMBEDDING_DEVICE
+    key = f"{model_name}@{device or 'auto'}"
+    with _model_lock:
+        if key not in _sentence_transformers:
+            logger.info(f"Loading embedding model {model_name} on {device or 'auto'}...")
+            _sentence_transformers[key] = SentenceTransformer(model_name, device=device)
+            logger.info(f"Embedding model {model_name} loaded")
+        return _sentence_transformers[key]
+
+
+class LocalSentenceTransformerEmbeddings(Embeddings):
+    """LangChain Embeddings adapter for a local SentenceTransformer model."""
+
+    def __init__(self, model_name: str, batch_size: int, device: Optional[str] = None):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.device = device
+
+    @property
+    def model(self) -> SentenceTransformer:
+        return get_sentence_transformer(self.model_name, self.device)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """청크를 배치 단위로 인코딩 (정규화된 벡터)"""
+        if not texts:
+            return []
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = _query_flight.do_sync(
+            (self.model_name, self.device, text),
+            lambda: self.model.encode(text, normalize_embeddings=True, convert_to_numpy=True).tolist(),
+        )
+        return list(vector)
+
+
+def provider_id(provider: Optional[str] = None) -> str:
+    """
+    provider 이름 → 스토어 메타데이터에 기록할 provider id ("openai:<model>", "bge-m3:<model>")
+    """
+    provider = (provider or settings.BENCHMARK_EMBEDDING_PROVIDER).lower()
+    if provider == EMBEDDING_PROVIDER_OPENAI:
+        return f"{EMBEDDING_PROVIDER_OPENAI}:{settings.OPENAI_EMBEDDING_MODEL}"
+    if provider == EMBEDDING_PROVIDER_BGE_M3:
+        return f"{EMBEDDING_PROVIDER_BGE_M3}:{settings.EMBEDDING_MODEL}"
+    raise ValueError(f"Unknown embedding provider: {provider}")
+
+
+def get_embeddings(pid: Optional[str] = None) -> Embeddings:
+    """
+    provider id에 해당하는 Embeddings 인스턴스 반환 (id별 1개 공유)
+
+    Args:
+        pid: provider id (기본: 설정된 BENCHMARK_EMBEDDING_PROVIDER)
+    """
+    pid = pid or provider_id()
+    with _model_lock:
+        if pid in _providers:
+            return _providers[pid]
+
+    provider, _, model = pid.partition(":")
+    if provider == EMBEDDING_PROVIDER_OPENAI:
+        embeddings: Embeddings = get_llm_gateway().embeddings(
+            model=model or settings.OPENAI_EMBEDDING_MODEL,
+        )
+    elif provider == EMBEDDING_PROVIDER_BGE_M3:
+        embeddings = LocalSentenceTransformerEmbeddings(
+            model_name=model or settings.EMBEDDING_MODEL,
+            batch_size=settings.LOCAL_EMBEDDING_BATCH_SIZE,
+        )
+    else:
+        raise ValueError(f"Unknown embedding provider id: {pid}")
+
+    with _model_lock:
+        return _providers.setdefault(pid, embeddings)
@@ -0,0 +1,630 @@
+"""
+LLM Gateway
+
+모든 OpenAI 호출(AsyncOpenAI/OpenAI SDK, LangChain ChatOpenAI/OpenAIEmbeddings)이 지나가는 단일 관문
+- 공유 연결 풀: httpx.AsyncClient/httpx.Client 하나씩을 모든 클라이언트가 http_client로 사용
+- 재시도: 429/5xx/연결 오류에 지수 백오프 + 지터 (MAX_RETRIES, RETRY_BACKOFF_FACTOR),
+  retry-after 헤더가 있으면 그 이상 대기. SDK 자체 재시도는 끔(max_retries=0)
+- 동시성: 전역(LLM_MAX_CONCURRENCY) + 모델별(LLM_MODEL_CONCURRENCY) 슬롯.
+  sync/async 호출이 같은 슬롯을 공유하며, 응답 본문을 다 읽을 때(스트리밍 포함)까지 점유
+- TPM 예산: 응답 헤더(x-ratelimit-remaining-tokens / x-ratelimit-reset-tokens)로 모델별 남은
+  토큰을 추적하고, 요청 추정 토큰이 남은 양보다 크면 리셋 시각까지 대기 후 전송
+- 요청 합치기: 본문이 같은 채팅/임베딩 요청이 동시에 오면 업스트림 호출 한 번의 응답을 공유
+  (LLM_COALESCE_ENABLED, 슬롯/예산보다 앞단이라 합류한 요청은 슬롯을 쓰지 않음)
+- 녹화/재생: LLM_PROXY_MODE=record|replay면 내부 transport를 llm_replay의 녹화/재생 transport로 교체
+
+httpx transport 단계에서 처리하므로 호출부는 get_llm_gateway()가 만든 클라이언트만 쓰면 됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from openai import AsyncOpenAI, OpenAI
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.llm.clients.llm_replay import PROXY_OFF, PROXY_REPLAY, proxy_mode, proxy_stats, wrap_transports
+from app.utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+_RETRY_BASE_DELAY_SEC = 0.5
+_CHARS_PER_TOKEN = 2  # 한국어 위주 프롬프트 기준 보수적 추정 (evidence_packer 오프라인 추정과 동일)
+_DEFAULT_COMPLETION_TOKENS = 1024
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+_COALESCE_PATHS = ("/chat/completions", "/embeddings")
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """OpenAI 리셋 헤더("6m0s", "1.5s", "20ms") → 초"""
+    if not value:
+        return None
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_after(headers: httpx.Headers) -> Optional[float]:
+    """retry-after-ms / retry-after 헤더 → 초"""
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+def _parse_payload(request: httpx.Request) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(request.content or b"{}")
+    except (ValueError, httpx.RequestNotRead):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _request_info(payload: Optional[Dict[str, Any]]) -> tuple:
+    """요청 본문 → (모델, 추정 토큰)"""
+    if payload is None:
+        return "unknown", 0
+    model = str(payload.get("model") or "unknown")
+    if "messages" in payload:
+        chars = sum(len(str(message.get("content") or "")) for message in payload["messages"])
+        completion = payload.get("max_tokens") or payload.get("max_completion_tokens") or _DEFAULT_COMPLETION_TOKENS
+        return model, chars // _CHARS_PER_TOKEN + int(completion)
+    texts = payload.get("input") or []
+    if isinstance(texts, str):
+        texts = [texts]
+    # 임베딩 입력이 토큰 ID 배열로 오는 경우(LangChain) 길이가 곧 토큰 수
+    tokens = sum(len(text) if isinstance(text, list) else len(str(text)) // _CHARS_PER_TOKEN for text in texts)
+    return model, tokens
+
+
+def _coalesce_key(request: httpx.Request, payload: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    동시 요청 합치기 키 (정규화한 JSON 본문 + 엔드포인트 + API 키)
+
+    스트리밍이 아닌 채팅/임베딩 요청만 합칩니다.
+    """
+    if (
+        not settings.LLM_COALESCE_ENABLED
+        or payload is None
+        or payload.get("stream")
+        or request.method != "POST"
+        or not request.url.path.endswith(_COALESCE_PATHS)
+    ):
+        return None
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    material = f"{request.url}\n{request.headers.get('authorization', '')}\n{canonical}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class _ResponseSnapshot:
+    """합쳐진 요청의 응답 (대기자마다 새 httpx.Response로 복원)"""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+    @classmethod
+    def capture(cls, response: httpx.Response) -> "_ResponseSnapshot":
+        # 본문은 이미 디코딩됐으므로 인코딩/길이 헤더는 버림
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return cls(response.status_code, headers, response.content)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class _SlotPool:
+    """
+    sync 스레드와 asyncio 태스크가 함께 쓰는 카운팅 세마포어
+
+    해제 시 대기자(FIFO)에게 슬롯을 직접 넘깁니다.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._lock = threading.Lock()
+        self._waiters: Deque[Any] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # 슬롯을 넘겨받은 뒤 취소된 경우 다음 대기자에게 반환
+            if not queued and waiter[1].done() and not waiter[1].cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self.in_use -= 1
+                return
+            waiter = self._waiters.popleft()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            loop, future = waiter
+            loop.call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: "asyncio.Future") -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class _TokenBudget:
+    """응답 헤더 기반 모델별 분당 토큰 예산"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.throttled = 0
+        self.throttled_sec = 0.0
+
+    def reserve(self, tokens: int) -> float:
+        """
+        추정 토큰 예약
+
+        Returns:
+            0이면 바로 전송, 양수면 그만큼 기다린 뒤 다시 reserve
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.remaining is None or now >= self.reset_at:
+                return 0.0
+            # 한도 전체보다 큰 요청은 기다려도 들어갈 수 없으므로 예산으로 막지 않음 (429 재시도에 맡김)
+            if self.remaining >= tokens or (self.limit is not None and tokens > self.limit):
+                self.remaining -= tokens
+                return 0.0
+            wait = self.reset_at - now
+            self.throttled += 1
+            self.throttled_sec += wait
+            return wait
+
+    def update(self, headers: httpx.Headers) -> None:
+        remaining = headers.get("x-ratelimit-remaining-tokens")
+        if remaining is None:
+            return
+        reset = parse_reset_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0
+        with self._lock:
+            try:
+                self.remaining = int(remaining)
+                if "x-ratelimit-limit-tokens" in headers:
+                    self.limit = int(headers["x-ratelimit-limit-tokens"])
+            except ValueError:
+                return
+            self.reset_at = time.monotonic() + reset
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit_tokens": self.limit,
+                "remaining_tokens": self.remaining,
+                "reset_in_sec": round(max(0.0, self.reset_at - time.monotonic()), 2),
+                "throttled": self.throttled,
+                "throttled_sec": round(self.throttled_sec, 2),
+            }
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 슬롯 반환"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _ReleasingSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class LLMGateway:
+    """Shared pool, retries, concurrency slots and TPM budgets for every OpenAI call."""
+
+    def __init__(self):
+        self.max_retries = max(0, settings.MAX_RETRIES)
+        self.backoff_factor = max(1, settings.RETRY_BACKOFF_FACTOR)
+        self.max_backoff = settings.LLM_RETRY_MAX_WAIT_SEC
+        self.timeout = httpx.Timeout(settings.LLM_TIMEOUT_SEC, connect=10.0)
+        self.limits = httpx.Limits(
+            max_connections=settings.LLM_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_POOL_MAX_CONNECTIONS,
+        )
+        self._global_slots = _SlotPool(settings.LLM_MAX_CONCURRENCY)
+        self._model_slots: Dict[str, _SlotPool] = {}
+        self._budgets: Dict[str, _TokenBudget] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"requests": 0, "retries": 0, "errors": 0}
+        self.single_flight = SingleFlight()
+        self.proxy_mode = proxy_mode()
+        async_transport, sync_transport = wrap_transports(
+            self.proxy_mode,
+            httpx.AsyncHTTPTransport(limits=self.limits),
+            httpx.HTTPTransport(limits=self.limits),
+        )
+
+        self.async_http_client = httpx.AsyncClient(
+            transport=_GatewayAsyncTransport(self, async_transport),
+            timeout=self.timeout,
+        )
+        self.http_client = httpx.Client(
+            transport=_GatewayTransport(self, sync_transport),
+            timeout=self.timeout,
+        )
+        self._async_openai: Optional[AsyncOpenAI] = None
+        self._openai: Optional[OpenAI] = None
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+    @property
+    def api_key(self) -> Optional[str]:
+        # replay 모드는 네트워크를 쓰지 않으므로 키 없이도 SDK 클라이언트를 만들 수 있게 함
+        if not settings.OPENAI_API_KEY and self.proxy_mode == PROXY_REPLAY:
+            return "replay"
+        return settings.OPENAI_API_KEY
+
+    def async_openai(self) -> AsyncOpenAI:
+        """게이트웨이를 거치는 AsyncOpenAI (공유 인스턴스)"""
+        with self._lock:
+            if self._async_openai is None:
+                self._async_openai = AsyncOpenAI(
+                    api_key=self.api_key,
+                    http_client=self.async_http_client,
+                    max_retries=0,
+                    timeout=self.timeout,
+                )
+            return self._async_openai
+
+    def openai(self) -> OpenAI:
+        """게이트웨이를 거치는 sync OpenAI (공유 인스턴스)"""
+        with self._lock:
+            if self._openai is None:
+                self._openai = OpenAI(
+                    api_key=self.api_key,
+                    http_client=self.http_client,
+                    max_retries=0,
+                    timeout=self.timeout,
+                )
+            return self._openai
+
+    def chat_model(self, **kwargs: Any) -> ChatOpenAI:
+        """게이트웨이를 거치는 LangChain ChatOpenAI"""
+        kwargs.setdefault("model", settings.OPENAI_MODEL)
+        kwargs.setdefault("api_key", self.api_key)
+        return ChatOpenAI(
+            http_client=self.http_client,
+            http_async_client=self.async_http_client,
+            max_retries=0,
+            **kwargs,
+        )
+
+    def embeddings(self, **kwargs: Any) -> OpenAIEmbeddings:
+        """게이트웨이를 거치는 LangChain OpenAIEmbeddings"""
+        kwargs.setdefault("model", settings.OPENAI_EMBEDDING_MODEL)
+        kwargs.setdefault("api_key", self.api_key)
+        if self.proxy_mode != PROXY_OFF:
+            # 길이 검사는 tiktoken 인코딩 파일을 네트워크에서 받으므로 record/replay에서는 끔
+            # (record도 끄는 이유: 요청 본문이 토큰 배열이 아닌 문자열이어야 replay 키와 일치)
+            kwargs.setdefault("check_embedding_ctx_length", False)
+        return OpenAIEmbeddings(
+            http_client=self.http_client,
+            http_async_client=self.async_http_client,
+            max_retries=0,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------
+    # Limits
+    # ------------------------------------------------------------------
+    def _slots_for(self, model: str) -> _SlotPool:
+        with self._lock:
+            if model not in self._model_slots:
+                limit = settings.LLM_MODEL_CONCURRENCY.get(model, settings.LLM_DEFAULT_MODEL_CONCURRENCY)
+                self._model_slots[model] = _SlotPool(limit)
+            return self._model_slots[model]
+
+    def _budget_for(self, model: str) -> _TokenBudget:
+        with self._lock:
+            return self._budgets.setdefault(model, _TokenBudget())
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+
+    def backoff_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """attempt(0부터)번째 재시도 전 대기 시간 (full jitter, retry-after 이상)"""
+        ceiling = min(self.max_backoff, _RETRY_BASE_DELAY_SEC * self.backoff_factor ** attempt)
+        delay = random.uniform(ceiling / 2, ceiling)
+        if response is not None:
+            hinted = _retry_after(response.headers)
+            if hinted is not None:
+                delay = max(delay, min(hinted, self.max_backoff))
+        return delay
+
+    def _should_retry(self, attempt: int, response: Optional[httpx.Response]) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if response is None:
+            return True
+        if response.headers.get("x-should-retry") == "false":
+            return False
+        return response.status_code in RETRYABLE_STATUS
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            models = {
+                model: {"in_flight": slots.in_use, "waiting": slots.waiting, "limit": slots.limit}
+                for model, slots in self._model_slots.items()
+            }
+            budgets = dict(self._budgets)
+        for model, budget in budgets.items():
+            models.setdefault(model, {}).update(budget.stats())
+        return {
+            **counters,
+            "in_flight": self._global_slots.in_use,
+            "waiting": self._global_slots.waiting,
+            "max_concurrency": self._global_slots.limit,
+            "models": models,
+            "coalescing": self.single_flight.stats(),
+            "proxy": proxy_stats(self.proxy_mode),
+        }
+
+    async def aclose(self) -> None:
+        await self.async_http_client.aclose()
+        self.http_client.close()
+
+
+class _GatewayAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, gateway: LLMGateway, transport: httpx.AsyncBaseTransport):
+        self.gateway = gateway
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        payload = _parse_payload(request)
+        key = _coalesce_key(request, payload)
+        if key is None:
+            return await self._send(request, payload)
+        snapshot = await self.gateway.single_flight.do(key, lambda: self._fetch(request, payload))
+        return snapshot.to_response(request)
+
+    async def _fetch(self, request: httpx.Request, payload: Optional[Dict[str, Any]]) -> _ResponseSnapshot:
+        response = await self._send(request, payload)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return _ResponseSnapshot.capture(response)
+
+    async def _send(self, request: httpx.Request, payload: Optional[Dict[str, Any]]) -> httpx.Response:
+        gateway = self.gateway
+        model, tokens = _request_info(payload)
+        model_slots = gateway._slots_for(model)
+        budget = gateway._budget_for(model)
+        gateway._count("requests")
+
+        attempt = 0
+        while True:
+            wait = budget.reserve(tokens)
+            while wait > 0:
+                logger.debug(f"LLM TPM budget exhausted for {model}, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+                wait = budget.reserve(tokens)
+
+            await model_slots.acquire_async()
+            try:
+                await gateway._global_slots.acquire_async()
+            except BaseException:
+                model_slots.release()
+                raise
+            release = _release_once(gateway._global_slots, model_slots)
+
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                release()
+                if not gateway._should_retry(attempt, None):
+                    gateway._count("errors")
+                    raise
+                logger.warning(f"LLM request to {model} failed ({type(e).__name__}), retrying")
+            except BaseException:
+                release()
+                raise
+            else:
+                budget.update(response.headers)
+                if not gateway._should_retry(attempt, response):
+                    if response.status_code >= 400:
+                        gateway._count("errors")
+                    if response.is_closed:
+                        release()  # 본문이 이미 메모리에 읽힌 응답
+                    else:
+                        response.stream = _ReleasingAsyncStream(response.stream, release)
+                    return response
+                await response.aclose()
+                release()
+                logger.warning(f"LLM request to {model} returned {response.status_code}, retrying")
+
+            gateway._count("retries")
+            await asyncio.sleep(gateway.backoff_delay(attempt, response))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class _GatewayTransport(httpx.BaseTransport):
+    def __init__(self, gateway: LLMGateway, transport: httpx.BaseTransport):
+        self.gateway = gateway
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        payload = _parse_payload(request)
+        key = _coalesce_key(request, payload)
+        if key is None:
+            return self._send(request, payload)
+        snapshot = self.gateway.single_flight.do_sync(key, lambda: self._fetch(request, payload))
+        return snapshot.to_response(request)
+
+    def _fetch(self, request: httpx.Request, payload: Optional[Dict[str, Any]]) -> _ResponseSnapshot:
+        response = self._send(request, payload)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return _ResponseSnapshot.capture(response)
+
+    def _send(self, request: httpx.Request, payload: Optional[Dict[str, Any]]) -> httpx.Response:
+        gateway = self.gateway
+        model, tokens = _request_info(payload)
+        model_slots = gateway._slots_for(model)
+        budget = gateway._budget_for(model)
+        gateway._count("requests")
+
+        attempt = 0
+        while True:
+            wait = budget.reserve(tokens)
+            while wait > 0:
+                logger.debug(f"LLM TPM budget exhausted for {model}, waiting {wait:.1f}s")
+                time.sleep(wait)
+                wait = budget.reserve(tokens)
+
+            model_slots.acquire()
+            gateway._global_slots.acquire()
+            release = _release_once(gateway._global_slots, model_slots)
+
+            response: Optional[httpx.Response] = None
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                release()
+                if not gateway._should_retry(attempt, None):
+                    gateway._count("errors")
+                    raise
+                logger.warning(f"LLM request to {model} failed ({type(e).__name__}), retrying")
+            except BaseException:
+                release()
+                raise
+            else:
+                budget.update(response.headers)
+                if not gateway._should_retry(attempt, response):
+                    if response.status_code >= 400:
+                        gateway._count("errors")
+                    if response.is_closed:
+                        release()  # 본문이 이미 메모리에 읽힌 응답
+                    else:
+                        response.stream = _ReleasingSyncStream(response.stream, release)
+                    return response
+                response.close()
+                release()
+                logger.warning(f"LLM request to {model} returned {response.status_code}, retrying")
+
+            gateway._count("retries")
+            time.sleep(gateway.backoff_delay(attempt, response))
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def _release_once(*pools: _SlotPool) -> Callable[[], None]:
+    released: List[bool] = []
+
+    def release() -> None:
+        if released:
+            return
+        released.append(True)
+        for pool in pools:
+            pool.release()
+
+    return release
+
+
+# Singleton instance
+_llm_gateway: Optional[LLMGateway] = None
+_llm_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get or create LLMGateway singleton."""
+    global _llm_gateway
+    with _llm_gateway_lock:
+        if _llm_gateway is None:
+            _llm_gateway = LLMGateway()
+        return _llm_gateway
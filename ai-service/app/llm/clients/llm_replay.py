@@ -0,0 +1,448 @@
+"""
+LLM record/replay transports
+
+LLM 게이트웨이의 내부 HTTP transport를 바꿔 끼워 OpenAI 호출을 녹화하거나 재생 (LLM_PROXY_MODE)
+- record: 실제 API를 그대로 호출하고, 200 응답 본문을 끝까지 받은 시점에
+  (요청, 응답, 첫 바이트/전체 지연)을 LLMRecordingStore에 저장
+- replay: 네트워크 없이 녹화된 응답 반환
+  - 지연(LLM_REPLAY_LATENCY): recorded(그 요청의 녹화 지연) | distribution(같은 모델 녹화 지연 표본에서 추출)
+    | fixed | none. 첫 바이트까지 기다린 뒤 나머지 본문을 조각내 나눠 보내 스트리밍도 재현
+  - 녹화 없는 임베딩: 입력별 결정적 가짜 벡터 (같은 입력 → 같은 벡터, L2 정규화, base64 형식 지원)
+  - 녹화 없는 채팅: 같은 모델 녹화 중 요청 해시로 고른 응답, 그것도 없으면 고정 대체 응답
+    (LLM_REPLAY_ON_MISS=error면 404)
+  - 응답에 x-llm-replay 헤더(hit/stand-in/stub/fake-embedding)를 붙이고, TPM 예산이 녹화 당시 값에
+    흔들리지 않도록 x-ratelimit-* 헤더는 제거
+
+재시도/동시성 슬롯/요청 합치기는 게이트웨이에서 그 위에 그대로 동작하므로 부하 테스트가 실제와 같은 경로를 탑니다.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.infra.llm_recording_store import LLMRecording, LLMRecordingStore, get_llm_recording_store
+
+logger = get_logger(__name__)
+
+PROXY_OFF = "off"
+PROXY_RECORD = "record"
+PROXY_REPLAY = "replay"
+
+_REPLAY_CHUNKS = 16
+_DROPPED_HEADERS = ("content-length", "transfer-encoding", "set-cookie", "date")
+_EMBEDDING_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+_STUB_CONTENT = "[replay] 녹화된 응답이 없는 요청입니다."
+
+
+def proxy_mode() -> str:
+    mode = (settings.LLM_PROXY_MODE or PROXY_OFF).lower()
+    if mode not in (PROXY_OFF, PROXY_RECORD, PROXY_REPLAY):
+        logger.warning(f"Unknown LLM_PROXY_MODE '{settings.LLM_PROXY_MODE}', using '{PROXY_OFF}'")
+        return PROXY_OFF
+    return mode
+
+
+def _parse_payload(request: httpx.Request) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(request.content or b"{}")
+    except (ValueError, httpx.RequestNotRead):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _canonical(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def recording_key(request: httpx.Request, payload: Dict[str, Any]) -> str:
+    """녹화 키 (엔드포인트 경로 + 정규화한 요청 JSON, 호스트/API 키와 무관)"""
+    return hashlib.sha256(f"{request.url.path}\n{_canonical(payload)}".encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Record
+# ----------------------------------------------------------------------
+def _recorder(
+    store: LLMRecordingStore, request: httpx.Request, response: httpx.Response, started: float
+) -> Optional[Callable[[bytes], None]]:
+    """200 응답이면 본문을 다 받은 뒤 호출할 저장 함수 반환"""
+    if response.status_code != 200:
+        return None
+    payload = _parse_payload(request)
+    if payload is None:
+        return None
+    ttfb_ms = (time.perf_counter() - started) * 1000
+
+    def _save(body: bytes, decoded: bool = False) -> None:
+        # 이미 디코딩된 본문이면 content-encoding을 남기지 않음 (재생 시 이중 디코딩 방지)
+        dropped = _DROPPED_HEADERS + (("content-encoding",) if decoded else ())
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in dropped]
+        recording = LLMRecording(
+            request_key=recording_key(request, payload),
+            endpoint=request.url.path,
+            model=str(payload.get("model") or "unknown"),
+            stream=bool(payload.get("stream")),
+            status_code=response.status_code,
+            headers=headers,
+            body=body,
+            ttfb_ms=round(ttfb_ms, 1),
+            latency_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        try:
+            store.put(recording, request_json=_canonical(payload))
+        except Exception as e:
+            logger.warning(f"Failed to record LLM response for {recording.endpoint}: {e}")
+
+    return _save
+
+
+class _RecordingAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, on_complete: Callable[[bytes], None]):
+        self._stream = stream
+        self._on_complete = on_complete
+        self._chunks: List[bytes] = []
+        self._finished = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._chunks.append(chunk)
+            yield chunk
+        self._finished = True
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            # 끝까지 읽은 응답만 저장 (중간에 끊긴 스트림은 버림)
+            if self._finished:
+                self._finished = False
+                self._on_complete(b"".join(self._chunks))
+
+
+class _RecordingSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, on_complete: Callable[[bytes], None]):
+        self._stream = stream
+        self._on_complete = on_complete
+        self._chunks: List[bytes] = []
+        self._finished = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._chunks.append(chunk)
+            yield chunk
+        self._finished = True
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._finished:
+                self._finished = False
+                self._on_complete(b"".join(self._chunks))
+
+
+class RecordingAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: LLMRecordingStore):
+        self.transport = transport
+        self.store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        save = _recorder(self.store, request, response, started)
+        if save is not None and response.is_closed:
+            save(response.content, decoded=True)  # 본문이 이미 메모리에 읽힌 응답
+        elif save is not None:
+            response.stream = _RecordingAsyncStream(response.stream, save)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RecordingTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, store: LLMRecordingStore):
+        self.transport = transport
+        self.store = store
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        save = _recorder(self.store, request, response, started)
+        if save is not None and response.is_closed:
+            save(response.content, decoded=True)  # 본문이 이미 메모리에 읽힌 응답
+        elif save is not None:
+            response.stream = _RecordingSyncStream(response.stream, save)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+def fake_embedding(model: str, item: Any, dimensions: int) -> np.ndarray:
+    """입력(문자열 또는 토큰 ID 배열)별 결정적 단위 벡터"""
+    digest = hashlib.sha256(json.dumps([model, item], ensure_ascii=False).encode("utf-8")).digest()
+    rng = np.random.default_rng(int.from_bytes(digest[:8], "big"))
+    vector = rng.standard_normal(dimensions).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _fake_embeddings_body(payload: Dict[str, Any], model: str) -> bytes:
+    inputs = payload.get("input") or []
+    if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+        inputs = [inputs]
+    dimensions = int(payload.get("dimensions") or _EMBEDDING_DIMENSIONS.get(model, settings.LLM_REPLAY_EMBEDDING_DIM))
+    as_base64 = payload.get("encoding_format") == "base64"
+    data = []
+    for index, item in enumerate(inputs):
+        vector = fake_embedding(model, item, dimensions)
+        embedding = base64.b64encode(vector.astype("<f4").tobytes()).decode("ascii") if as_base64 else vector.tolist()
+        data.append({"object": "embedding", "index": index, "embedding": embedding})
+    tokens = sum(len(item) if isinstance(item, list) else max(1, len(str(item)) // 2) for item in inputs)
+    return json.dumps({
+        "object": "list",
+        "data": data,
+        "model": model,
+        "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+    }).encode("utf-8")
+
+
+def _stub_chat_body(model: str, request_key: str, stream: bool) -> bytes:
+    completion_id = f"chatcmpl-replay-{request_key[:12]}"
+    if not stream:
+        return json.dumps({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": 0,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": _STUB_CONTENT},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }, ensure_ascii=False).encode("utf-8")
+    chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": 0, "model": model}
+    events = [
+        {**chunk, "choices": [{"index": 0, "delta": {"role": "assistant", "content": _STUB_CONTENT}, "finish_reason": None}]},
+        {**chunk, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+    ]
+    lines = [f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in events]
+    return ("".join(lines) + "data: [DONE]\n\n").encode("utf-8")
+
+
+@dataclass(frozen=True)
+class _ReplayPlan:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    chunks: List[bytes]
+    ttfb_sec: float
+    chunk_delay_sec: float
+
+
+class LLMReplayer:
+    """Builds offline responses from recordings (or deterministic stand-ins)."""
+
+    def __init__(self, store: LLMRecordingStore):
+        self.store = store
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"hit": 0, "stand-in": 0, "stub": 0, "fake-embedding": 0, "miss-error": 0}
+
+    def plan(self, request: httpx.Request) -> _ReplayPlan:
+        payload = _parse_payload(request) or {}
+        endpoint = request.url.path
+        model = str(payload.get("model") or "unknown")
+        stream = bool(payload.get("stream"))
+        key = recording_key(request, payload)
+
+        recording = self.store.get(key)
+        if recording is not None:
+            return self._from_recording("hit", recording, self._latency(endpoint, model, recording))
+
+        if endpoint.endswith("/embeddings"):
+            body = _fake_embeddings_body(payload, model)
+            headers = [("content-type", "application/json")]
+            return self._build("fake-embedding", 200, headers, body, self._latency(endpoint, model, None))
+
+        if settings.LLM_REPLAY_ON_MISS.lower() == "error":
+            body = json.dumps({"error": {
+                "message": f"No recorded response for {endpoint} ({model})",
+                "type": "replay_miss",
+                "code": "replay_miss",
+            }}).encode("utf-8")
+            return self._build("miss-error", 404, [("content-type", "application/json")], body, (0.0, 0.0))
+
+        stand_in = self.store.pick(endpoint, model, stream, int(key[:8], 16))
+        if stand_in is not None:
+            return self._from_recording("stand-in", stand_in, self._latency(endpoint, model, None))
+
+        content_type = "text/event-stream" if stream else "application/json"
+        body = _stub_chat_body(model, key, stream)
+        return self._build("stub", 200, [("content-type", content_type)], body, self._latency(endpoint, model, None))
+
+    def _latency(self, endpoint: str, model: str, recording: Optional[LLMRecording]) -> Tuple[float, float]:
+        """(첫 바이트까지, 전체) 지연 초"""
+        mode = settings.LLM_REPLAY_LATENCY.lower()
+        if mode == "none":
+            return 0.0, 0.0
+        sample: Optional[Tuple[float, float]] = None
+        if mode == "recorded" and recording is not None:
+            sample = (recording.ttfb_ms, recording.latency_ms)
+        elif mode != "fixed":
+            samples = self.store.latencies(endpoint, model) or self.store.latencies(endpoint)
+            if samples:
+                with self._lock:
+                    sample = self._rng.choice(samples)
+        if sample is None:
+            sample = (settings.LLM_REPLAY_FIXED_LATENCY_MS, settings.LLM_REPLAY_FIXED_LATENCY_MS)
+        scale = max(0.0, settings.LLM_REPLAY_LATENCY_SCALE) / 1000
+        ttfb_ms, latency_ms = sample
+        return ttfb_ms * scale, max(ttfb_ms, latency_ms) * scale
+
+    def _from_recording(self, outcome: str, recording: LLMRecording, latency: Tuple[float, float]) -> _ReplayPlan:
+        headers = [
+            (name, value)
+            for name, value in recording.headers
+            if not name.lower().startswith("x-ratelimit-") and name.lower() not in _DROPPED_HEADERS
+        ]
+        return self._build(outcome, recording.status_code, headers, recording.body, latency)
+
+    def _build(
+        self,
+        outcome: str,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        latency: Tuple[float, float],
+    ) -> _ReplayPlan:
+        with self._lock:
+            self._counters[outcome] += 1
+        size = max(1, -(-len(body) // _REPLAY_CHUNKS))
+        chunks = [body[start:start + size] for start in range(0, len(body), size)] or [b""]
+        ttfb, total = latency
+        return _ReplayPlan(
+            status_code=status_code,
+            headers=headers + [("x-llm-replay", outcome)],
+            chunks=chunks,
+            ttfb_sec=ttfb,
+            chunk_delay_sec=(total - ttfb) / max(1, len(chunks) - 1),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counters)
+
+
+class _ReplayAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: List[bytes], delay: float):
+        self._chunks = chunks
+        self._delay = delay
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for index, chunk in enumerate(self._chunks):
+            if index and self._delay > 0:
+                await asyncio.sleep(self._delay)
+            yield chunk
+
+
+class _ReplaySyncStream(httpx.SyncByteStream):
+    def __init__(self, chunks: List[bytes], delay: float):
+        self._chunks = chunks
+        self._delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        for index, chunk in enumerate(self._chunks):
+            if index and self._delay > 0:
+                time.sleep(self._delay)
+            yield chunk
+
+
+class ReplayAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, replayer: LLMReplayer):
+        self.replayer = replayer
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        plan = self.replayer.plan(request)
+        if plan.ttfb_sec > 0:
+            await asyncio.sleep(plan.ttfb_sec)
+        return httpx.Response(
+            plan.status_code,
+            headers=plan.headers,
+            stream=_ReplayAsyncStream(plan.chunks, plan.chunk_delay_sec),
+            request=request,
+        )
+
+
+class ReplayTransport(httpx.BaseTransport):
+    def __init__(self, replayer: LLMReplayer):
+        self.replayer = replayer
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        plan = self.replayer.plan(request)
+        if plan.ttfb_sec > 0:
+            time.sleep(plan.ttfb_sec)
+        return httpx.Response(
+            plan.status_code,
+            headers=plan.headers,
+            stream=_ReplaySyncStream(plan.chunks, plan.chunk_delay_sec),
+            request=request,
+        )
+
+
+def wrap_transports(
+    mode: str,
+    async_transport: httpx.AsyncBaseTransport,
+    sync_transport: httpx.BaseTransport,
+) -> Tuple[httpx.AsyncBaseTransport, httpx.BaseTransport]:
+    """프록시 모드에 맞게 게이트웨이 내부 transport 교체"""
+    if mode == PROXY_RECORD:
+        store = get_llm_recording_store()
+        logger.info(f"LLM proxy mode: record → {store.db_path}")
+        return RecordingAsyncTransport(async_transport, store), RecordingTransport(sync_transport, store)
+    if mode == PROXY_REPLAY:
+        replayer = get_llm_replayer()
+        logger.info(f"LLM proxy mode: replay ← {replayer.store.db_path} (latency={settings.LLM_REPLAY_LATENCY})")
+        return ReplayAsyncTransport(replayer), ReplayTransport(replayer)
+    return async_transport, sync_transport
+
+
+def proxy_stats(mode: str) -> Dict[str, Any]:
+    if mode == PROXY_OFF:
+        return {"mode": mode}
+    stats: Dict[str, Any] = {"mode": mode, "recordings": get_llm_recording_store().stats()}
+    if mode == PROXY_REPLAY:
+        stats["replayed"] = get_llm_replayer().stats()
+    return stats
+
+
+# Singleton instance
+_llm_replayer: Optional[LLMReplayer] = None
+_llm_replayer_lock = threading.Lock()
+
+
+def get_llm_replayer() -> LLMReplayer:
+    """Get or create LLMReplayer singleton."""
+    global _llm_replayer
+    with _llm_replayer_lock:
+        if _llm_replayer is None:
+            _llm_replayer = LLMReplayer(get_llm_recording_store())
+        return _llm_replayer
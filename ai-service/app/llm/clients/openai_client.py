@@ -1,20 +1,22 @@
 """OpenAI API client."""
 import json
 import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from openai import AsyncOpenAI
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.exceptions import LLMException
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.llm.prompts.registry import (
+    PROMPT_FINANCIAL_SECTION,
+    PROMPT_IMPACT_SECTION,
+    get_prompt_registry,
+)
 
 logger = get_logger(__name__)
 
-# Prompt templates directory
-PROMPTS_DIR = Path(__file__).parent.parent / "prompts" / "report"
-
 
 class OpenAIClient:
     """Client for OpenAI API calls."""
@@ -22,10 +24,15 @@ class OpenAIClient:
     def __init__(self) -> None:
         self._client: Optional[AsyncOpenAI] = None
 
+    @property
+    def model(self) -> str:
+        """Default chat model (section cache key component)."""
+        return settings.OPENAI_MODEL
+
     def _get_client(self) -> AsyncOpenAI:
-        """Get or create OpenAI client."""
+        """Get or create OpenAI client (routed through the LLM gateway)."""
         if self._client is None:
-            self._client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self._client = get_llm_gateway().async_openai()
         return self._client
 
     async def chat_completion(
@@ -52,6 +59,51 @@ class OpenAIClient:
                 details={"error": str(e)},
             )
 
+    async def stream_chat_completion(
+        self,
+        messages: List[dict],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str]:
+        """Generate chat completion, yielding content deltas as they arrive."""
+        try:
+            client = self._get_client()
+            stream = await client.chat.completions.create(
+                model=model or settings.OPENAI_MODEL,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"OpenAI streaming chat completion failed: {e}")
+            raise LLMException(
+                message="Failed to generate chat completion",
+                details={"error": str(e)},
+            )
+
+    async def _complete(
+        self,
+        messages: List[dict],
+        temperature: float,
+        max_tokens: int,
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Chat completion; streams deltas to on_delta when given."""
+        if on_delta is None:
+            return await self.chat_completion(messages=messages, temperature=temperature, max_tokens=max_tokens)
+        parts: List[str] = []
+        async for delta in self.stream_chat_completion(
+            messages=messages, temperature=temperature, max_tokens=max_tokens
+        ):
+            parts.append(delta)
+            on_delta(delta)
+        return "".join(parts)
+
     async def generate_embeddings(
         self,
         texts: List[str],
@@ -122,19 +174,18 @@ class OpenAIClient:
         impact_score: float,
         kpi_data: List[Dict[str, Any]],
         priority_rank: int,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Generate impact materiality section HTML."""
         try:
-            # Load prompt template
-            prompt_path = PROMPTS_DIR / "impact_section.txt"
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                prompt_template = f.read()
+            # Preloaded prompt template (no file I/O)
+            prompt_template = get_prompt_registry().get(PROMPT_IMPACT_SECTION)
 
             # Format KPI data
             kpi_text = self._format_kpi_data(kpi_data)
 
             # Fill template
-            prompt = prompt_template.format(
+            prompt = prompt_template.render(
                 company_name=company_name,
                 industry=industry,
                 year=year,
@@ -153,10 +204,11 @@ class OpenAIClient:
 
             logger.info(f"Generating impact section for: {issue_name}")
 
-            response = await self.chat_completion(
+            response = await self._complete(
                 messages=messages,
                 temperature=0.3,
                 max_tokens=2048,
+                on_delta=on_delta,
             )
 
             return self._extract_html(response)
@@ -179,19 +231,18 @@ class OpenAIClient:
         financial_score: float,
         kpi_data: List[Dict[str, Any]],
         priority_rank: int,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Generate financial materiality section HTML."""
         try:
-            # Load prompt template
-            prompt_path = PROMPTS_DIR / "financial_section.txt"
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                prompt_template = f.read()
+            # Preloaded prompt template (no file I/O)
+            prompt_template = get_prompt_registry().get(PROMPT_FINANCIAL_SECTION)
 
             # Format KPI data
             kpi_text = self._format_kpi_data(kpi_data)
 
             # Fill template
-            prompt = prompt_template.format(
+            prompt = prompt_template.render(
                 company_name=company_name,
                 industry=industry,
                 year=year,
@@ -209,10 +260,11 @@ class OpenAIClient:
 
             logger.info(f"Generating financial section for: {issue_name}")
 
-            response = await self.chat_completion(
+            response = await self._complete(
                 messages=messages,
                 temperature=0.3,
                 max_tokens=2048,
+                on_delta=on_delta,
             )
 
             return self._extract_html(response)
@@ -224,6 +276,49 @@ class OpenAIClient:
                 details={"error": str(e)},
             )
 
+    async def modify_section(
+        self,
+        section_html: str,
+        instruction: str,
+        company_name: str,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Modify a single report section, returning the edited HTML fragment."""
+        try:
+            messages = [
+                {
+                    "role": "system",
+                    "content": f"""당신은 {company_name} ESG 보고서 수정 전문가입니다.
+보고서의 한 섹션 HTML 조각만 주어집니다. 사용자의 지시에 따라 이 조각만 수정하세요.
+- 지시와 관련된 내용만 수정하고 나머지 문장은 그대로 유지
+- HTML 태그 구조, class, id, data-* 속성을 그대로 유지
+- 내부 데이터에 없는 수치를 새로 만들지 말 것
+- 한국어로 작성
+- 설명 없이 수정된 HTML 조각만 반환"""
+                },
+                {
+                    "role": "user",
+                    "content": f"""섹션 HTML:
+{section_html}
+
+수정 지시:
+{instruction}"""
+                }
+            ]
+
+            return await self.chat_completion(
+                messages=messages,
+                temperature=0.3,
+                max_tokens=max_tokens,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to modify report section: {e}")
+            raise LLMException(
+                message="보고서 섹션 수정 실패",
+                details={"error": str(e)},
+            )
+
     async def modify_report(
         self,
         current_report: str,
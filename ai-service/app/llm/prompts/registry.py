@@ -0,0 +1,199 @@
+"""
+Prompt Template Registry
+
+report/*.txt 프롬프트 템플릿을 프로세스 시작 시 한 번 읽어 메모리에 보관
+- 로드 시 검증: 포맷 문법 + 템플릿별 필수 플레이스홀더 (누락/미정의 모두 오류)
+- 버전: 템플릿 본문의 sha256 앞 12자리 (하위 캐시 키로 사용)
+- 핫 리로드: 파일 mtime이 바뀐 템플릿만 다시 읽음. mtime 확인은
+  PROMPT_RELOAD_CHECK_SEC 간격으로만 수행하므로 보고서 생성 경로는 파일을 읽지 않음
+- 리로드한 템플릿이 검증에 실패하면 이전 버전을 계속 사용
+"""
+
+import hashlib
+import string
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+REPORT_PROMPTS_DIR = Path(__file__).parent / "report"
+
+PROMPT_IMPACT_SECTION = "impact_section"
+PROMPT_FINANCIAL_SECTION = "financial_section"
+PROMPT_FULL_REPORT = "v1_full_report"
+PROMPT_SECTION_DRAFT = "v1_section_draft"
+
+_SECTION_FIELDS = {"company_name", "industry", "year", "issue_id", "issue_name", "category", "kpi_data"}
+
+# 템플릿별 플레이스홀더 (호출부가 넘기는 인자와 정확히 일치해야 함)
+REQUIRED_PLACEHOLDERS: Dict[str, FrozenSet[str]] = {
+    PROMPT_IMPACT_SECTION: frozenset(_SECTION_FIELDS | {"impact_score", "priority_rank"}),
+    PROMPT_FINANCIAL_SECTION: frozenset(_SECTION_FIELDS | {"financial_score", "priority_rank"}),
+    PROMPT_FULL_REPORT: frozenset({"company_name", "industry", "year", "impact_issues", "financial_issues"}),
+    PROMPT_SECTION_DRAFT: frozenset(_SECTION_FIELDS | {"impact_score", "financial_score", "is_priority"}),
+}
+
+
+class PromptTemplateError(ValueError):
+    """템플릿 파일이 없거나 검증에 실패한 경우"""
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    text: str
+    placeholders: FrozenSet[str]
+    version: str
+    mtime_ns: int
+
+    def render(self, **values: Any) -> str:
+        return self.text.format(**values)
+
+
+def _placeholders(name: str, text: str) -> FrozenSet[str]:
+    try:
+        fields = {
+            field.split(".", 1)[0].split("[", 1)[0]
+            for _, field, _, _ in string.Formatter().parse(text)
+            if field is not None
+        }
+    except ValueError as e:
+        raise PromptTemplateError(f"Invalid format syntax in prompt '{name}': {e}") from e
+    if "" in fields:
+        raise PromptTemplateError(f"Positional placeholder '{{}}' in prompt '{name}'")
+    return frozenset(fields)
+
+
+def _load_template(name: str, path: Path) -> PromptTemplate:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise PromptTemplateError(f"Prompt template not readable: {path} ({e})") from e
+
+    placeholders = _placeholders(name, text)
+    required = REQUIRED_PLACEHOLDERS.get(name)
+    if required is not None and placeholders != required:
+        missing = sorted(required - placeholders)
+        unknown = sorted(placeholders - required)
+        raise PromptTemplateError(f"Prompt '{name}' placeholders mismatch: missing={missing}, unknown={unknown}")
+
+    version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    return PromptTemplate(name, text, placeholders, version, mtime_ns)
+
+
+class PromptRegistry:
+    """Process-wide cache of validated prompt templates with mtime-based reload."""
+
+    def __init__(self, directory: Path = REPORT_PROMPTS_DIR, check_interval_sec: Optional[float] = None):
+        self.directory = directory
+        self.check_interval_sec = (
+            settings.PROMPT_RELOAD_CHECK_SEC if check_interval_sec is None else check_interval_sec
+        )
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._reloads = 0
+        self.load_all()
+
+    def load_all(self) -> None:
+        """디렉토리의 모든 템플릿 로드 (하나라도 검증 실패하면 예외)"""
+        templates: Dict[str, PromptTemplate] = {}
+        for path in sorted(self.directory.glob("*.txt")):
+            templates[path.stem] = _load_template(path.stem, path)
+        missing = sorted(set(REQUIRED_PLACEHOLDERS) - set(templates))
+        if missing:
+            raise PromptTemplateError(f"Prompt templates not found in {self.directory}: {missing}")
+        with self._lock:
+            self._templates = templates
+            self._next_check = time.monotonic() + self.check_interval_sec
+        logger.info(f"Loaded {len(templates)} prompt templates (version {self.version})")
+
+    def get(self, name: str) -> PromptTemplate:
+        self._maybe_reload()
+        template = self._templates.get(name)
+        if template is None:
+            raise PromptTemplateError(f"Unknown prompt template: {name}")
+        return template
+
+    def render(self, name: str, **values: Any) -> str:
+        return self.get(name).render(**values)
+
+    @property
+    def version(self) -> str:
+        """전체 템플릿 집합의 버전 (템플릿 하나라도 바뀌면 달라짐)"""
+        digest = hashlib.sha256()
+        for name, template in sorted(self._templates.items()):
+            digest.update(f"{name}:{template.version};".encode("utf-8"))
+        return digest.hexdigest()[:12]
+
+    def versions(self) -> Dict[str, str]:
+        return {name: t.version for name, t in sorted(self._templates.items())}
+
+    def check_for_changes(self) -> int:
+        """
+        mtime이 바뀐 템플릿 다시 로드
+
+        Returns:
+            다시 로드한 템플릿 수
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval_sec
+            current = dict(self._templates)
+
+        changed: Dict[str, PromptTemplate] = {}
+        for path in self.directory.glob("*.txt"):
+            name = path.stem
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if name in current and current[name].mtime_ns == mtime_ns:
+                continue
+            try:
+                changed[name] = _load_template(name, path)
+            except PromptTemplateError as e:
+                logger.warning(f"Keeping previous prompt '{name}': {e}")
+
+        changed = {n: t for n, t in changed.items() if n not in current or current[n].version != t.version}
+        if not changed:
+            return 0
+        with self._lock:
+            self._templates = {**self._templates, **changed}
+            self._reloads += len(changed)
+        logger.info(f"Reloaded prompt templates {sorted(changed)} (version {self.version})")
+        return len(changed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "templates": self.versions(),
+            "reloads": self._reloads,
+            "check_interval_sec": self.check_interval_sec,
+        }
+
+    def _maybe_reload(self) -> None:
+        if self.check_interval_sec <= 0 or time.monotonic() < self._next_check:
+            return
+        try:
+            self.check_for_changes()
+        except Exception as e:
+            logger.warning(f"Prompt reload check failed: {e}")
+
+
+# Singleton instance
+_prompt_registry: Optional[PromptRegistry] = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get or create PromptRegistry singleton."""
+    global _prompt_registry
+    if _prompt_registry is None:
+        _prompt_registry = PromptRegistry()
+    return _prompt_registry
@@ -22,8 +22,10 @@ from app.api import (
     esg_standards_router,
     carbon_router,
     chatbot_router,
+    job_router,
     materiality_router,
 )
+from app.batch.scheduler import setup_scheduler, shutdown_scheduler
 from app.config.config import settings
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import (
@@ -31,6 +33,10 @@ from app.core.middleware import (
     LoggingMiddleware,
     RequestIDMiddleware,
 )
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.llm.prompts.registry import get_prompt_registry
+from app.services.job_service import get_job_service
+from app.utils.pdf_extractor import shutdown_executor
 
 # Setup logging
 setup_logging()
@@ -41,8 +47,19 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     logger.info("Starting ESG AI Service...")
+    # 재시작 전 중단된 백그라운드 작업 재개
+    await get_job_service().resume_interrupted()
+    # 프롬프트 템플릿 사전 로드/검증 (보고서 생성 경로에서는 파일을 읽지 않음)
+    get_prompt_registry()
+    if settings.BATCH_SCHEDULER_ENABLED:
+        setup_scheduler()
     yield
     logger.info("Shutting down ESG AI Service...")
+    if settings.BATCH_SCHEDULER_ENABLED:
+        shutdown_scheduler()
+    await get_job_service().shutdown()
+    await get_llm_gateway().aclose()
+    shutdown_executor()
 
 
 def create_app() -> FastAPI:
@@ -103,6 +120,7 @@ Spring Boot 백엔드에서 호출하는 내부 AI 마이크로서비스입니
     app.include_router(carbon_router.router)
     app.include_router(chatbot_router.router)
     app.include_router(materiality_router.router)
+    app.include_router(job_router.router)
 
     # Static files for frontend
     static_dir = Path(__file__).parent.parent / "static"
@@ -146,6 +164,7 @@ Spring Boot 백엔드에서 호출하는 내부 AI 마이크로서비스입니
             "status": "healthy",
             "service": settings.APP_NAME,
             "version": settings.APP_VERSION,
+            "llm_gateway": get_llm_gateway().stats(),
         }
 
     logger.info(f"FastAPI app created: {settings.APP_NAME}")
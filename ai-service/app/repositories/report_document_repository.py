@@ -1,31 +1,136 @@
-"""Report document storage repository."""
-from typing import Any, Dict, List, Optional
-from pathlib import Path
+"""
+Report document storage repository.
+
+보고서 본문은 압축 파일(<report_id>.json.zst 또는 .json.gz)로, 메타데이터는
+SQLite 인덱스(index.sqlite3)에 저장
+- 인덱스: (company_id, year, created_at) 기준 조회/페이지네이션 (디렉토리 스캔 없음)
+- 압축: zstandard 설치 시 zstd, 없으면 gzip (읽기는 파일 확장자로 판별하므로 혼용 가능)
+- 스트리밍 읽기: iter_report_bytes()로 큰 보고서를 청크 단위로 해제하며 전송
+- 이전 형식(<report_id>.json)은 최초 기동 시 한 번 압축 + 인덱스 등록
+"""
+import asyncio
+import base64
+import gzip
 import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
 
-from app.core.logging import get_logger
+from app.config.config import settings
 from app.core.exceptions import NotFoundException
+from app.core.logging import get_logger
+
+try:
+    import zstandard
+except ImportError:  # optional: gzip fallback
+    zstandard = None
 
 logger = get_logger(__name__)
 
+CODEC_ZSTD = "zstd"
+CODEC_GZIP = "gzip"
+_CODEC_SUFFIX = {CODEC_ZSTD: ".json.zst", CODEC_GZIP: ".json.gz"}
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+REPORT_STORE_DIR = _BASE_DIR / settings.REPORT_STORE_DIR
+
+INDEX_FILE = "index.sqlite3"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _resolve_codec(codec: Optional[str]) -> str:
+    codec = (codec or settings.REPORT_STORE_CODEC).lower()
+    if codec == "auto":
+        return CODEC_ZSTD if zstandard is not None else CODEC_GZIP
+    if codec == CODEC_ZSTD and zstandard is None:
+        logger.warning("zstandard is not installed, storing reports with gzip")
+        return CODEC_GZIP
+    if codec not in _CODEC_SUFFIX:
+        raise ValueError(f"Unknown report store codec: {codec}")
+    return codec
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=settings.REPORT_STORE_COMPRESSION_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=min(9, settings.REPORT_STORE_COMPRESSION_LEVEL))
+
+
+def _open_reader(file_path: Path, codec: str) -> BinaryIO:
+    """압축 해제 스트림 (호출자가 닫음)"""
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {file_path.name}")
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True)
+    return gzip.open(file_path, "rb")
+
+
+def _report_metadata(report_id: str, content: Dict[str, Any]) -> Tuple[Optional[str], Optional[int]]:
+    """본문에서 (company_id, year) 추출 (없으면 이전 파일명 규칙 '<company_id>_...' 사용)"""
+    context = content.get("company_context") or {}
+    company_id = content.get("company_id") or context.get("company_id")
+    year = content.get("year") or context.get("year")
+    if company_id is None and "_" in report_id:
+        company_id = report_id.split("_", 1)[0]
+    try:
+        year = int(year) if year is not None else None
+    except (TypeError, ValueError):
+        year = None
+    return (str(company_id) if company_id is not None else None), year
+
+
+def _encode_cursor(created_at: str, report_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{report_id}".encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    created_at, _, report_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+    return created_at, report_id
+
 
 class ReportDocumentRepository:
     """Repository for report document storage operations."""
 
-    def __init__(self, storage_path: str = "./storage/reports") -> None:
+    def __init__(self, storage_path: str = str(REPORT_STORE_DIR), codec: Optional[str] = None) -> None:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.codec = _resolve_codec(codec)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.storage_path / INDEX_FILE), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS reports (
+                report_id TEXT PRIMARY KEY,
+                company_id TEXT,
+                year INTEGER,
+                created_at TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                size_bytes INTEGER,
+                stored_bytes INTEGER
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reports_company ON reports (company_id, year, created_at, report_id)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_created ON reports (created_at, report_id)")
+        self._conn.commit()
+        self._migrate_legacy_files()
 
     async def save_report(
         self,
         report_id: str,
         content: Dict[str, Any],
+        company_id: Optional[str] = None,
+        year: Optional[int] = None,
     ) -> str:
         """Save report document to storage."""
         try:
-            file_path = self.storage_path / f"{report_id}.json"
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(content, f, ensure_ascii=False, indent=2)
+            file_path = await asyncio.to_thread(self._write, report_id, content, company_id, year)
             logger.info(f"Saved report: {report_id}")
             return str(file_path)
         except Exception as e:
@@ -34,34 +139,210 @@ class ReportDocumentRepository:
 
     async def get_report(self, report_id: str) -> Dict[str, Any]:
         """Retrieve report document from storage."""
-        file_path = self.storage_path / f"{report_id}.json"
-        if not file_path.exists():
-            raise NotFoundException(
-                message=f"Report not found: {report_id}",
-                details={"report_id": report_id},
-            )
+        file_path, codec = self._locate(report_id)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return await asyncio.to_thread(self._read, file_path, codec)
         except Exception as e:
             logger.error(f"Failed to read report: {e}")
             raise
 
+    async def iter_report_bytes(
+        self,
+        report_id: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream the decompressed report JSON in chunks (no full-document buffering)."""
+        file_path, codec = self._locate(report_id)
+        reader = await asyncio.to_thread(_open_reader, file_path, codec)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(reader.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            reader.close()
+
+    async def get_report_metadata(self, report_id: str) -> Dict[str, Any]:
+        """Indexed metadata of a report (no body read)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT report_id, company_id, year, created_at, codec, size_bytes, stored_bytes "
+                "FROM reports WHERE report_id = ?",
+                (report_id,),
+            ).fetchone()
+        if row is None:
+            raise NotFoundException(
+                message=f"Report not found: {report_id}",
+                details={"report_id": report_id},
+            )
+        return self._row_to_metadata(row)
+
     async def list_reports(
         self,
         company_id: Optional[str] = None,
+        year: Optional[int] = None,
     ) -> List[str]:
-        """List available reports."""
-        reports = []
-        for file_path in self.storage_path.glob("*.json"):
-            report_id = file_path.stem
-            if company_id is None or report_id.startswith(company_id):
-                reports.append(report_id)
-        return reports
+        """List available reports (newest first)."""
+        page = await self.list_reports_page(company_id=company_id, year=year, limit=None)
+        return [item["report_id"] for item in page["items"]]
+
+    async def list_reports_page(
+        self,
+        company_id: Optional[str] = None,
+        year: Optional[int] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List report metadata newest first, one page at a time (keyset pagination on the index).
+
+        Returns:
+            {"items": [metadata, ...], "next_cursor": str | None}
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if company_id is not None:
+            clauses.append("company_id = ?")
+            params.append(company_id)
+        if year is not None:
+            clauses.append("year = ?")
+            params.append(year)
+        if cursor:
+            created_at, report_id = _decode_cursor(cursor)
+            clauses.append("(created_at < ? OR (created_at = ? AND report_id < ?))")
+            params.extend([created_at, created_at, report_id])
+
+        query = "SELECT report_id, company_id, year, created_at, codec, size_bytes, stored_bytes FROM reports"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC, report_id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1][3], rows[-1][0])
+        return {"items": [self._row_to_metadata(row) for row in rows], "next_cursor": next_cursor}
 
     async def delete_report(self, report_id: str) -> None:
         """Delete report document from storage."""
-        file_path = self.storage_path / f"{report_id}.json"
-        if file_path.exists():
-            file_path.unlink()
+        with self._lock:
+            row = self._conn.execute("SELECT file_name FROM reports WHERE report_id = ?", (report_id,)).fetchone()
+            self._conn.execute("DELETE FROM reports WHERE report_id = ?", (report_id,))
+            self._conn.commit()
+        if row is not None:
+            (self.storage_path / row[0]).unlink(missing_ok=True)
             logger.info(f"Deleted report: {report_id}")
+
+    # =========================================================================
+    # 내부
+    # =========================================================================
+
+    def _write(
+        self,
+        report_id: str,
+        content: Dict[str, Any],
+        company_id: Optional[str],
+        year: Optional[int],
+        created_at: Optional[str] = None,
+    ) -> Path:
+        derived_company, derived_year = _report_metadata(report_id, content)
+        company_id = company_id if company_id is not None else derived_company
+        year = year if year is not None else derived_year
+
+        data = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        compressed = _compress(data, self.codec)
+        file_name = f"{report_id}{_CODEC_SUFFIX[self.codec]}"
+        file_path = self.storage_path / file_name
+        tmp_path = file_path.with_name(file_name + ".tmp")
+        tmp_path.write_bytes(compressed)
+        tmp_path.replace(file_path)
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT file_name, created_at FROM reports WHERE report_id = ?", (report_id,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reports "
+                "(report_id, company_id, year, created_at, codec, file_name, size_bytes, stored_bytes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    report_id,
+                    company_id,
+                    year,
+                    created_at or (previous[1] if previous else datetime.now().isoformat()),
+                    self.codec,
+                    file_name,
+                    len(data),
+                    len(compressed),
+                ),
+            )
+            self._conn.commit()
+        # 코덱이 바뀐 경우 이전 본문 삭제
+        if previous is not None and previous[0] != file_name:
+            (self.storage_path / previous[0]).unlink(missing_ok=True)
+        return file_path
+
+    @staticmethod
+    def _read(file_path: Path, codec: str) -> Dict[str, Any]:
+        with _open_reader(file_path, codec) as reader:
+            return json.loads(reader.read())
+
+    def _locate(self, report_id: str) -> Tuple[Path, str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_name, codec FROM reports WHERE report_id = ?", (report_id,)
+            ).fetchone()
+        if row is None or not (self.storage_path / row[0]).exists():
+            raise NotFoundException(
+                message=f"Report not found: {report_id}",
+                details={"report_id": report_id},
+            )
+        return self.storage_path / row[0], row[1]
+
+    @staticmethod
+    def _row_to_metadata(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        report_id, company_id, year, created_at, codec, size_bytes, stored_bytes = row
+        return {
+            "report_id": report_id,
+            "company_id": company_id,
+            "year": year,
+            "created_at": created_at,
+            "codec": codec,
+            "size_bytes": size_bytes,
+            "stored_bytes": stored_bytes,
+        }
+
+    def _migrate_legacy_files(self) -> None:
+        """이전 형식(<report_id>.json) 보고서를 압축 저장소로 이전 (파일 수정 시각을 생성 시각으로 사용)"""
+        migrated = 0
+        for file_path in self.storage_path.glob("*.json"):
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = json.load(f)
+                created_at = datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                self._write(file_path.stem, content, None, None, created_at=created_at)
+                file_path.unlink()
+                migrated += 1
+            except Exception as e:
+                logger.warning(f"Failed to migrate legacy report {file_path.name}: {e}")
+        if migrated:
+            logger.info(f"Migrated {migrated} legacy reports to the indexed report store")
+
+
+# Singleton instance
+_report_document_repository: Optional[ReportDocumentRepository] = None
+
+
+def get_report_document_repository() -> ReportDocumentRepository:
+    """Get or create ReportDocumentRepository singleton."""
+    global _report_document_repository
+    if _report_document_repository is None:
+        _report_document_repository = ReportDocumentRepository()
+    return _report_document_repository
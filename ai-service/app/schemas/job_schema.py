@@ -0,0 +1,56 @@
+"""Background Job Pydantic schemas."""
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# 작업 상태
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+
+ACTIVE_JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+
+
+class JobProgress(BaseModel):
+    """Per-step job progress."""
+    step: str = Field(default="queued", description="Current step name")
+    current: int = Field(default=0, description="Completed units in current step")
+    total: int = Field(default=0, description="Total units in current step")
+    message: Optional[str] = Field(None, description="Human readable progress message")
+
+
+class JobInfo(BaseModel):
+    """Background job state (persisted for resume after restart)."""
+    job_id: str = Field(..., description="Job ID")
+    kind: str = Field(..., description="Job kind (handler name)")
+    status: str = Field(default=JOB_STATUS_QUEUED, description="queued/running/completed/failed/cancelled")
+    dedupe_key: Optional[str] = Field(None, description="Identical in-flight jobs share this key")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Job parameters")
+    progress: JobProgress = Field(default_factory=JobProgress, description="Current progress")
+    checkpoint: Dict[str, Any] = Field(default_factory=dict, description="Resume checkpoint")
+    result: Optional[Any] = Field(None, description="Job result when completed")
+    error: Optional[str] = Field(None, description="Error message when failed")
+    cancel_requested: bool = Field(default=False, description="Whether cancellation was requested")
+    resume_count: int = Field(default=0, description="Number of resumes after restart")
+    created_at: str = Field(..., description="Creation timestamp")
+    started_at: Optional[str] = Field(None, description="Start timestamp")
+    finished_at: Optional[str] = Field(None, description="Finish timestamp")
+
+
+class JobSubmitResponse(BaseModel):
+    """Response for job submission."""
+    success: bool = Field(default=True)
+    job_id: str = Field(..., description="Job ID")
+    kind: str = Field(..., description="Job kind")
+    status: str = Field(..., description="Job status")
+    deduplicated: bool = Field(default=False, description="True if an identical in-flight job was reused")
+    message: Optional[str] = None
+
+
+class JobListResponse(BaseModel):
+    """Response for job listing."""
+    success: bool = Field(default=True)
+    jobs: List[JobInfo] = Field(default_factory=list)
+    count: int = Field(default=0)
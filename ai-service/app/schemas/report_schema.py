@@ -61,6 +61,16 @@ class ReportGenerationRequest(BaseModel):
     priority_issue_ids: List[str] = Field(default_factory=list, description="Deprecated: use impact/financial fields")
     kpi_data_by_issue: Dict[str, List[KPIData]] = Field(default_factory=dict, description="KPI data by issue ID")
     language: str = Field(default="ko", description="Report language (ko/en)")
+    use_cache: bool = Field(default=True, description="Reuse cached sections whose inputs are unchanged")
+
+
+class ReportBatchRequest(BaseModel):
+    """Request for multi-company batch report generation."""
+    requests: List[ReportGenerationRequest] = Field(..., min_length=1, description="One request per company/year")
+    concurrency: Optional[int] = Field(None, ge=1, description="Shared section concurrency (default REPORT_BATCH_CONCURRENCY)")
+    sections_per_minute: Optional[int] = Field(
+        None, ge=0, description="Shared section LLM call rate limit, 0 = unlimited (default REPORT_BATCH_SECTIONS_PER_MIN)"
+    )
 
 
 class SectionData(BaseModel):
@@ -78,6 +88,17 @@ class SectionData(BaseModel):
     priority_rank: int = Field(default=1, description="Priority rank (1-5)")
     has_kpi_data: bool = Field(default=False, description="Whether KPI data is available")
     missing_kpis: List[str] = Field(default_factory=list, description="List of missing KPIs")
+    error: Optional[str] = Field(None, description="Generation error (placeholder section) if failed")
+    cached: bool = Field(default=False, description="Served from the section cache")
+
+
+class SectionTiming(BaseModel):
+    """Per-section generation timing."""
+    issue_id: str = Field(..., description="Issue ID")
+    materiality_type: str = Field(..., description="Materiality type (impact/financial)")
+    priority_rank: int = Field(..., description="Priority rank (1-5)")
+    duration_ms: int = Field(default=0, description="Section generation time in milliseconds")
+    status: str = Field(default="ok", description="ok/cached/error")
 
 
 class ProcessingMetadata(BaseModel):
@@ -90,6 +111,12 @@ class ProcessingMetadata(BaseModel):
     ai_model: str = Field(default="", description="AI model used (alias)")
     tokens_used: Optional[int] = Field(None, description="Tokens used")
     sources_used: List[str] = Field(default_factory=list, description="Data sources used")
+    section_timings: List[SectionTiming] = Field(default_factory=list, description="Per-section timings")
+    failed_sections: int = Field(default=0, description="Sections that failed and were replaced by placeholders")
+    prompt_version: Optional[str] = Field(None, description="Prompt template set version")
+    cached_sections: List[str] = Field(
+        default_factory=list, description="Sections served from cache (<materiality_type>-<issue_id>)"
+    )
 
 
 class ErrorInfo(BaseModel):
@@ -114,6 +141,18 @@ class ReportModifyRequest(BaseModel):
     company_name: str = Field(..., description="Company name")
     current_report: str = Field(..., description="Current report HTML")
     instruction: str = Field(..., description="Modification instruction")
+    section_ids: List[str] = Field(
+        default_factory=list, description="Target block ids (e.g. impact-<issue_id>); located from the instruction if empty"
+    )
+
+
+class ModifyTokenUsage(BaseModel):
+    """Token usage of a section-scoped modification vs. resending the whole report."""
+    sent_tokens: int = Field(default=0, description="Prompt tokens sent (target sections + instruction)")
+    returned_tokens: int = Field(default=0, description="Tokens returned (modified sections)")
+    full_report_tokens: int = Field(default=0, description="Estimated tokens for a whole-report round trip")
+    saved_tokens: int = Field(default=0, description="full_report_tokens - sent_tokens - returned_tokens")
+    saved_ratio: float = Field(default=0.0, description="saved_tokens / full_report_tokens")
 
 
 class ReportModifyResponse(BaseModel):
@@ -123,4 +162,8 @@ class ReportModifyResponse(BaseModel):
     modified_html: Optional[str] = Field(None, description="Modified HTML content")
     changes_summary: Optional[str] = Field(None, description="Summary of changes made")
     message: Optional[str] = Field(None, description="Status message")
+    scope: Optional[str] = Field(None, description="sections (only target blocks sent) / full (whole report sent)")
+    located_by: Optional[str] = Field(None, description="How targets were found (section_ids/name/embedding/global/all)")
+    modified_sections: List[str] = Field(default_factory=list, description="Modified block ids")
+    token_usage: Optional[ModifyTokenUsage] = Field(None, description="Token usage and savings")
     error: Optional[ErrorInfo] = Field(None, description="Error info if failed")
@@ -0,0 +1,301 @@
+"""
+Benchmark Background Jobs
+
+장시간 실행되는 벤치마킹 작업을 JobService 핸들러로 등록
+- benchmark.reanalyze_all: 전체 회사 재분석 (회사 단위 체크포인트, 재시작 후 재개)
+- benchmark.upload_and_analyze: 업로드된 PDF 일괄 분석
+- benchmark.embed_document: 단일 문서 임베딩 + SK 18개 이슈 분석
+- benchmark.migrate_index: 보고서별 벡터 스토어를 통합 벤치마킹 인덱스로 마이그레이션
+- benchmark.dedupe_uploads: 내용 해시 인덱스 도입 전 업로드된 중복 PDF 정리
+"""
+
+import asyncio
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.logging import get_logger
+from app.infra.file_storage import get_file_storage_service
+from app.infra.benchmark_index import get_benchmark_index, parse_report_year
+from app.services import benchmark_service as bs
+from app.services.benchmark_service import (
+    BENCHMARK_VECTOR_STORE_DIR,
+    LEGACY_CACHE_FILE,
+    LEGACY_UPLOADS_DIR,
+    LEGACY_VECTOR_STORE_DIR,
+    ProgressCallback,
+    get_benchmark_service,
+)
+from app.services.job_service import JobContext, register_job_handler
+
+logger = get_logger(__name__)
+
+JOB_KIND_REANALYZE_ALL = "benchmark.reanalyze_all"
+JOB_KIND_UPLOAD_AND_ANALYZE = "benchmark.upload_and_analyze"
+JOB_KIND_EMBED_DOCUMENT = "benchmark.embed_document"
+JOB_KIND_MIGRATE_INDEX = "benchmark.migrate_index"
+JOB_KIND_DEDUPE_UPLOADS = "benchmark.dedupe_uploads"
+
+
+# =============================================================================
+# 공통 유틸리티
+# =============================================================================
+
+
+def summarize_issue_coverage(result: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """이슈별 분석 결과 요약 (Yes/Partially/No 개수, 커버리지율)"""
+    total = len(result) or len(bs.SK_INC_18_ISSUES)
+    yes_count = sum(1 for r in result.values() if r["coverage"] == "Yes")
+    partially_count = sum(1 for r in result.values() if r["coverage"] == "Partially")
+    no_count = sum(1 for r in result.values() if r["coverage"] == "No")
+    return {
+        "total_issues": total,
+        "full_coverage": yes_count,
+        "partial_coverage": partially_count,
+        "no_coverage": no_count,
+        "coverage_rate": round((yes_count + partially_count * 0.5) / total * 100, 1),
+    }
+
+
+def collect_latest_company_pdfs(uploads_dir: Path) -> Dict[str, Path]:
+    """업로드 폴더에서 회사별 최신 PDF 수집 (파일명 타임스탬프 제거로 회사명 추출)"""
+    company_pdfs: Dict[str, Path] = {}
+    for pdf_file in uploads_dir.glob("*.pdf"):
+        filename = pdf_file.name
+        parts = filename.rsplit("_", 2)
+        if len(parts) >= 3 and parts[-1].endswith(".pdf"):
+            company_name = parts[0]
+        else:
+            company_name = filename.rsplit(".", 1)[0]
+
+        if company_name not in company_pdfs or pdf_file.stat().st_mtime > company_pdfs[company_name].stat().st_mtime:
+            company_pdfs[company_name] = pdf_file
+    return company_pdfs
+
+
+def reset_analysis_cache() -> Optional[Path]:
+    """분석 캐시 백업 후 비우고 서비스 재초기화. 백업 경로 반환"""
+    backup_path = None
+    if LEGACY_CACHE_FILE.exists():
+        backup_path = LEGACY_CACHE_FILE.with_suffix(".json.bak")
+        shutil.copy(LEGACY_CACHE_FILE, backup_path)
+        logger.info(f"Backed up cache to {backup_path}")
+
+        with open(LEGACY_CACHE_FILE, "w") as f:
+            f.write("{}")
+        logger.info("Cleared cache file")
+
+    bs._benchmark_service = None
+    return backup_path
+
+
+def _company_progress(ctx: JobContext, done: int, total: int) -> ProgressCallback:
+    """analyze_company_issues 단계 이벤트를 작업 진행률로 변환"""
+    def _on_progress(step: str, payload: Dict[str, Any]) -> None:
+        message = f"{payload['company']}: {step}"
+        if step == "issue_matched":
+            message += f" ({payload['index']}/{payload['total']} {payload['issue']})"
+        ctx.report_progress("analyze", current=done, total=total, message=message)
+    return _on_progress
+
+
+async def _analyze_companies(
+    ctx: JobContext,
+    companies: List[Dict[str, str]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    회사 목록을 순서대로 분석하며 회사 단위로 체크포인트 저장
+
+    Returns:
+        {"completed": {name: result}, "failed": {name: error}}
+    """
+    service = get_benchmark_service()
+    completed: Dict[str, Any] = ctx.checkpoint.get("completed", {})
+    failed: Dict[str, str] = ctx.checkpoint.get("failed", {})
+    total = len(companies)
+
+    for company in companies:
+        company_name = company["company_name"]
+        if company_name in completed:
+            continue
+
+        ctx.check_cancelled()
+        done = len(completed) + len(failed)
+        ctx.report_progress("analyze", current=done, total=total, message=company_name)
+
+        try:
+            logger.info(f"Analyzing {company_name}...")
+            result = await service.analyze_company_issues(
+                company["path"], company_name, progress=_company_progress(ctx, done, total)
+            )
+            completed[company_name] = result
+            failed.pop(company_name, None)
+        except Exception as e:
+            logger.error(f"Failed to analyze {company_name}: {e}")
+            failed[company_name] = str(e)
+
+        ctx.save_checkpoint(completed=completed, failed=failed)
+
+    ctx.report_progress("done", current=total, total=total)
+    return {"completed": completed, "failed": failed}
+
+
+# =============================================================================
+# 작업 핸들러
+# =============================================================================
+
+
+async def run_reanalyze_all(ctx: JobContext) -> Dict[str, Any]:
+    """기존 벤치마킹 폴더의 모든 PDF를 18개 이슈 기준으로 재분석"""
+    # 1. 캐시 초기화 (재개 시에는 이미 분석된 회사 결과를 유지)
+    if not ctx.checkpoint.get("cache_reset"):
+        ctx.report_progress("reset_cache")
+        backup_path = reset_analysis_cache()
+        ctx.save_checkpoint(cache_reset=True, backup_path=str(backup_path) if backup_path else None)
+
+    # 2. 회사별 최신 PDF 수집
+    if not LEGACY_UPLOADS_DIR.exists():
+        raise FileNotFoundError(f"업로드 폴더가 없습니다: {LEGACY_UPLOADS_DIR}")
+
+    company_pdfs = collect_latest_company_pdfs(LEGACY_UPLOADS_DIR)
+    logger.info(f"Found {len(company_pdfs)} companies to analyze")
+
+    # 3. 회사별 재분석
+    outcome = await _analyze_companies(
+        ctx,
+        [{"company_name": name, "path": str(path)} for name, path in sorted(company_pdfs.items())],
+    )
+
+    service = get_benchmark_service()
+    success_companies = [
+        {"name": name, "yes_count": service.get_company_coverage_counts(name)["Yes"]}
+        for name in outcome["completed"]
+    ]
+    failed_companies = [{"name": name, "error": error} for name, error in outcome["failed"].items()]
+
+    return {
+        "success": True,
+        "message": f"{len(success_companies)}개 회사 재분석 완료",
+        "analyzed": len(success_companies),
+        "failed": len(failed_companies),
+        "success_companies": success_companies,
+        "failed_companies": failed_companies,
+    }
+
+
+async def run_upload_and_analyze(ctx: JobContext) -> Dict[str, Any]:
+    """업로드된 PDF들을 SK 18개 이슈 기준으로 분석"""
+    outcome = await _analyze_companies(ctx, ctx.params["files"])
+    return {
+        "success": True,
+        "count": len(outcome["completed"]),
+        "success_companies": list(outcome["completed"].keys()),
+        "failed_companies": list(outcome["failed"].keys()),
+        "data": outcome["completed"],
+    }
+
+
+async def run_embed_document(ctx: JobContext) -> Dict[str, Any]:
+    """단일 문서 임베딩 및 SK 18개 이슈 분석"""
+    params = ctx.params
+    outcome = await _analyze_companies(
+        ctx, [{"company_name": params["company_name"], "path": params["path"]}]
+    )
+    if params["company_name"] in outcome["failed"]:
+        raise RuntimeError(outcome["failed"][params["company_name"]])
+
+    summary = summarize_issue_coverage(outcome["completed"][params["company_name"]])
+    logger.info(
+        f"Analysis completed for {params['company_name']}: Yes={summary['full_coverage']}, "
+        f"Partially={summary['partial_coverage']}, No={summary['no_coverage']}"
+    )
+
+    return {
+        "success": True,
+        "document_id": params["document_id"],
+        "company_name": params["company_name"],
+        "status": "embedded",
+        "message": f"Document {params['document_name']} analyzed successfully",
+        "summary": summary,
+    }
+
+
+async def run_migrate_index(ctx: JobContext) -> Dict[str, Any]:
+    """보고서별 벡터 스토어(<hash> 디렉토리)를 통합 인덱스로 복사 (보고서 단위 체크포인트)"""
+    service = get_benchmark_service()
+    index = get_benchmark_index()
+
+    # 보고서 해시 → 회사 (업로드 폴더의 PDF 기준)
+    company_pdfs = collect_latest_company_pdfs(LEGACY_UPLOADS_DIR) if LEGACY_UPLOADS_DIR.exists() else {}
+    owners = {}
+    for company_name, pdf_path in company_pdfs.items():
+        report_hash = await asyncio.to_thread(service.get_report_hash, str(pdf_path))
+        owners[report_hash] = (company_name, parse_report_year(pdf_path.stem))
+
+    store_dirs = sorted(
+        {d for base in (LEGACY_VECTOR_STORE_DIR, BENCHMARK_VECTOR_STORE_DIR) if base.exists()
+         for d in base.iterdir() if d.is_dir()},
+        key=lambda d: d.name,
+    )
+    migrated: Dict[str, int] = ctx.checkpoint.get("migrated", {})
+    failed: Dict[str, str] = ctx.checkpoint.get("failed", {})
+    unmatched: List[str] = []
+    total = len(store_dirs)
+
+    for i, store_dir in enumerate(store_dirs):
+        report_hash = store_dir.name
+        if report_hash in migrated or index.has_report(report_hash):
+            continue
+        if report_hash not in owners:
+            unmatched.append(report_hash)
+            continue
+
+        ctx.check_cancelled()
+        company_name, year = owners[report_hash]
+        ctx.report_progress("migrate", current=i, total=total, message=company_name)
+        try:
+            migrated[report_hash] = await asyncio.to_thread(
+                service.migrate_report_store, store_dir, company_name, year
+            )
+            failed.pop(report_hash, None)
+        except Exception as e:
+            logger.error(f"Failed to migrate vector store {report_hash} ({company_name}): {e}")
+            failed[report_hash] = str(e)
+        ctx.save_checkpoint(migrated=migrated, failed=failed)
+
+    ctx.report_progress("done", current=total, total=total)
+    return {
+        "success": True,
+        "migrated": len(migrated),
+        "chunks": sum(migrated.values()),
+        "failed": failed,
+        "unmatched": unmatched,
+        "indexed_reports": len(index.list_reports()),
+    }
+
+
+async def run_dedupe_uploads(ctx: JobContext) -> Dict[str, Any]:
+    """
+    기존 중복 업로드 정리 작업
+
+    manifest에 없는 PDF를 해시해 등록하고, 같은 내용의 사본은 삭제 후 문서 ID를 별칭으로 남깁니다.
+    dry_run이면 삭제 없이 대상과 회수 가능한 용량만 보고합니다.
+    """
+    dry_run = bool(ctx.params.get("dry_run", False))
+    index = get_file_storage_service().benchmark_index
+
+    ctx.report_progress("hash")
+    hashed = await asyncio.to_thread(index.hash_untracked)
+    ctx.check_cancelled()
+
+    ctx.report_progress("dedupe", current=0, total=len(hashed))
+    result = index.deduplicate_existing(hashed, dry_run=dry_run)
+    ctx.report_progress("done", current=len(hashed), total=len(hashed))
+    return {"success": True, **result}
+
+
+register_job_handler(JOB_KIND_REANALYZE_ALL, run_reanalyze_all)
+register_job_handler(JOB_KIND_UPLOAD_AND_ANALYZE, run_upload_and_analyze)
+register_job_handler(JOB_KIND_EMBED_DOCUMENT, run_embed_document)
+register_job_handler(JOB_KIND_MIGRATE_INDEX, run_migrate_index)
+register_job_handler(JOB_KIND_DEDUPE_UPLOADS, run_dedupe_uploads)
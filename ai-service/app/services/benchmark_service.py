@@ -6,20 +6,36 @@ ESG Benchmark Analysis Service
 - SK Inc. 17개 이슈풀 기반 이중중대성 분석
 """
 
+import asyncio
+import contextvars
+import functools
 import hashlib
 import json
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
-import pdfplumber
-from langchain.chains import RetrievalQA
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Chroma
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.config.config import settings
 from app.core.logging import get_logger
+from app.infra.benchmark_index import get_benchmark_index, parse_report_year
+from app.infra.chunk_embedding_store import chunk_hash, get_chunk_embedding_store
+from app.infra.vector_store_pool import get_vector_store_pool
+from app.llm.clients.embedding_provider import get_embeddings, provider_id
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.services.coverage_matrix import CoverageMatrix, count_coverage
+from app.utils.keyword_index import PageKeywordIndex
+from app.utils.lru_cache import LRUCache
+from app.utils.pdf_extractor import extract_pages
+from app.utils.evidence_packer import PackedEvidence, pack_evidence
 
 logger = get_logger(__name__)
 
@@ -34,6 +50,7 @@ DATA_DIR = _BASE_DIR / settings.DATA_DIR
 BENCHMARK_VECTOR_STORE_DIR = _BASE_DIR / settings.BENCHMARK_VECTORS_DIR
 BENCHMARK_UPLOADS_DIR = _BASE_DIR / settings.BENCHMARK_UPLOADS_DIR
 BENCHMARK_CACHE_FILE = _BASE_DIR / settings.BENCHMARK_CACHE_FILE
+BENCHMARK_PAGES_DIR = _BASE_DIR / settings.BENCHMARK_PAGES_DIR
 
 # Legacy 경로는 환경변수로 설정 가능 (없으면 기본 경로 사용)
 LEGACY_BENCHMARK_DIR = Path(os.environ.get("LEGACY_BENCHMARK_DIR", str(BENCHMARK_UPLOADS_DIR)))
@@ -44,6 +61,47 @@ LEGACY_CACHE_FILE = LEGACY_BENCHMARK_DIR / "analysis_cache.json" if LEGACY_BENCH
 # 디렉토리 생성
 BENCHMARK_VECTOR_STORE_DIR.mkdir(parents=True, exist_ok=True)
 BENCHMARK_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+BENCHMARK_PAGES_DIR.mkdir(parents=True, exist_ok=True)
+
+CHROMA_ADD_BATCH_SIZE = 1000
+
+# 벡터 스토어 임베딩 메타데이터 (스토어 디렉토리 내 사이드카 파일)
+STORE_METADATA_FILE = "embedding_provider.json"
+# 메타데이터가 없는 기존 스토어는 OpenAI text-embedding-3-small로 생성됨
+LEGACY_EMBEDDING_PROVIDER_ID = "openai:text-embedding-3-small"
+
+# 검색 근거 QA 프롬프트 (LangChain RetrievalQA "stuff" 체인 기본 프롬프트와 동일)
+QA_SYSTEM_PROMPT = (
+    "Use the following pieces of context to answer the user's question. \n"
+    "If you don't know the answer, just say that you don't know, don't try to make up an answer.\n"
+    "----------------\n{context}"
+)
+
+# 분석 1회 동안의 근거 패킹 통계 (동시 실행되는 분석끼리 섞이지 않도록 컨텍스트 변수 사용)
+_packing_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar("benchmark_packing_stats", default=None)
+
+
+def _new_packing_stats() -> Dict[str, int]:
+    return {"calls": 0, "input_chunks": 0, "packed_chunks": 0, "input_tokens": 0, "packed_tokens": 0, "tokens_saved": 0}
+
+
+# 벤치마킹 블로킹 작업(PDF 추출/임베딩/검색) 전용 스레드 풀
+# asyncio.wait_for 시간 초과는 대기만 포기할 뿐 실행 중인 스레드 작업을 멈추지 못하므로,
+# 시간 초과된 작업이 남아 있어도 기본 스레드 풀(다른 서비스의 to_thread)을 점유하지 않도록 분리
+_blocking_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.BENCHMARK_WORKER_THREADS), thread_name_prefix="benchmark"
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """asyncio.to_thread와 같되 벤치마킹 전용 스레드 풀에서 실행 (컨텍스트 변수 전달)"""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args)
+    return await loop.run_in_executor(_blocking_executor, call)
+
+
+# 분석 단계별 진행 콜백: (step, payload) - step은 extracted/embedded/materiality_found/issue_matched/done
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
 
 # =============================================================================
 # SK Inc. 18개 이슈풀 (2024년 기준)
@@ -156,18 +214,26 @@ class BenchmarkService:
 
     def __init__(self):
         """Initialize Benchmark Service."""
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.OPENAI_EMBEDDING_MODEL,
-            openai_api_key=settings.OPENAI_API_KEY,
-        )
-        self.llm = ChatOpenAI(
+        self.embedding_provider = provider_id()
+        self.llm = get_llm_gateway().chat_model(
             model=settings.OPENAI_MODEL,
-            openai_api_key=settings.OPENAI_API_KEY,
             temperature=0,
             max_tokens=1000,
         )
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # (path, mtime, size) → PDF 해시 (호출마다 파일 전체를 다시 읽지 않도록)
+        self._hash_cache: Dict[Tuple[str, float, int], str] = {}
+        # 보고서 해시 → 페이지 텍스트 (최근 보고서만 메모리에, 전체는 디스크 캐시: BENCHMARK_PAGES_DIR/<hash>.json)
+        self._page_cache: LRUCache[List[Dict[str, Any]]] = LRUCache(settings.BENCHMARK_PAGE_CACHE_SIZE)
+        self._packing_totals: Dict[str, int] = _new_packing_stats()
+        # 보고서 해시 → 페이지 키워드 역색인 (LLM 호출 전 키워드 사전 검사, 최근 보고서만 유지)
+        self._keyword_indexes: LRUCache[PageKeywordIndex] = LRUCache(settings.BENCHMARK_KEYWORD_INDEX_CACHE_SIZE)
+        self._store_pool = get_vector_store_pool()
+        # 임베딩 provider가 달라 통합 인덱스 등록을 미룬 보고서 해시 (로그 1회용)
+        self._index_deferred: Set[str] = set()
         self._load_legacy_cache()
+        self._coverage_matrix = CoverageMatrix(SK_INC_18_ISSUES)
+        self._coverage_matrix.rebuild(self._analysis_cache)
         logger.info("BenchmarkService initialized")
 
     def _load_legacy_cache(self):
@@ -192,20 +258,63 @@ class BenchmarkService:
             logger.error(f"Failed to save cache: {e}")
 
     def _extract_text_from_pdf(self, pdf_path: str) -> List[Dict[str, Any]]:
-        """PDF에서 텍스트 추출"""
-        text_content = []
+        """PDF에서 텍스트 추출 (공용 추출 엔진, 텍스트 있는 페이지만)"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        text_content.append({"page": i + 1, "text": text})
+            return extract_pages(pdf_path)
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
+            return []
+
+    def get_page_texts(self, pdf_path: str) -> List[Dict[str, Any]]:
+        """페이지별 텍스트 반환 (보고서 해시 기준 메모리/디스크 캐시, 없으면 PDF 추출)"""
+        pdf_hash = self._get_pdf_hash(pdf_path)
+        cached = self._page_cache.get(pdf_hash)
+        if cached is not None:
+            return cached
+
+        cache_path = BENCHMARK_PAGES_DIR / f"{pdf_hash}.json"
+        if cache_path.exists():
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    return self._page_cache.put(pdf_hash, json.load(f))
+            except Exception as e:
+                logger.warning(f"Invalid page text cache {cache_path}: {e}")
+
+        text_content = self._extract_text_from_pdf(pdf_path)
+        if text_content:
+            self._page_cache.put(pdf_hash, text_content)
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(text_content, f, ensure_ascii=False)
+            except Exception as e:
+                logger.warning(f"Failed to write page text cache {cache_path}: {e}")
         return text_content
 
+    def get_keyword_index(self, pdf_path: str, text_content: List[Dict[str, Any]]) -> PageKeywordIndex:
+        """
+        보고서 페이지 키워드 역색인 (보고서당 1회 생성, ISSUE_KEYWORDS 기본 색인)
+
+        ad-hoc 키워드는 조회 시 PageKeywordIndex.ensure로 추가 색인됩니다.
+        """
+        pdf_hash = self._get_pdf_hash(pdf_path)
+
+        def _build() -> PageKeywordIndex:
+            keywords = list(SK_INC_18_ISSUES)
+            keywords += [kw for kws in ISSUE_KEYWORDS.values() for kw in kws]
+            return PageKeywordIndex(text_content, keywords)
+
+        return self._keyword_indexes.get_or_create(pdf_hash, _build)
+
     def _get_pdf_hash(self, pdf_path: str) -> str:
         """PDF 파일의 해시값 생성 (캐싱용)"""
+        try:
+            stat = os.stat(pdf_path)
+            hash_key = (os.path.abspath(pdf_path), stat.st_mtime, stat.st_size)
+        except OSError:
+            hash_key = None
+        if hash_key in self._hash_cache:
+            return self._hash_cache[hash_key]
+
         hash_md5 = hashlib.md5()
         try:
             with open(pdf_path, "rb") as f:
@@ -214,7 +323,10 @@ class BenchmarkService:
         except Exception as e:
             logger.error(f"Error hashing {pdf_path}: {e}")
             return hashlib.md5(pdf_path.encode()).hexdigest()[:16]
-        return hash_md5.hexdigest()[:16]
+        pdf_hash = hash_md5.hexdigest()[:16]
+        if hash_key is not None:
+            self._hash_cache[hash_key] = pdf_hash
+        return pdf_hash
 
     def _detect_language(self, text_content: List[Dict[str, Any]]) -> str:
         """보고서 언어 감지 (한국어 vs 영어)"""
@@ -228,30 +340,201 @@ class BenchmarkService:
         korean_ratio = korean_chars / total_chars
         return "ko" if korean_ratio > 0.1 else "en"
 
-    def _get_vector_store(self, pdf_path: str, text_content: List[Dict[str, Any]]) -> Chroma:
-        """벡터 스토어 로드 또는 생성 (기존 데이터 우선 사용)"""
+    def _read_store_provider(self, persist_dir: Path) -> str:
+        """스토어 생성에 사용된 임베딩 provider id 조회 (메타데이터 없으면 기존 OpenAI 스토어)"""
+        metadata_path = persist_dir / STORE_METADATA_FILE
+        if metadata_path.exists():
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    return json.load(f)["provider"]
+            except Exception as e:
+                logger.warning(f"Invalid store metadata {metadata_path}: {e}")
+        return LEGACY_EMBEDDING_PROVIDER_ID
+
+    def _write_store_provider(self, persist_dir: Path, pid: str, chunk_count: int) -> None:
+        """스토어 생성 시 임베딩 provider id 기록"""
+        with open(persist_dir / STORE_METADATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(
+                {"provider": pid, "chunks": chunk_count, "created_at": datetime.now().isoformat()},
+                f,
+                ensure_ascii=False,
+            )
+
+    def _record_store_source(self, persist_dir: Path, pdf_path: str) -> None:
+        """
+        업로드 폴더 밖의 PDF로 연 스토어의 원본 경로 기록 (메타데이터 sources)
+
+        벡터 스토어 GC는 업로드 폴더의 PDF만 참조로 세므로, pdf_path로 직접 분석한
+        보고서는 이 경로가 남아 있는 동안 참조로 취급합니다.
+        """
+        source = Path(pdf_path).resolve()
+        if source.parent in {BENCHMARK_UPLOADS_DIR.resolve(), LEGACY_UPLOADS_DIR.resolve()}:
+            return
+        metadata_path = persist_dir / STORE_METADATA_FILE
+        metadata: Dict[str, Any] = {"provider": LEGACY_EMBEDDING_PROVIDER_ID}
+        if metadata_path.exists():
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+            except Exception as e:
+                logger.warning(f"Invalid store metadata {metadata_path}: {e}")
+                return
+        sources = metadata.setdefault("sources", [])
+        if str(source) in sources:
+            return
+        sources.append(str(source))
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False)
+
+    def get_store_sources(self, persist_dir: Path) -> List[str]:
+        """스토어 메타데이터에 기록된 업로드 폴더 밖 원본 PDF 경로"""
+        metadata_path = persist_dir / STORE_METADATA_FILE
+        if not metadata_path.exists():
+            return []
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                return list(json.load(f).get("sources", []))
+        except Exception:
+            return []
+
+    def _load_vector_store(self, persist_dir: Path) -> Chroma:
+        """기존 스토어를 생성 당시의 임베딩 모델로 로드"""
+        pid = self._read_store_provider(persist_dir)
+        if pid != self.embedding_provider:
+            logger.info(f"Store {persist_dir.name} uses {pid} (configured: {self.embedding_provider})")
+        return Chroma(
+            persist_directory=str(persist_dir),
+            embedding_function=get_embeddings(pid),
+        )
+
+    def _acquire_vector_store(
+        self,
+        pdf_path: str,
+        text_content: List[Dict[str, Any]],
+        company_name: Optional[str] = None,
+    ) -> Tuple[str, Chroma]:
+        """
+        벡터 스토어를 풀에서 빌려옴 (열린 스토어 우선, 없으면 로드 또는 생성)
+
+        Returns:
+            (보고서 해시, 스토어) - 사용 후 self._store_pool.release(해시, 스토어) 필수
+        """
         pdf_hash = self._get_pdf_hash(pdf_path)
+        vectorstore = self._store_pool.acquire(
+            pdf_hash, lambda: self._open_vector_store(pdf_hash, text_content)
+        )
+        try:
+            self._record_store_source(Path(vectorstore._persist_directory), pdf_path)
+        except OSError as e:
+            logger.warning(f"Failed to record source of vector store {pdf_hash}: {e}")
+        if company_name:
+            self.index_report_store(
+                vectorstore, pdf_hash, company_name,
+                parse_report_year(Path(pdf_path).stem) or parse_report_year(company_name),
+            )
+        return pdf_hash, vectorstore
 
-        # 1. 기존 벤치마킹 폴더에서 먼저 찾기
-        legacy_persist_dir = LEGACY_VECTOR_STORE_DIR / pdf_hash
-        if legacy_persist_dir.exists() and list(legacy_persist_dir.iterdir()):
-            logger.info(f"Loading existing vector DB from legacy: {pdf_hash}")
-            return Chroma(
-                persist_directory=str(legacy_persist_dir),
-                embedding_function=self.embeddings,
+    def _ensure_vector_store(
+        self,
+        pdf_path: str,
+        text_content: List[Dict[str, Any]],
+        company_name: Optional[str] = None,
+    ) -> None:
+        """벡터 스토어 생성/로드 및 통합 인덱스 등록만 수행"""
+        pdf_hash, vectorstore = self._acquire_vector_store(pdf_path, text_content, company_name)
+        self._store_pool.release(pdf_hash, vectorstore)
+
+    @asynccontextmanager
+    async def _vector_store(
+        self,
+        pdf_path: str,
+        text_content: List[Dict[str, Any]],
+        company_name: Optional[str] = None,
+    ) -> AsyncIterator[Chroma]:
+        """async with 블록 동안 풀의 벡터 스토어를 빌려옴 (사용 중에는 축출되지 않음)"""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(
+            contextvars.copy_context().run, self._acquire_vector_store, pdf_path, text_content, company_name
+        )
+        future = loop.run_in_executor(_blocking_executor, call)
+        try:
+            pdf_hash, vectorstore = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 로드 중 취소: 스레드가 끝나면 빌린 스토어 반환
+            future.add_done_callback(
+                lambda f: None if f.cancelled() or f.exception() else self._store_pool.release(*f.result())
             )
+            raise
+        try:
+            yield vectorstore
+        finally:
+            self._store_pool.release(pdf_hash, vectorstore)
+
+    def index_report_store(
+        self,
+        vectorstore: Chroma,
+        report_hash: str,
+        company_name: str,
+        year: Optional[int],
+    ) -> bool:
+        """
+        보고서별 스토어를 통합 벤치마킹 인덱스에 등록 (이미 등록된 경우 무시)
+
+        보고서별 스토어는 단일 보고서 분석의 읽기 경로로 계속 사용되고, 통합 인덱스는
+        회사 간 검색용 사본입니다 (청크가 두 곳에 저장되며 삭제/GC 시 함께 정리).
 
-        # 2. ai-service 데이터 폴더에서 찾기
+        분석 요청 경로에서 호출되므로 벡터 복사만 수행합니다. 스토어의 임베딩 provider가
+        인덱스와 다르면(BENCHMARK_EMBEDDING_PROVIDER 변경 후) 재임베딩하지 않고 건너뛰며,
+        재임베딩은 benchmark.migrate_index 작업(POST /jobs/index/migrate)이 담당합니다.
+        """
+        index = get_benchmark_index()
+        if index.has_report(report_hash):
+            return False
+        try:
+            store_provider = self._read_store_provider(Path(vectorstore._persist_directory))
+            if store_provider != index.provider:
+                if report_hash not in self._index_deferred:
+                    self._index_deferred.add(report_hash)
+                    logger.info(
+                        f"Skipped benchmark index for {company_name} ({report_hash}): store embeddings "
+                        f"{store_provider} != index {index.provider}; run /jobs/index/migrate to re-embed"
+                    )
+                return False
+            index.import_store(vectorstore, store_provider, report_hash, company_name, year)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to add {company_name} ({report_hash}) to benchmark index: {e}")
+            return False
+
+    def find_report_store(self, pdf_hash: str) -> Optional[Path]:
+        """이미 생성된 보고서 벡터 스토어 디렉토리 (기존 벤치마킹 폴더 우선, 없으면 None)"""
+        for persist_dir in (LEGACY_VECTOR_STORE_DIR / pdf_hash, BENCHMARK_VECTOR_STORE_DIR / pdf_hash):
+            if persist_dir.exists() and any(persist_dir.iterdir()):
+                return persist_dir
+        return None
+
+    def _open_vector_store(self, pdf_hash: str, text_content: List[Dict[str, Any]]) -> Tuple[Chroma, Path]:
+        """벡터 스토어 로드 또는 생성 (기존 데이터 우선 사용)"""
+        persist_dir = self.find_report_store(pdf_hash)
+        if persist_dir is not None:
+            logger.info(f"Loading existing vector DB: {persist_dir}")
+            vectorstore = self._load_vector_store(persist_dir)
+            if settings.BENCHMARK_CHUNK_REUSE:
+                # 기능 도입 전 스토어의 벡터도 다음 버전 보고서에서 재사용 (스토어당 1회)
+                try:
+                    get_chunk_embedding_store().seed_from_store(
+                        vectorstore, self._read_store_provider(persist_dir), pdf_hash
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to seed chunk embeddings from {pdf_hash}: {e}")
+            return vectorstore, persist_dir
+
+        logger.info(f"Creating new vector DB: {pdf_hash} (embeddings: {self.embedding_provider})")
         new_persist_dir = BENCHMARK_VECTOR_STORE_DIR / pdf_hash
-        if new_persist_dir.exists() and list(new_persist_dir.iterdir()):
-            logger.info(f"Loading existing vector DB: {pdf_hash}")
-            return Chroma(
-                persist_directory=str(new_persist_dir),
-                embedding_function=self.embeddings,
-            )
+        return self.create_chunk_store(text_content, new_persist_dir), new_persist_dir
 
-        # 3. 새로 생성
-        logger.info(f"Creating new vector DB: {pdf_hash}")
+    def create_chunk_store(self, text_content: List[Dict[str, Any]], persist_dir: Path) -> Chroma:
+        """페이지 텍스트를 청크로 나눠 임베딩한 스토어 생성 (생성 provider 기록)"""
         text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=2000,
             chunk_overlap=200,
@@ -269,63 +552,260 @@ class BenchmarkService:
 
         logger.info(f"Creating vector DB with {len(documents)} chunks")
 
-        vectorstore = Chroma.from_texts(
-            texts=documents,
-            embedding=self.embeddings,
-            metadatas=metadatas,
-            persist_directory=str(new_persist_dir),
-        )
+        embeddings = get_embeddings(self.embedding_provider)
+        if settings.BENCHMARK_CHUNK_REUSE:
+            vectors = self._embed_with_reuse(documents, metadatas, persist_dir.name)
+        else:
+            vectors = embeddings.embed_documents(documents)
+
+        vectorstore = Chroma(persist_directory=str(persist_dir), embedding_function=embeddings)
+        for start in range(0, len(documents), CHROMA_ADD_BATCH_SIZE):
+            end = start + CHROMA_ADD_BATCH_SIZE
+            vectorstore._collection.add(
+                ids=[str(uuid.uuid4()) for _ in range(start, min(end, len(documents)))],
+                embeddings=vectors[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+            )
+        self._write_store_provider(persist_dir, self.embedding_provider, len(documents))
         return vectorstore
 
+    def _embed_with_reuse(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        report_hash: str,
+    ) -> List[List[float]]:
+        """
+        청크 해시 기준으로 공유 임베딩 재사용, 바뀐 청크만 새로 임베딩
+
+        재사용한 청크의 메타데이터에는 처음 임베딩한 보고서 해시(reused_from)를 남깁니다.
+        """
+        chunk_store = get_chunk_embedding_store()
+        hashes = [chunk_hash(doc) for doc in documents]
+        cached = chunk_store.get_many(self.embedding_provider, hashes)
+
+        missing = list(dict.fromkeys(h for h in hashes if h not in cached))
+        first_index = {h: i for i, h in reversed(list(enumerate(hashes)))}
+        if missing:
+            fresh = get_embeddings(self.embedding_provider).embed_documents(
+                [documents[first_index[h]] for h in missing]
+            )
+            chunk_store.put_many(
+                self.embedding_provider,
+                [(h, vector, report_hash, metadatas[first_index[h]].get("page")) for h, vector in zip(missing, fresh)],
+            )
+            cached.update({
+                h: {"embedding": vector, "report_hash": report_hash}
+                for h, vector in zip(missing, fresh)
+            })
+
+        for h, metadata in zip(hashes, metadatas):
+            metadata["chunk_hash"] = h
+            origin = cached[h].get("report_hash")
+            if origin and origin != report_hash:
+                metadata["reused_from"] = origin
+
+        reused = len(documents) - len(missing)
+        logger.info(
+            f"Chunk embeddings for {report_hash}: {reused}/{len(documents)} reused, {len(missing)} embedded"
+        )
+        return [cached[h]["embedding"] for h in hashes]
+
+    def migrate_report_store(self, store_dir: Path, company_name: str, year: Optional[int]) -> int:
+        """
+        보고서별 스토어 디렉토리를 통합 인덱스로 마이그레이션
+
+        Returns:
+            복사된 청크 수
+        """
+        if not (store_dir / "chroma.sqlite3").exists():
+            raise FileNotFoundError(f"Incomplete vector store (chroma.sqlite3 missing): {store_dir}")
+        vectorstore = self._load_vector_store(store_dir)
+        return get_benchmark_index().import_store(
+            vectorstore, self._read_store_provider(store_dir), store_dir.name, company_name, year
+        )
+
+    def _record_packing(self, packed: PackedEvidence) -> None:
+        """근거 패킹 통계 누적 (현재 분석 + 서비스 전체)"""
+        for stats in (_packing_stats.get(), self._packing_totals):
+            if stats is None:
+                continue
+            stats["calls"] += 1
+            stats["input_chunks"] += packed.input_chunks
+            stats["packed_chunks"] += packed.packed_chunks
+            stats["input_tokens"] += packed.input_tokens
+            stats["packed_tokens"] += packed.packed_tokens
+            stats["tokens_saved"] += packed.tokens_saved
+
+    def get_report_cache_stats(self) -> Dict[str, Any]:
+        """보고서 단위 메모리 캐시(페이지 텍스트, 키워드 역색인) 사용량"""
+        return {"page_texts": self._page_cache.stats(), "keyword_indexes": self._keyword_indexes.stats()}
+
+    def get_packing_stats(self) -> Dict[str, int]:
+        """서비스 시작 이후 누적 근거 패킹 통계"""
+        return dict(self._packing_totals)
+
+    async def _run_retrieval_qa(self, retriever, query: str) -> Dict[str, Any]:
+        """
+        검색 → 근거 패킹 → LLM 답변
+
+        검색된 청크를 그대로 넣지 않고 중복/겹침 제거, MMR 다양화 후 토큰 예산
+        (BENCHMARK_EVIDENCE_TOKEN_BUDGET)에 맞춰 프롬프트에 넣습니다.
+        source_documents는 후속 페이지/키워드 판정을 위해 검색 결과 원본을 반환합니다.
+        """
+        source_docs = await _run_blocking(retriever.invoke, query)
+        packed = await _run_blocking(
+            pack_evidence,
+            source_docs,
+            settings.BENCHMARK_EVIDENCE_TOKEN_BUDGET,
+            settings.BENCHMARK_EVIDENCE_MMR_LAMBDA,
+            settings.BENCHMARK_EVIDENCE_DEDUP_THRESHOLD,
+            settings.OPENAI_MODEL,
+        )
+        self._record_packing(packed)
+
+        context = "\n\n".join(doc.page_content for doc in packed.documents)
+        response = await self.llm.ainvoke([
+            SystemMessage(content=QA_SYSTEM_PROMPT.format(context=context)),
+            HumanMessage(content=query),
+        ])
+        return {
+            "result": response.content,
+            "source_documents": source_docs,
+            "packing": {"input_tokens": packed.input_tokens, "packed_tokens": packed.packed_tokens,
+                        "tokens_saved": packed.tokens_saved},
+        }
+
+    async def ingest_report(
+        self,
+        pdf_path: str,
+        company_name: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        업로드 시점 보고서 사전 처리 (해시 → 페이지 추출 → 청크/임베딩 → 키워드 색인)
+
+        결과는 해시 기준 캐시/스토어에 남으므로 이후 분석은 바로 검색/LLM 단계부터 시작합니다.
+
+        Returns:
+            {"report_hash", "pages", "status"}
+        """
+        def _emit(step: str, **payload: Any) -> None:
+            if progress is not None:
+                progress(step, {"company": company_name, **payload})
+
+        _emit("fingerprint")
+        report_hash = await _run_blocking(self._get_pdf_hash, pdf_path)
+
+        _emit("extract", report_hash=report_hash)
+        text_content = await _run_blocking(self.get_page_texts, pdf_path)
+        if not text_content:
+            raise ValueError(f"PDF 텍스트 추출 실패: {pdf_path}")
+
+        _emit("embed", report_hash=report_hash, pages=len(text_content))
+        await _run_blocking(self._ensure_vector_store, pdf_path, text_content, company_name)
+        await _run_blocking(self.get_keyword_index, pdf_path, text_content)
+
+        logger.info(f"Ingested report {company_name} ({report_hash}): {len(text_content)} pages")
+        return {"report_hash": report_hash, "pages": len(text_content), "status": "embedded"}
+
     # =========================================================================
     # SK 17개 이슈 기반 분석 (이중중대성 평가)
     # =========================================================================
 
     async def analyze_company_issues(
-        self, pdf_path: str, company_name: str
+        self,
+        pdf_path: str,
+        company_name: str,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         회사별 SK 17개 이슈 커버리지 분석 (이중중대성 평가 기반)
 
+        Args:
+            pdf_path: PDF 파일 경로
+            company_name: 회사명
+            progress: 단계별 진행 콜백 (선택)
+
         Returns:
             {issue_name: {coverage, response, source_pages}, ...}
         """
         logger.info(f"Analyzing {company_name} for SK 17 issues...")
 
+        def _emit(step: str, **payload: Any) -> None:
+            if progress is not None:
+                progress(step, {"company": company_name, **payload})
+
         # 캐시 확인
         if company_name in self._analysis_cache:
             logger.info(f"Returning cached result for {company_name}")
+            _emit("done", cached=True)
             return self._analysis_cache[company_name]
 
-        # PDF 텍스트 추출
-        text_content = self._extract_text_from_pdf(pdf_path)
+        # PDF 텍스트 추출 (블로킹 작업은 스레드에서 실행)
+        text_content = await _run_blocking(self.get_page_texts, pdf_path)
         if not text_content:
             return {issue: {"coverage": "No", "response": "PDF 추출 실패", "source_pages": []}
                     for issue in SK_INC_18_ISSUES}
 
         language = self._detect_language(text_content)
         logger.info(f"Detected language: {'Korean' if language == 'ko' else 'English'}")
+        _emit("extracted", pages=len(text_content), language=language)
 
-        # 벡터 스토어 로드/생성
-        vectorstore = self._get_vector_store(pdf_path, text_content)
-
-        # Step 1: 이중중대성 평가에서 중요 이슈 목록 추출
-        logger.info(f"[Step 1] Extracting material issues from {company_name}...")
-        company_material_issues, materiality_pages = await self._extract_material_issues(
-            vectorstore, language
-        )
-        logger.info(f"Found {len(company_material_issues)} material issues")
+        packing = _new_packing_stats()
+        packing_token = _packing_stats.set(packing)
+        try:
+            issue_coverage = await self._analyze_company_issues_with_store(
+                pdf_path, company_name, language, text_content, _emit
+            )
+        finally:
+            _packing_stats.reset(packing_token)
 
-        # Step 2: SK 17개 이슈와 매칭
-        logger.info(f"[Step 2] Matching with SK 17 issues...")
-        issue_coverage = await self._match_sk_issues(
-            vectorstore, language, company_material_issues, materiality_pages
+        logger.info(
+            f"Evidence packing for {company_name}: {packing['input_tokens']} -> {packing['packed_tokens']} tokens "
+            f"(saved {packing['tokens_saved']}, {packing['calls']} calls)"
         )
 
         # 캐시 저장
         self._analysis_cache[company_name] = issue_coverage
         self._save_analysis_cache()
+        self._coverage_matrix.upsert_company(company_name, issue_coverage)
+        _emit("done", cached=False, packing=packing)
+
+        return issue_coverage
+
+    async def _analyze_company_issues_with_store(
+        self,
+        pdf_path: str,
+        company_name: str,
+        language: str,
+        text_content: List[Dict[str, Any]],
+        _emit: Callable[..., None],
+    ) -> Dict[str, Dict[str, Any]]:
+        """벡터 스토어 준비 후 중요 이슈 추출 → SK 이슈 매칭"""
+
+        # 벡터 스토어 로드/생성 + 키워드 역색인
+        async with self._vector_store(pdf_path, text_content, company_name) as vectorstore:
+            keyword_index = await _run_blocking(self.get_keyword_index, pdf_path, text_content)
+            _emit("embedded")
 
+            # Step 1: 이중중대성 평가에서 중요 이슈 목록 추출
+            logger.info(f"[Step 1] Extracting material issues from {company_name}...")
+            company_material_issues, materiality_pages = await self._extract_material_issues(
+                vectorstore, language
+            )
+            logger.info(f"Found {len(company_material_issues)} material issues")
+            _emit("materiality_found", issues=company_material_issues, pages=materiality_pages)
+
+            # Step 2: SK 17개 이슈와 매칭
+            logger.info(f"[Step 2] Matching with SK 17 issues...")
+            issue_coverage = await self._match_sk_issues(
+                vectorstore, keyword_index, language, company_material_issues, materiality_pages,
+                on_issue=lambda index, issue, result: _emit(
+                    "issue_matched", index=index, total=len(SK_INC_18_ISSUES), issue=issue, result=result
+                ),
+            )
         return issue_coverage
 
     async def _extract_material_issues(
@@ -366,14 +846,7 @@ Output format (list topic names only):
 ...
 """
 
-        qa_chain = RetrievalQA.from_chain_type(
-            llm=self.llm,
-            chain_type="stuff",
-            retriever=retriever,
-            return_source_documents=True,
-        )
-
-        response = qa_chain.invoke({"query": query})
+        response = await self._run_retrieval_qa(retriever, query)
         result_text = response["result"].strip()
         source_docs = response.get("source_documents", [])
 
@@ -393,9 +866,11 @@ Output format (list topic names only):
     async def _match_sk_issues(
         self,
         vectorstore: Chroma,
+        keyword_index: PageKeywordIndex,
         language: str,
         company_issues: List[str],
         materiality_pages: List[int],
+        on_issue: Optional[Callable[[int, str, Dict[str, Any]], None]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """SK 17개 이슈와 회사 이슈 매칭"""
         issue_coverage = {}
@@ -433,9 +908,7 @@ Output format (list topic names only):
                 sk_to_company[best_sk] = (company_issue, best_score)
 
         # 결과 생성
-        retriever = vectorstore.as_retriever(search_kwargs={"k": 50})
-
-        for issue in SK_INC_18_ISSUES:
+        for index, issue in enumerate(SK_INC_18_ISSUES, 1):
             if issue in sk_to_company:
                 matched_issue, score = sk_to_company[issue]
                 issue_coverage[issue] = {
@@ -444,17 +917,31 @@ Output format (list topic names only):
                     "source_pages": materiality_pages,
                 }
             else:
-                # 폴백: 보고서 전체 검색
-                result = await self._fallback_search(retriever, issue, language)
+                # 폴백: 키워드 출현 페이지 검색
+                result = await self._fallback_search(vectorstore, keyword_index, issue, language)
                 issue_coverage[issue] = result
 
+            if on_issue is not None:
+                on_issue(index, issue, issue_coverage[issue])
+
         return issue_coverage
 
     async def _fallback_search(
-        self, retriever, issue: str, language: str
+        self, vectorstore: Chroma, keyword_index: PageKeywordIndex, issue: str, language: str
     ) -> Dict[str, Any]:
-        """매칭 실패 시 보고서 전체 검색"""
+        """
+        매칭 실패 시 보고서 검색
+
+        이슈명/키워드가 한 번도 나오지 않는 보고서는 LLM 호출 없이 No로 판정하고,
+        출현한 페이지로 검색 범위를 제한합니다.
+        """
         keywords = ISSUE_KEYWORDS.get(issue, [])
+        hit_pages = keyword_index.hit_pages([issue] + keywords)
+        if not hit_pages:
+            return {"coverage": "No", "response": "이슈 미발견 (키워드 미출현)", "source_pages": []}
+        retriever = vectorstore.as_retriever(
+            search_kwargs={"k": 50, "filter": {"page": {"$in": hit_pages}}}
+        )
 
         if language == "ko":
             query = f'이 보고서에서 "{issue}"와 관련된 내용이 있는지 확인해주세요. 키워드: {", ".join(keywords[:5])}. 있으면: 관련 섹션명 (한 줄), 없으면: NOT_FOUND'
@@ -462,13 +949,7 @@ Output format (list topic names only):
             query = f'Is "{issue}" mentioned in this report? Keywords: {", ".join(keywords[:5])}. If yes: Related section (one line), If no: NOT_FOUND'
 
         try:
-            qa_chain = RetrievalQA.from_chain_type(
-                llm=self.llm,
-                chain_type="stuff",
-                retriever=retriever,
-                return_source_documents=True,
-            )
-            response = qa_chain.invoke({"query": query})
+            response = await self._run_retrieval_qa(retriever, query)
             answer = response["result"].strip()
             source_docs = response.get("source_documents", [])
             source_pages = list(set([doc.metadata.get("page", 0) for doc in source_docs[:3]]))
@@ -509,72 +990,375 @@ Output format (list topic names only):
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        text_content = self._extract_text_from_pdf(pdf_path)
+        text_content = await _run_blocking(self.get_page_texts, pdf_path)
         if not text_content:
             return {"coverage": "No", "response": "PDF 텍스트 추출 실패", "source_pages": []}
 
-        language = self._detect_language(text_content)
-        vectorstore = self._get_vector_store(pdf_path, text_content)
-        retriever = vectorstore.as_retriever(search_kwargs={"k": 50})
+        # 키워드가 한 번도 나오지 않으면 LLM 호출 없이 No
+        keyword_index = await _run_blocking(self.get_keyword_index, pdf_path, text_content)
+        hit_pages = await _run_blocking(keyword_index.hit_pages, [keyword])
+        if not hit_pages:
+            result = {"coverage": "No", "response": "관련 내용 미발견", "source_pages": []}
+            self._cache[cache_key] = result
+            return result
 
+        language = self._detect_language(text_content)
         if language == "ko":
             query = f'이 지속가능경영 보고서에서 "{keyword}"와 관련된 내용을 찾아주세요. 관련 내용이 없다면: "NOT_FOUND". 있다면: 핵심 내용을 3-5문장으로 요약'
         else:
             query = f'Find content related to "{keyword}" in this sustainability report. If not found: "NOT_FOUND". If found: Summarize key content in 3-5 sentences'
 
-        try:
-            qa_chain = RetrievalQA.from_chain_type(
-                llm=self.llm,
-                chain_type="stuff",
-                retriever=retriever,
-                return_source_documents=True,
+        async with self._vector_store(pdf_path, text_content, company_name) as vectorstore:
+            retriever = vectorstore.as_retriever(
+                search_kwargs={"k": 50, "filter": {"page": {"$in": hit_pages}}}
             )
-            response = qa_chain.invoke({"query": query})
-            answer = response["result"].strip()
-            source_docs = response.get("source_documents", [])
-            source_pages = list(set([doc.metadata.get("page", 0) for doc in source_docs[:5]]))
-            source_pages.sort()
 
-            if "NOT_FOUND" in answer or "없" in answer:
-                coverage = "No"
-                result_text = "관련 내용 미발견"
-            else:
-                combined_text = " ".join([doc.page_content for doc in source_docs[:10]]).lower()
-                keyword_count = combined_text.count(keyword.lower())
-
-                if keyword_count >= 5:
-                    coverage = "Yes"
-                    result_text = answer[:300]
-                elif keyword_count >= 2:
-                    coverage = "Partially"
-                    result_text = answer[:200]
-                else:
+            try:
+                response = await self._run_retrieval_qa(retriever, query)
+                logger.info(f"Evidence packing for {company_name} '{keyword}': saved {response['packing']['tokens_saved']} tokens")
+                answer = response["result"].strip()
+                source_docs = response.get("source_documents", [])
+                source_pages = list(set([doc.metadata.get("page", 0) for doc in source_docs[:5]]))
+                source_pages.sort()
+
+                if "NOT_FOUND" in answer or "없" in answer:
                     coverage = "No"
-                    result_text = "키워드 언급이 부족함"
+                    result_text = "관련 내용 미발견"
+                else:
+                    combined_text = " ".join([doc.page_content for doc in source_docs[:10]]).lower()
+                    keyword_count = combined_text.count(keyword.lower())
+
+                    if keyword_count >= 5:
+                        coverage = "Yes"
+                        result_text = answer[:300]
+                    elif keyword_count >= 2:
+                        coverage = "Partially"
+                        result_text = answer[:200]
+                    else:
+                        coverage = "No"
+                        result_text = "키워드 언급이 부족함"
+
+                result = {"coverage": coverage, "response": result_text, "source_pages": source_pages}
+                self._cache[cache_key] = result
+                return result
 
-            result = {"coverage": coverage, "response": result_text, "source_pages": source_pages}
-            self._cache[cache_key] = result
-            return result
+            except Exception as e:
+                logger.error(f"Error analyzing {company_name}: {e}")
+                return {"coverage": "No", "response": f"분석 오류: {str(e)}", "source_pages": []}
 
-        except Exception as e:
-            logger.error(f"Error analyzing {company_name}: {e}")
-            return {"coverage": "No", "response": f"분석 오류: {str(e)}", "source_pages": []}
+    async def iter_keyword_for_companies(
+        self,
+        keyword: str,
+        companies: List[Dict[str, str]],
+        max_concurrency: Optional[int] = None,
+        timeout_sec: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        여러 회사에 대해 키워드 분석을 동시에 실행하고 완료되는 순서대로 반환
+
+        Args:
+            keyword: 분석 키워드
+            companies: [{"name": 회사명, "path": PDF 경로}, ...]
+            max_concurrency: 동시 분석 회사 수 (기본: BENCHMARK_MAX_CONCURRENCY)
+            timeout_sec: 회사별 분석 제한 시간 (기본: BENCHMARK_COMPANY_TIMEOUT_SEC)
+
+        Yields:
+            (company_name, result) - 느리거나 실패한 회사는 나머지 결과를 막지 않음
+
+        시간 초과 시 그 회사의 다음 단계는 시작하지 않지만, 이미 실행 중인 블로킹 단계(추출/임베딩)는
+        멈출 수 없어 벤치마킹 전용 스레드 풀(BENCHMARK_WORKER_THREADS)에서 끝까지 실행됩니다.
+        """
+        max_concurrency = max(1, max_concurrency or settings.BENCHMARK_MAX_CONCURRENCY)
+        timeout_sec = timeout_sec or settings.BENCHMARK_COMPANY_TIMEOUT_SEC
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _analyze(company: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+            company_name = company["name"]
+            pdf_path = company["path"]
+            if not os.path.exists(pdf_path):
+                return company_name, {"coverage": "No", "response": "파일을 찾을 수 없습니다", "source_pages": []}
+
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        self.analyze_keyword_in_report(pdf_path, company_name, keyword),
+                        timeout=timeout_sec,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Keyword analysis timed out for {company_name} after {timeout_sec}s")
+                    result = {
+                        "coverage": "No",
+                        "response": f"분석 시간 초과 ({timeout_sec:.0f}초)",
+                        "source_pages": [],
+                    }
+                except Exception as e:
+                    logger.error(f"Error analyzing {company_name}: {e}")
+                    result = {"coverage": "No", "response": f"분석 오류: {str(e)}", "source_pages": []}
+            return company_name, result
+
+        tasks = [asyncio.create_task(_analyze(company)) for company in companies]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중단한 경우 남은 분석 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def iter_company_issue_analyses(
+        self,
+        companies: List[Dict[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        여러 회사의 SK 이슈 분석을 동시에 실행하며 단계/결과 이벤트를 발생 순서대로 반환
+
+        Args:
+            companies: [{"name": 회사명, "path": PDF 경로}, ...]
+            max_concurrency: 동시 분석 회사 수 (기본: BENCHMARK_MAX_CONCURRENCY)
+
+        Yields:
+            {"type": "progress", "company", "step", ...}  - extracted/embedded/materiality_found/issue_matched/done
+            {"type": "result", "company", "data", "summary"} - 회사 분석 완료 즉시
+            {"type": "error", "company", "message"}
+        """
+        max_concurrency = max(1, max_concurrency or settings.BENCHMARK_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        events: asyncio.Queue = asyncio.Queue()
+
+        def _on_progress(step: str, payload: Dict[str, Any]) -> None:
+            events.put_nowait({"type": "progress", "step": step, **payload})
+
+        async def _analyze(company: Dict[str, str]) -> None:
+            company_name = company["name"]
+            try:
+                if not os.path.exists(company["path"]):
+                    raise FileNotFoundError("파일을 찾을 수 없습니다")
+                async with semaphore:
+                    events.put_nowait({"type": "progress", "step": "started", "company": company_name})
+                    result = await self.analyze_company_issues(company["path"], company_name, progress=_on_progress)
+                events.put_nowait({
+                    "type": "result",
+                    "company": company_name,
+                    "data": result,
+                    "summary": self.get_company_coverage_counts(company_name, result),
+                })
+            except Exception as e:
+                logger.error(f"Error analyzing {company_name}: {e}")
+                events.put_nowait({"type": "error", "company": company_name, "message": str(e)})
+
+        tasks = [asyncio.create_task(_analyze(company)) for company in companies]
+        pending = len(tasks)
+        try:
+            while pending:
+                event = await events.get()
+                if event["type"] in ("result", "error"):
+                    pending -= 1
+                yield event
+        finally:
+            # 소비자가 중단한 경우 (클라이언트 연결 종료) 남은 분석 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def analyze_keyword_for_companies(
-        self, keyword: str, companies: List[Dict[str, str]]
+        self,
+        keyword: str,
+        companies: List[Dict[str, str]],
+        max_concurrency: Optional[int] = None,
+        timeout_sec: Optional[float] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        """여러 회사에 대해 키워드 분석"""
+        """여러 회사에 대해 키워드 분석 (동시 실행, 결과는 입력 순서 유지)"""
         logger.info(f"Analyzing keyword '{keyword}' for {len(companies)} companies")
-        results = {}
-        for company in companies:
-            company_name = company["name"]
-            pdf_path = company["path"]
+        completed: Dict[str, Dict[str, Any]] = {}
+        async for company_name, result in self.iter_keyword_for_companies(
+            keyword, companies, max_concurrency, timeout_sec
+        ):
+            completed[company_name] = result
+        return {company["name"]: completed[company["name"]] for company in companies}
+
+    # =========================================================================
+    # 키워드 × 회사 커버리지 매트릭스 (통합 인덱스 1회 검색 + 배치 LLM 요약)
+    # =========================================================================
+
+    @staticmethod
+    def _coverage_from_hits(hits: int) -> str:
+        """키워드 출현 횟수 기반 커버리지 (analyze_keyword_in_report와 같은 기준)"""
+        if hits >= 5:
+            return "Yes"
+        if hits >= 2:
+            return "Partially"
+        return "No"
+
+    async def _prepare_matrix_reports(
+        self, companies: List[Dict[str, str]], keywords: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """회사별 페이지 텍스트 로드, 키워드 역색인(전체 키워드 1회 스캔) 및 통합 인덱스 등록 (동시 실행)"""
+        semaphore = asyncio.Semaphore(max(1, settings.BENCHMARK_MAX_CONCURRENCY))
+        index = get_benchmark_index()
+
+        async def _prepare(company: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+            name, pdf_path = company["name"], company["path"]
             if not os.path.exists(pdf_path):
-                results[company_name] = {"coverage": "No", "response": "파일을 찾을 수 없습니다", "source_pages": []}
+                return name, {"error": "PDF 파일 없음"}
+            async with semaphore:
+                try:
+                    pages = await _run_blocking(self.get_page_texts, pdf_path)
+                    if not pages:
+                        return name, {"error": "PDF 텍스트 추출 실패"}
+                    report_hash = self._get_pdf_hash(pdf_path)
+                    if not index.has_report(report_hash):
+                        await _run_blocking(self._ensure_vector_store, pdf_path, pages, name)
+                    keyword_index = await _run_blocking(self.get_keyword_index, pdf_path, pages)
+                    await _run_blocking(keyword_index.ensure, keywords)
+                    return name, {"report_hash": report_hash, "keyword_index": keyword_index}
+                except Exception as e:
+                    logger.error(f"Failed to prepare {name} for coverage matrix: {e}")
+                    return name, {"error": f"분석 오류: {str(e)}"}
+
+        prepared = await asyncio.gather(*(_prepare(c) for c in companies))
+        return dict(prepared)
+
+    async def _summarize_matrix_cells(self, cells: List[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+        """근거가 있는 셀들을 한 번의 LLM 호출로 판정/요약 (셀이 많으면 묶음 단위 병렬 호출)"""
+        batch_size = max(1, settings.BENCHMARK_MATRIX_CELLS_PER_CALL)
+        batches = [cells[i:i + batch_size] for i in range(0, len(cells), batch_size)]
+
+        async def _summarize(batch: List[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+            blocks = []
+            for cell in batch:
+                evidence = "\n".join(
+                    f"  - (p.{doc.metadata.get('page', 0)}) {doc.page_content[:500]}"
+                    for doc in cell["evidence"]
+                )
+                blocks.append(
+                    f"[{cell['id']}] 회사: {cell['company']} / 키워드: \"{cell['keyword']}\" "
+                    f"/ 보고서 내 키워드 출현 {cell['hits']}회 ({len(cell['hit_pages'])}개 페이지)\n{evidence}"
+                )
+            prompt = (
+                "다음은 여러 회사 지속가능경영 보고서에서 키워드별로 찾은 근거입니다.\n"
+                "각 항목마다 해당 회사가 키워드를 얼마나 다루는지 판정하고 핵심 내용을 2-3문장으로 요약하세요.\n"
+                "판정 기준: Yes(구체적 전략/목표/성과 제시), Partially(언급은 있으나 제한적), No(관련 내용 없음)\n\n"
+                + "\n\n".join(blocks)
+                + '\n\nJSON으로만 응답: {"cells": [{"id": 번호, "coverage": "Yes|Partially|No", "summary": "요약"}]}'
+            )
+            response = await self.llm.ainvoke(
+                prompt,
+                max_tokens=200 + 150 * len(batch),
+                response_format={"type": "json_object"},
+            )
+            parsed = json.loads(response.content)
+            return {
+                int(item["id"]): {"coverage": item.get("coverage", "No"), "summary": item.get("summary", "")}
+                for item in parsed.get("cells", [])
+                if "id" in item
+            }
+
+        judged: Dict[int, Dict[str, str]] = {}
+        for outcome in await asyncio.gather(*(_summarize(b) for b in batches), return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Coverage matrix summarization failed: {outcome}")
                 continue
-            result = await self.analyze_keyword_in_report(pdf_path, company_name, keyword)
-            results[company_name] = result
-        return results
+            judged.update(outcome)
+        return judged
+
+    async def build_coverage_matrix(
+        self,
+        keywords: List[str],
+        companies: List[Dict[str, str]],
+        evidence_per_cell: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        키워드 × 회사 커버리지 매트릭스 생성
+
+        1. 키워드를 한 번에 임베딩하고 통합 인덱스에서 보고서별로 검색 (보고서당 1회, 전체 키워드 일괄)
+        2. 보고서 키워드 역색인에서 출현 통계 조회 (출현 0회 셀은 LLM 없이 No,
+           출현했지만 근거가 없는 셀은 출현 횟수로 판정)
+        3. 셀별 상위 근거만 모아 배치 LLM 호출로 판정/요약
+
+        Args:
+            keywords: 키워드 목록
+            companies: [{"name": str, "path": str}, ...]
+            evidence_per_cell: 셀별 LLM에 전달할 근거 청크 수
+
+        Returns:
+            {"matrix": {keyword: {company: {coverage, response, source_pages, hits, hit_pages}}},
+             "summary": {keyword: {...}}, "stats": {...}}
+        """
+        evidence_per_cell = evidence_per_cell or settings.BENCHMARK_MATRIX_EVIDENCE_PER_CELL
+        logger.info(f"Building coverage matrix: {len(keywords)} keywords x {len(companies)} companies")
+
+        reports = await self._prepare_matrix_reports(companies, keywords)
+        ready = {name: info for name, info in reports.items() if "report_hash" in info}
+        report_hashes = sorted({info["report_hash"] for info in ready.values()})
+
+        # 1. 키워드 임베딩 1회 + 보고서별 ANN 검색
+        #    (보고서 전체를 한 번에 검색하면 관련 청크가 많은 보고서가 상위 결과를 독점)
+        evidence: Dict[Tuple[str, str], List[Any]] = {}
+        if ready and keywords:
+            index = get_benchmark_index()
+            vectors = await _run_blocking(index.embed_queries, keywords)
+
+            def _search_reports() -> Dict[str, List[List[Any]]]:
+                return {h: index.search_by_vectors(vectors, evidence_per_cell, [h]) for h in report_hashes}
+
+            for report_hash, searches in (await _run_blocking(_search_reports)).items():
+                for keyword, hits in zip(keywords, searches):
+                    evidence[(keyword, report_hash)] = [doc for doc, _ in hits]
+
+        # 2. 셀 구성 (출현 통계는 보고서 키워드 역색인에서 조회)
+        matrix: Dict[str, Dict[str, Dict[str, Any]]] = {keyword: {} for keyword in keywords}
+        pending: List[Dict[str, Any]] = []
+        for keyword in keywords:
+            for company in companies:
+                name = company["name"]
+                info = reports[name]
+                if "error" in info:
+                    matrix[keyword][name] = {
+                        "coverage": "No", "response": info["error"], "source_pages": [], "hits": 0, "hit_pages": [],
+                    }
+                    continue
+
+                stats = info["keyword_index"].stats(keyword)
+                docs = evidence.get((keyword, info["report_hash"]), [])
+                cell = {"coverage": "No", "response": "관련 내용 미발견", "source_pages": [], **stats}
+                matrix[keyword][name] = cell
+                if stats["hits"] and docs:
+                    cell["source_pages"] = sorted({doc.metadata.get("page", 0) for doc in docs})
+                    pending.append({
+                        "id": len(pending), "keyword": keyword, "company": name, "evidence": docs, **stats,
+                    })
+                elif stats["hits"]:
+                    # 인덱스에 근거가 없음 (인덱스 미등록 등): 출현 횟수 기준으로 판정
+                    cell["coverage"] = self._coverage_from_hits(stats["hits"])
+                    cell["response"] = f"키워드 {stats['hits']}회 출현 (근거 청크 없음)"
+                    cell["source_pages"] = stats["hit_pages"][:5]
+
+        # 3. 배치 LLM 판정 (실패한 셀은 출현 횟수 기준으로 판정)
+        judged = await self._summarize_matrix_cells(pending) if pending else {}
+        for item in pending:
+            cell = matrix[item["keyword"]][item["company"]]
+            verdict = judged.get(item["id"])
+            if verdict and verdict["coverage"] in ("Yes", "Partially", "No"):
+                cell["coverage"] = verdict["coverage"]
+                cell["response"] = verdict["summary"][:300] or cell["response"]
+            else:
+                cell["coverage"] = self._coverage_from_hits(item["hits"])
+                cell["response"] = item["evidence"][0].page_content[:200]
+
+        batch_size = max(1, settings.BENCHMARK_MATRIX_CELLS_PER_CALL)
+        return {
+            "keywords": keywords,
+            "companies": [c["name"] for c in companies],
+            "matrix": matrix,
+            "summary": {keyword: self.get_benchmark_summary(row) for keyword, row in matrix.items()},
+            "stats": {
+                "cells": len(keywords) * len(companies),
+                "llm_cells": len(pending),
+                "llm_calls": (len(pending) + batch_size - 1) // batch_size,
+            },
+        }
 
     # =========================================================================
     # 유틸리티
@@ -584,6 +1368,10 @@ Output format (list topic names only):
         """SK 18개 이슈 목록 반환 (2024년 기준)"""
         return SK_INC_18_ISSUES
 
+    def get_report_hash(self, pdf_path: str) -> str:
+        """보고서 해시 반환 (벡터 스토어 디렉토리명 / 작업 중복 제거 키)"""
+        return self._get_pdf_hash(pdf_path)
+
     def get_cached_companies(self) -> List[str]:
         """캐시된 회사 목록 반환"""
         return list(self._analysis_cache.keys())
@@ -592,11 +1380,64 @@ Output format (list topic names only):
         """전체 캐시 데이터 반환"""
         return self._analysis_cache
 
+    def get_coverage_matrix(self) -> Tuple[bytes, str]:
+        """이슈 × 회사 커버리지 매트릭스 JSON 본문과 ETag (메모리에서 바로 반환)"""
+        return self._coverage_matrix.snapshot()
+
+    def get_company_coverage_counts(
+        self,
+        company_name: str,
+        results: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, int]:
+        """
+        회사별 Yes/Partially/No 개수 (매트릭스 집계 재사용)
+
+        매트릭스에 없는 회사(PDF 추출 실패 등으로 캐시되지 않은 결과)는 results로 집계하고,
+        results도 없으면 모든 이슈를 No로 봅니다.
+        """
+        counts = self._coverage_matrix.company_counts(company_name)
+        if counts is None:
+            counts = count_coverage(SK_INC_18_ISSUES, results or {})
+        return counts
+
+    def reuse_cached_analysis(self, company_name: str, aliases: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        동일 내용 보고서의 기존 분석 결과를 새 회사명으로 재사용
+
+        Args:
+            company_name: 분석 결과를 저장할 회사명
+            aliases: 같은 보고서 blob의 별칭 목록 (업로드 당시 회사명/문서 ID)
+
+        Returns:
+            재사용한 분석 결과 (없으면 None)
+        """
+        if company_name in self._analysis_cache:
+            return self._analysis_cache[company_name]
+
+        for alias in aliases:
+            # 별칭 또는 "{회사명}_{날짜}_{시각}" 형식에서 타임스탬프를 제거한 이름
+            for candidate in (alias, alias.rsplit("_", 2)[0]):
+                if candidate in self._analysis_cache:
+                    logger.info(f"Reusing cached analysis of {candidate} for duplicate report: {company_name}")
+                    self._analysis_cache[company_name] = self._analysis_cache[candidate]
+                    self._save_analysis_cache()
+                    self._coverage_matrix.upsert_company(company_name, self._analysis_cache[company_name])
+                    return self._analysis_cache[company_name]
+        return None
+
+    def forget_report(self, report_hash: str) -> None:
+        """보고서 해시의 열린 스토어와 메모리/디스크 페이지 캐시 정리 (스토어 삭제 전 호출)"""
+        self._store_pool.evict(report_hash)
+        self._page_cache.pop(report_hash)
+        self._keyword_indexes.pop(report_hash)
+        (BENCHMARK_PAGES_DIR / f"{report_hash}.json").unlink(missing_ok=True)
+
     def delete_company_cache(self, company_name: str) -> bool:
         """특정 회사 캐시 삭제"""
         if company_name in self._analysis_cache:
             del self._analysis_cache[company_name]
             self._save_analysis_cache()
+            self._coverage_matrix.remove_company(company_name)
             return True
         return False
 
@@ -0,0 +1,133 @@
+"""
+Coverage Matrix
+
+SK 이슈 × 회사 커버리지 매트릭스를 메모리에 유지
+- 셀: issue → company → Yes/Partially/No
+- 이슈별/회사별 Yes/Partially/No 집계
+- 회사 1개 분석/삭제 시 해당 열과 집계만 증분 갱신
+- 직렬화된 응답 본문과 ETag(본문 해시)를 미리 계산해 두고 그대로 반환
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+COVERAGE_LEVELS = ("Yes", "Partially", "No")
+
+
+def _empty_counts() -> Dict[str, int]:
+    return {level: 0 for level in COVERAGE_LEVELS}
+
+
+def _coverage_of(result: Dict[str, Any]) -> str:
+    coverage = result.get("coverage", "No") if isinstance(result, dict) else "No"
+    return coverage if coverage in COVERAGE_LEVELS else "No"
+
+
+def count_coverage(issues: List[str], results: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """분석 결과의 Yes/Partially/No 개수 (결과에 없는 이슈는 No)"""
+    counts = _empty_counts()
+    for issue in issues:
+        counts[_coverage_of(results.get(issue, {}))] += 1
+    return counts
+
+
+def _coverage_rate(counts: Dict[str, int], total: int) -> float:
+    if not total:
+        return 0
+    return round((counts["Yes"] + counts["Partially"] * 0.5) / total * 100, 1)
+
+
+class CoverageMatrix:
+    """Incrementally maintained issue × company coverage matrix."""
+
+    def __init__(self, issues: List[str]):
+        self.issues = list(issues)
+        self._lock = threading.Lock()
+        self._cells: Dict[str, Dict[str, str]] = {issue: {} for issue in self.issues}
+        self._issue_counts: Dict[str, Dict[str, int]] = {issue: _empty_counts() for issue in self.issues}
+        self._company_counts: Dict[str, Dict[str, int]] = {}
+        self._body: Optional[bytes] = None
+        self._etag: Optional[str] = None
+
+    def rebuild(self, analysis_cache: Dict[str, Dict[str, Any]]) -> None:
+        """전체 분석 캐시로 매트릭스 재구성 (서비스 초기화 시 1회)"""
+        with self._lock:
+            self._cells = {issue: {} for issue in self.issues}
+            self._issue_counts = {issue: _empty_counts() for issue in self.issues}
+            self._company_counts = {}
+            for company, results in analysis_cache.items():
+                self._set_company_locked(company, results)
+            self._invalidate_locked()
+
+    def upsert_company(self, company: str, results: Dict[str, Dict[str, Any]]) -> None:
+        """회사 1개의 분석 결과 반영 (기존 열이 있으면 교체)"""
+        with self._lock:
+            self._remove_company_locked(company)
+            self._set_company_locked(company, results)
+            self._invalidate_locked()
+
+    def remove_company(self, company: str) -> bool:
+        with self._lock:
+            removed = self._remove_company_locked(company)
+            if removed:
+                self._invalidate_locked()
+            return removed
+
+    def company_counts(self, company: str) -> Optional[Dict[str, int]]:
+        """회사별 Yes/Partially/No 개수 (매트릭스에 없는 회사는 None)"""
+        with self._lock:
+            counts = self._company_counts.get(company)
+            return dict(counts) if counts is not None else None
+
+    def snapshot(self) -> Tuple[bytes, str]:
+        """직렬화된 매트릭스 JSON 본문과 ETag (변경이 없으면 이전 결과 재사용)"""
+        with self._lock:
+            if self._body is None:
+                self._body = json.dumps(self._to_dict_locked(), ensure_ascii=False).encode("utf-8")
+                self._etag = f'"{hashlib.sha256(self._body).hexdigest()[:32]}"'
+            return self._body, self._etag
+
+    # =========================================================================
+    # 내부 (self._lock 보유 상태에서 호출)
+    # =========================================================================
+
+    def _set_company_locked(self, company: str, results: Dict[str, Dict[str, Any]]) -> None:
+        for issue in self.issues:
+            coverage = _coverage_of(results.get(issue, {}))
+            self._cells[issue][company] = coverage
+            self._issue_counts[issue][coverage] += 1
+        self._company_counts[company] = count_coverage(self.issues, results)
+
+    def _remove_company_locked(self, company: str) -> bool:
+        if company not in self._company_counts:
+            return False
+        for issue in self.issues:
+            coverage = self._cells[issue].pop(company, None)
+            if coverage is not None:
+                self._issue_counts[issue][coverage] -= 1
+        del self._company_counts[company]
+        return True
+
+    def _invalidate_locked(self) -> None:
+        self._body = None
+        self._etag = None
+
+    def _to_dict_locked(self) -> Dict[str, Any]:
+        companies = sorted(self._company_counts)
+        total_companies = len(companies)
+        return {
+            "issues": self.issues,
+            "companies": companies,
+            "cells": {issue: dict(self._cells[issue]) for issue in self.issues},
+            "by_issue": {
+                issue: {**counts, "coverage_rate": _coverage_rate(counts, total_companies)}
+                for issue, counts in self._issue_counts.items()
+            },
+            "by_company": {
+                company: {**self._company_counts[company],
+                          "coverage_rate": _coverage_rate(self._company_counts[company], len(self.issues))}
+                for company in companies
+            },
+        }
@@ -12,15 +12,15 @@ import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import numpy as np
-from openai import AsyncOpenAI
 import chromadb
 from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
-from pypdf import PdfReader
 from tqdm import tqdm
 
 from app.config.config import settings
 from app.core.logging import get_logger
+from app.llm.clients.embedding_provider import get_sentence_transformer
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.utils.pdf_extractor import extract_text
 
 logger = get_logger(__name__)
 
@@ -89,7 +89,7 @@ class ESGStandardsService:
                 Path(persist_directory).mkdir(parents=True, exist_ok=True)
 
         self.persist_directory = persist_directory
-        self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.openai_client = get_llm_gateway().async_openai()
         self.openai_model = settings.OPENAI_MODEL
 
         # Initialize ChromaDB client with fallback for corrupted DB
@@ -117,7 +117,7 @@ class ESGStandardsService:
 
         # Load BGE-M3 embedding model
         logger.info("Loading BGE-M3 embedding model...")
-        self.embedding_model = SentenceTransformer('BAAI/bge-m3')
+        self.embedding_model = get_sentence_transformer('BAAI/bge-m3')
         logger.info("BGE-M3 model loaded successfully")
 
         # Get or create collection for disclosures
@@ -300,11 +300,7 @@ class ESGStandardsService:
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF file."""
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return extract_text(pdf_path, separator="\n")
         except Exception as e:
             logger.error(f"Error reading {pdf_path}: {e}")
             return ""
@@ -0,0 +1,121 @@
+"""
+Document Ingestion Jobs
+
+업로드 직후 PDF 사전 처리를 JobService 백그라운드 작업으로 실행
+- documents.ingest: 해시 → 페이지 추출 → 청크/임베딩 → 벡터 스토어 저장
+
+벤치마킹 보고서만 대상입니다. 표준 문서(GRI/SASB)는 ESGStandardsService가
+공시 항목 단위로 별도 관리하므로 업로드 시 임베딩하지 않습니다.
+
+문서 상태: pending → extracting → embedding → embedded (실패 시 error)
+상태는 별도 저장 없이 진행 중 작업과 생성된 벡터 스토어로부터 계산합니다.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.logging import get_logger
+from app.schemas.job_schema import JOB_STATUS_FAILED, JOB_STATUS_RUNNING, JobInfo
+from app.services.benchmark_service import get_benchmark_service
+from app.services.job_service import JobContext, get_job_service, register_job_handler
+
+logger = get_logger(__name__)
+
+JOB_KIND_INGEST_DOCUMENT = "documents.ingest"
+
+COLLECTION_BENCHMARK = "benchmark"
+
+DOCUMENT_STATUS_PENDING = "pending"
+DOCUMENT_STATUS_EXTRACTING = "extracting"
+DOCUMENT_STATUS_EMBEDDING = "embedding"
+DOCUMENT_STATUS_EMBEDDED = "embedded"
+DOCUMENT_STATUS_ERROR = "error"
+
+# 작업 진행 단계 → 문서 상태
+_STEP_STATUS = {
+    "fingerprint": DOCUMENT_STATUS_EXTRACTING,
+    "extract": DOCUMENT_STATUS_EXTRACTING,
+    "embed": DOCUMENT_STATUS_EMBEDDING,
+}
+
+
+def _store_dir(collection: str, content_hash: str) -> Optional[Path]:
+    """문서의 생성된 벡터 스토어 디렉토리 (없으면 None)"""
+    if collection != COLLECTION_BENCHMARK:
+        raise ValueError(f"Unsupported ingestion collection: {collection}")
+    return get_benchmark_service().find_report_store(content_hash)
+
+
+def submit_ingestion(
+    document_id: str,
+    path: str,
+    collection: str,
+    company_name: Optional[str] = None,
+) -> Tuple[Optional[JobInfo], str]:
+    """
+    업로드 문서 사전 처리 작업 등록
+
+    같은 내용(해시)의 문서는 진행 중 작업을 공유하고, 이미 스토어가 있으면 등록하지 않습니다.
+
+    Returns:
+        (job 또는 None, 현재 문서 상태)
+    """
+    content_hash = get_benchmark_service().get_report_hash(path)
+    if _store_dir(collection, content_hash) is not None:
+        return None, DOCUMENT_STATUS_EMBEDDED
+
+    job, _ = get_job_service().submit(
+        JOB_KIND_INGEST_DOCUMENT,
+        {
+            "document_id": document_id,
+            "path": path,
+            "collection": collection,
+            "company_name": company_name or Path(path).stem,
+        },
+        dedupe_key=f"{collection}:{content_hash}",
+    )
+    return job, DOCUMENT_STATUS_PENDING
+
+
+def get_document_status(path: str, collection: str) -> str:
+    """진행 중 작업 단계 또는 생성된 스토어 기준 문서 상태"""
+    content_hash = get_benchmark_service().get_report_hash(path)
+    dedupe_key = f"{collection}:{content_hash}"
+    job_service = get_job_service()
+
+    job = job_service.find_active(JOB_KIND_INGEST_DOCUMENT, dedupe_key)
+    if job is not None:
+        if job.status != JOB_STATUS_RUNNING:
+            return DOCUMENT_STATUS_PENDING
+        return _STEP_STATUS.get(job.progress.step, DOCUMENT_STATUS_EXTRACTING)
+
+    if _store_dir(collection, content_hash) is not None:
+        return DOCUMENT_STATUS_EMBEDDED
+
+    failed = [
+        j for j in job_service.list_jobs(kind=JOB_KIND_INGEST_DOCUMENT, status=JOB_STATUS_FAILED)
+        if j.dedupe_key == dedupe_key
+    ]
+    return DOCUMENT_STATUS_ERROR if failed else DOCUMENT_STATUS_PENDING
+
+
+async def run_ingest_document(ctx: JobContext) -> Dict[str, Any]:
+    """업로드 문서 사전 처리 (벤치마킹 보고서는 분석과 같은 스토어/캐시를 채움)"""
+    params = ctx.params
+    path = params["path"]
+    if not Path(path).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    if params["collection"] != COLLECTION_BENCHMARK:
+        raise ValueError(f"Unsupported ingestion collection: {params['collection']}")
+    outcome = await get_benchmark_service().ingest_report(
+        path,
+        params["company_name"],
+        progress=lambda step, payload: ctx.report_progress(step, message=payload.get("report_hash")),
+    )
+
+    ctx.report_progress("done")
+    return {"success": True, "document_id": params["document_id"], **outcome}
+
+
+register_job_handler(JOB_KIND_INGEST_DOCUMENT, run_ingest_document)
@@ -0,0 +1,370 @@
+"""
+Background Job Service
+
+장시간 실행되는 작업(벤치마킹 전체 재분석, 업로드 후 분석, 문서 임베딩 등)을
+HTTP 요청과 분리하여 제한된 백그라운드 풀에서 실행
+- 작업 ID 즉시 반환
+- 동일 작업(종류 + dedupe 키)이 진행 중이면 기존 작업 재사용
+- 단계별 진행률 및 체크포인트 저장 → 재시작 후 재개
+- 취소 지원
+
+진행률/체크포인트 갱신은 dirty 표시만 하고 JOB_PERSIST_INTERVAL_SEC 간격으로 모아서 저장
+(파일 쓰기는 asyncio.to_thread), 상태 전환(시작/완료/취소/중단)은 즉시 저장
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.schemas.job_schema import (
+    ACTIVE_JOB_STATUSES,
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobInfo,
+    JobProgress,
+)
+
+logger = get_logger(__name__)
+
+_BASE_DIR = Path(__file__).parent.parent.parent
+JOBS_DIR = _BASE_DIR / settings.JOBS_DIR
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job handler when cancellation was requested."""
+
+
+class JobContext:
+    """작업 핸들러 실행 컨텍스트 (파라미터, 진행률, 체크포인트, 취소 확인)"""
+
+    def __init__(self, service: "JobService", job: JobInfo):
+        self._service = service
+        self._job = job
+
+    @property
+    def job_id(self) -> str:
+        return self._job.job_id
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self._job.params
+
+    @property
+    def checkpoint(self) -> Dict[str, Any]:
+        """이전 실행에서 저장된 체크포인트 (재개 시 사용)"""
+        return self._job.checkpoint
+
+    def report_progress(
+        self,
+        step: str,
+        current: int = 0,
+        total: int = 0,
+        message: Optional[str] = None,
+    ) -> None:
+        """단계별 진행률 기록"""
+        self._job.progress = JobProgress(step=step, current=current, total=total, message=message)
+        self._service._mark_dirty(self._job)
+
+    def save_checkpoint(self, **values: Any) -> None:
+        """체크포인트 갱신 (재시작 후 이 지점부터 재개)"""
+        self._job.checkpoint.update(values)
+        self._service._mark_dirty(self._job)
+
+    def check_cancelled(self) -> None:
+        """취소 요청 시 JobCancelledError 발생"""
+        if self._job.cancel_requested:
+            raise JobCancelledError(self._job.job_id)
+
+
+JobHandler = Callable[[JobContext], Awaitable[Any]]
+
+# kind → (handler, resumable)
+_JOB_HANDLERS: Dict[str, Tuple[JobHandler, bool]] = {}
+
+
+def register_job_handler(kind: str, handler: JobHandler, resumable: bool = True) -> None:
+    """작업 종류별 핸들러 등록"""
+    _JOB_HANDLERS[kind] = (handler, resumable)
+
+
+class JobService:
+    """Bounded background job runner with de-duplication and checkpoints."""
+
+    def __init__(self, jobs_dir: Path = JOBS_DIR, max_workers: Optional[int] = None):
+        self.jobs_dir = jobs_dir
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max(1, max_workers or settings.JOB_MAX_WORKERS)
+        self._jobs: Dict[str, JobInfo] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # 지연 저장 상태: dirty 작업, 스냅샷 순번(늦게 끝난 쓰기가 최신 파일을 덮지 않도록)
+        self._dirty: set = set()
+        self._flusher: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq: Dict[str, int] = {}
+        self._load_jobs()
+        logger.info(f"JobService initialized: {len(self._jobs)} jobs loaded, workers={self.max_workers}")
+
+    # =========================================================================
+    # 영속화
+    # =========================================================================
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _snapshot(self, job: JobInfo) -> Tuple[int, Dict[str, Any]]:
+        """현재 상태 스냅샷 (이벤트 루프에서 호출, 이후 쓰기는 스레드에서 가능)"""
+        self._snapshot_seq += 1
+        self._dirty.discard(job.job_id)
+        return self._snapshot_seq, job.model_dump()
+
+    def _write(self, job_id: str, seq: int, data: Dict[str, Any]) -> None:
+        """스냅샷을 파일로 저장 (임시 파일 후 교체, 더 새 스냅샷이 이미 저장됐으면 생략)"""
+        try:
+            with self._write_lock:
+                if seq <= self._written_seq.get(job_id, 0):
+                    return
+                tmp_path = self._job_path(job_id).with_suffix(".json.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                tmp_path.replace(self._job_path(job_id))
+                self._written_seq[job_id] = seq
+        except Exception as e:
+            logger.error(f"Failed to persist job {job_id}: {e}")
+
+    def _persist(self, job: JobInfo) -> None:
+        """작업 상태를 즉시 저장 (동기 경로: 제출, 취소, 종료 시 중단)"""
+        self._write(job.job_id, *self._snapshot(job))
+
+    async def _persist_async(self, job: JobInfo) -> None:
+        """작업 상태를 스레드에서 저장"""
+        seq, data = self._snapshot(job)
+        await asyncio.to_thread(self._write, job.job_id, seq, data)
+
+    def _mark_dirty(self, job: JobInfo) -> None:
+        """진행률/체크포인트 변경 표시 (JOB_PERSIST_INTERVAL_SEC 간격으로 모아서 저장)"""
+        self._dirty.add(job.job_id)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_dirty())
+
+    async def _flush_dirty(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(settings.JOB_PERSIST_INTERVAL_SEC)
+            for job_id in list(self._dirty):
+                job = self._jobs.get(job_id)
+                if job is None:
+                    self._dirty.discard(job_id)
+                    continue
+                await self._persist_async(job)
+
+    def _load_jobs(self) -> None:
+        """저장된 작업 상태 로드"""
+        for job_file in self.jobs_dir.glob("*.json"):
+            try:
+                with open(job_file, "r", encoding="utf-8") as f:
+                    job = JobInfo(**json.load(f))
+                self._jobs[job.job_id] = job
+            except Exception as e:
+                logger.error(f"Failed to load job file {job_file}: {e}")
+        self._prune_history()
+
+    def _prune_history(self) -> None:
+        """완료된 작업 이력을 JOB_HISTORY_LIMIT 개로 제한"""
+        finished = sorted(
+            (job for job in self._jobs.values() if job.status not in ACTIVE_JOB_STATUSES),
+            key=lambda job: job.finished_at or job.created_at,
+        )
+        overflow = len(finished) - settings.JOB_HISTORY_LIMIT
+        for job in finished[:max(0, overflow)]:
+            self._jobs.pop(job.job_id, None)
+            self._dirty.discard(job.job_id)
+            self._written_seq.pop(job.job_id, None)
+            self._job_path(job.job_id).unlink(missing_ok=True)
+
+    # =========================================================================
+    # 제출 / 실행
+    # =========================================================================
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    def find_active(self, kind: str, dedupe_key: str) -> Optional[JobInfo]:
+        """같은 종류 + dedupe 키로 진행 중인 작업 조회"""
+        for job in self._jobs.values():
+            if job.kind == kind and job.dedupe_key == dedupe_key and job.status in ACTIVE_JOB_STATUSES:
+                return job
+        return None
+
+    def submit(
+        self,
+        kind: str,
+        params: Optional[Dict[str, Any]] = None,
+        dedupe_key: Optional[str] = None,
+    ) -> Tuple[JobInfo, bool]:
+        """
+        작업 제출
+
+        Returns:
+            (job, deduplicated) - 동일 작업이 진행 중이면 기존 작업과 True 반환
+        """
+        if kind not in _JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        if dedupe_key:
+            existing = self.find_active(kind, dedupe_key)
+            if existing:
+                logger.info(f"Reusing in-flight job {existing.job_id} for {kind}:{dedupe_key}")
+                return existing, True
+
+        job = JobInfo(
+            job_id=uuid.uuid4().hex[:16],
+            kind=kind,
+            dedupe_key=dedupe_key,
+            params=params or {},
+            created_at=datetime.now().isoformat(),
+        )
+        self._jobs[job.job_id] = job
+        self._persist(job)
+        self._start(job)
+        logger.info(f"Submitted job {job.job_id} ({kind})")
+        return job, False
+
+    def _start(self, job: JobInfo) -> None:
+        task = asyncio.create_task(self._run(job))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+
+    async def _run(self, job: JobInfo) -> None:
+        handler, _ = _JOB_HANDLERS[job.kind]
+        try:
+            async with self._get_semaphore():
+                if job.cancel_requested:
+                    raise JobCancelledError(job.job_id)
+
+                job.status = JOB_STATUS_RUNNING
+                job.started_at = datetime.now().isoformat()
+                await self._persist_async(job)
+
+                job.result = await handler(JobContext(self, job))
+                job.status = JOB_STATUS_COMPLETED
+                logger.info(f"Job {job.job_id} ({job.kind}) completed")
+
+        except (JobCancelledError, asyncio.CancelledError):
+            if not job.cancel_requested:
+                # 서버 종료로 인한 중단: 상태를 유지해 재시작 시 재개
+                logger.warning(f"Job {job.job_id} interrupted by shutdown; will resume on restart")
+                self._persist(job)
+                raise
+            job.status = JOB_STATUS_CANCELLED
+            logger.info(f"Job {job.job_id} ({job.kind}) cancelled")
+
+        except Exception as e:
+            job.status = JOB_STATUS_FAILED
+            job.error = str(e)
+            logger.error(f"Job {job.job_id} ({job.kind}) failed: {e}", exc_info=True)
+
+        job.finished_at = datetime.now().isoformat()
+        await self._persist_async(job)
+        self._prune_history()
+
+    async def resume_interrupted(self) -> List[str]:
+        """재시작 전 완료되지 않은 작업을 체크포인트부터 재개"""
+        resumed = []
+        for job in list(self._jobs.values()):
+            if job.status not in ACTIVE_JOB_STATUSES or job.job_id in self._tasks:
+                continue
+
+            entry = _JOB_HANDLERS.get(job.kind)
+            if entry is None or not entry[1]:
+                job.status = JOB_STATUS_FAILED
+                job.error = "서버 재시작으로 중단됨 (재개 불가 작업)"
+                job.finished_at = datetime.now().isoformat()
+                self._persist(job)
+                continue
+
+            job.status = JOB_STATUS_QUEUED
+            job.resume_count += 1
+            self._persist(job)
+            self._start(job)
+            resumed.append(job.job_id)
+
+        if resumed:
+            logger.info(f"Resumed {len(resumed)} interrupted jobs: {resumed}")
+        return resumed
+
+    # =========================================================================
+    # 조회 / 취소 / 대기
+    # =========================================================================
+
+    def get_job(self, job_id: str) -> Optional[JobInfo]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, kind: Optional[str] = None, status: Optional[str] = None) -> List[JobInfo]:
+        jobs = [
+            job for job in self._jobs.values()
+            if (kind is None or job.kind == kind) and (status is None or job.status == status)
+        ]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[JobInfo]:
+        """작업 취소 요청"""
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in ACTIVE_JOB_STATUSES:
+            return job
+
+        job.cancel_requested = True
+        self._persist(job)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        logger.info(f"Cancellation requested for job {job_id}")
+        return job
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[JobInfo]:
+        """작업 완료 대기 (대기자가 취소되어도 작업은 계속 실행)"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        return self._jobs.get(job_id)
+
+    async def shutdown(self) -> None:
+        """실행 중인 작업 중단 (상태는 유지되어 재시작 시 재개)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"Stopped {len(tasks)} running jobs for shutdown")
+
+        # 아직 저장되지 않은 진행률/체크포인트 반영
+        if self._flusher is not None:
+            self._flusher.cancel()
+        for job_id in list(self._dirty):
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._persist(job)
+        self._dirty.clear()
+
+
+# Singleton
+_job_service: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """Get or create JobService singleton."""
+    global _job_service
+    if _job_service is None:
+        _job_service = JobService()
+    return _job_service
@@ -10,30 +10,51 @@ CRITICAL CONSTRAINTS:
 - NULL KPI는 "※ 내부 데이터 미등록" 표시 필수
 """
 
+import asyncio
+import hashlib
+import json
 import time
-from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
+from app.config.config import settings
 from app.core.exceptions import ReportGenerationError
 from app.core.logging import get_logger
 from app.schemas.report_schema import (
     ErrorInfo,
     IssueForReport,
     KPIData,
+    ModifyTokenUsage,
     ProcessingMetadata,
     ReportGenerationRequest,
     ReportGenerationResponse,
     ReportModifyRequest,
     ReportModifyResponse,
     SectionData,
+    SectionTiming,
 )
+from app.infra.report_section_cache import get_report_section_cache, section_cache_key
+from app.llm.clients.embedding_provider import get_embeddings
 from app.llm.clients.openai_client import get_openai_client
+from app.llm.prompts.registry import (
+    PROMPT_FINANCIAL_SECTION,
+    PROMPT_IMPACT_SECTION,
+    PromptTemplateError,
+    get_prompt_registry,
+)
+from app.utils.evidence_packer import get_token_counter
+from app.utils.rate_limiter import AsyncRateLimiter
+from app.utils.report_html import (
+    BLOCK_ANALYSIS,
+    ReportBlock,
+    is_global_instruction,
+    match_blocks_by_name,
+    rewrap_block,
+    splice_blocks,
+    split_report_blocks,
+)
 
 logger = get_logger(__name__)
 
-# 프롬프트 템플릿 경로
-PROMPTS_DIR = Path(__file__).parent.parent / "llm" / "prompts" / "report"
-
 
 class ReportAssistantService:
     """
@@ -53,31 +74,22 @@ class ReportAssistantService:
         logger.info("Initialized ReportAssistantService")
 
     def _load_prompts(self):
-        """Load prompt templates from files"""
+        """Validate preloaded prompt templates (app/llm/prompts/registry.py)"""
         try:
-            impact_prompt_path = PROMPTS_DIR / "impact_section.txt"
-            financial_prompt_path = PROMPTS_DIR / "financial_section.txt"
-            full_report_prompt_path = PROMPTS_DIR / "v1_full_report.txt"
-
-            with open(impact_prompt_path, "r", encoding="utf-8") as f:
-                self.impact_prompt_template = f.read()
-
-            with open(financial_prompt_path, "r", encoding="utf-8") as f:
-                self.financial_prompt_template = f.read()
-
-            with open(full_report_prompt_path, "r", encoding="utf-8") as f:
-                self.full_report_prompt_template = f.read()
-
-            logger.info("Loaded prompt templates successfully")
-        except FileNotFoundError as e:
-            logger.error(f"Prompt template not found: {e}")
+            self.prompts = get_prompt_registry()
+        except PromptTemplateError as e:
+            logger.error(f"Prompt template error: {e}")
             raise ReportGenerationError(
-                message="프롬프트 템플릿을 찾을 수 없습니다",
-                details={"path": str(e)}
+                message="프롬프트 템플릿을 불러올 수 없습니다",
+                details={"error": str(e)}
             )
 
     async def generate_report(
-        self, request: ReportGenerationRequest
+        self,
+        request: ReportGenerationRequest,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        on_section: Optional[Callable[[SectionData, SectionTiming], None]] = None,
     ) -> ReportGenerationResponse:
         """
         ESG 보고서 생성
@@ -91,6 +103,9 @@ class ReportAssistantService:
 
         Args:
             request: 보고서 생성 요청
+            semaphore: 섹션 동시 생성 슬롯 (여러 보고서가 공유할 때 전달, 기본은 보고서별 생성)
+            rate_limiter: 섹션 LLM 호출 속도 상한 (일괄 생성 시 공유)
+            on_section: 섹션 완료 즉시 호출 (section, timing)
 
         Returns:
             ReportGenerationResponse
@@ -159,77 +174,17 @@ class ReportAssistantService:
                 },
             )
 
-            # 호환성: 기존 priority_issue_ids가 있으면 새 필드로 분배
-            impact_ids = set(request.impact_priority_issue_ids)
-            financial_ids = set(request.financial_priority_issue_ids)
-
-            # 기존 방식 호환 (priority_issue_ids만 있는 경우)
-            if not impact_ids and not financial_ids and request.priority_issue_ids:
-                # 기존 방식: 평균 점수로 정렬된 상위 5개를 양쪽에 분배
-                all_issues_by_id = {issue.get_issue_id: issue for issue in request.issues}
-                for issue_id in request.priority_issue_ids[:5]:
-                    impact_ids.add(issue_id)
-                    financial_ids.add(issue_id)
-
-            # 이슈 맵 생성
-            issues_by_id = {issue.get_issue_id: issue for issue in request.issues}
-
-            # 영향 중대성 상위 5개 이슈 추출
-            impact_issues = [
-                issues_by_id[issue_id]
-                for issue_id in request.impact_priority_issue_ids
-                if issue_id in issues_by_id
-            ][:5]
-
-            # 재무 중대성 상위 5개 이슈 추출
-            financial_issues = [
-                issues_by_id[issue_id]
-                for issue_id in request.financial_priority_issue_ids
-                if issue_id in issues_by_id
-            ][:5]
-
-            # 1. 영향 중대성 섹션 생성
-            impact_sections: list[SectionData] = []
-            for rank, issue in enumerate(impact_issues, 1):
-                kpi_data = request.kpi_data_by_issue.get(issue.get_issue_id, [])
-                section = await self._generate_impact_section(
-                    request.company_context,
-                    issue,
-                    kpi_data,
-                    rank,
-                )
-                impact_sections.append(section)
+            impact_issues, financial_issues = self._select_priority_issues(request)
 
-            # 2. 재무 중대성 섹션 생성
-            financial_sections: list[SectionData] = []
-            for rank, issue in enumerate(financial_issues, 1):
-                kpi_data = request.kpi_data_by_issue.get(issue.get_issue_id, [])
-                section = await self._generate_financial_section(
-                    request.company_context,
-                    issue,
-                    kpi_data,
-                    rank,
-                )
-                financial_sections.append(section)
-
-            # 3. 전체 보고서 HTML 통합
-            full_html = self._combine_sections_to_report(
-                request.company_context,
-                impact_sections,
-                financial_sections,
-                impact_issues,
-                financial_issues,
+            # 1-2. 영향/재무 중대성 섹션 동시 생성 (순서/순위는 입력 기준으로 고정)
+            section_specs = self._section_specs(impact_issues, financial_issues)
+            generated = await self._generate_sections(
+                request, section_specs, on_section=on_section, semaphore=semaphore, rate_limiter=rate_limiter
             )
 
-            # 4. 처리 시간 계산
-            processing_time_ms = int((time.time() - start_time) * 1000)
-
-            all_sections = impact_sections + financial_sections
-
-            logger.info(
-                f"Successfully generated report with {len(all_sections)} sections "
-                f"(impact: {len(impact_sections)}, financial: {len(financial_sections)}) "
-                f"in {processing_time_ms}ms"
+            # 3-4. 전체 보고서 HTML 통합 및 메타데이터
+            response = self._build_report_response(
+                request, impact_issues, financial_issues, generated, start_time
             )
 
             # =================================================================
@@ -292,17 +247,7 @@ class ReportAssistantService:
             # - response.metadata.ai_model → reports 테이블에 ai_model 컬럼 추가 권장
             # =================================================================
 
-            return ReportGenerationResponse(
-                success=True,
-                report_html=full_html,
-                sections=all_sections,
-                metadata=ProcessingMetadata(
-                    processing_time_ms=processing_time_ms,
-                    ai_model="gpt-4",
-                    tokens_used=None,
-                    sources_used=["internal_kpi", "issue_pool"],
-                ),
-            )
+            return response
 
         except Exception as e:
             logger.error(f"Failed to generate report: {str(e)}", exc_info=True)
@@ -315,12 +260,375 @@ class ReportAssistantService:
                 ),
             )
 
+    def _select_priority_issues(
+        self, request: ReportGenerationRequest
+    ) -> tuple[list[IssueForReport], list[IssueForReport]]:
+        """영향/재무 중대성 상위 5개 이슈 선택 (요청의 우선순위 순서 유지)"""
+        # 호환성: 기존 priority_issue_ids가 있으면 새 필드로 분배
+        impact_ids = set(request.impact_priority_issue_ids)
+        financial_ids = set(request.financial_priority_issue_ids)
+
+        # 기존 방식 호환 (priority_issue_ids만 있는 경우)
+        if not impact_ids and not financial_ids and request.priority_issue_ids:
+            # 기존 방식: 평균 점수로 정렬된 상위 5개를 양쪽에 분배
+            all_issues_by_id = {issue.get_issue_id: issue for issue in request.issues}
+            for issue_id in request.priority_issue_ids[:5]:
+                impact_ids.add(issue_id)
+                financial_ids.add(issue_id)
+
+        # 이슈 맵 생성
+        issues_by_id = {issue.get_issue_id: issue for issue in request.issues}
+
+        # 영향 중대성 상위 5개 이슈 추출
+        impact_issues = [
+            issues_by_id[issue_id]
+            for issue_id in request.impact_priority_issue_ids
+            if issue_id in issues_by_id
+        ][:5]
+
+        # 재무 중대성 상위 5개 이슈 추출
+        financial_issues = [
+            issues_by_id[issue_id]
+            for issue_id in request.financial_priority_issue_ids
+            if issue_id in issues_by_id
+        ][:5]
+
+        return impact_issues, financial_issues
+
+    @staticmethod
+    def _section_specs(
+        impact_issues: list[IssueForReport],
+        financial_issues: list[IssueForReport],
+    ) -> list[tuple[str, int, IssueForReport]]:
+        """생성할 섹션 목록 [(materiality_type, rank, issue), ...] (보고서 내 순서)"""
+        section_specs = [("impact", rank, issue) for rank, issue in enumerate(impact_issues, 1)]
+        section_specs += [("financial", rank, issue) for rank, issue in enumerate(financial_issues, 1)]
+        return section_specs
+
+    def _build_report_response(
+        self,
+        request: ReportGenerationRequest,
+        impact_issues: list[IssueForReport],
+        financial_issues: list[IssueForReport],
+        generated: list[tuple[SectionData, SectionTiming]],
+        start_time: float,
+    ) -> ReportGenerationResponse:
+        """생성된 섹션으로 전체 보고서 HTML/메타데이터 구성 (모든 섹션 실패 시 ReportGenerationError)"""
+        impact_sections = [section for section, _ in generated if section.materiality_type == "impact"]
+        financial_sections = [section for section, _ in generated if section.materiality_type == "financial"]
+        section_timings = [timing for _, timing in generated]
+        failed_sections = sum(1 for timing in section_timings if timing.status == "error")
+        if generated and failed_sections == len(generated):
+            raise ReportGenerationError(
+                message="모든 섹션 생성에 실패했습니다",
+                details={"errors": [section.error for section, _ in generated]},
+            )
+
+        # 3. 전체 보고서 HTML 통합
+        full_html = self._combine_sections_to_report(
+            request.company_context,
+            impact_sections,
+            financial_sections,
+            impact_issues,
+            financial_issues,
+        )
+
+        # 4. 처리 시간 계산
+        processing_time_ms = int((time.time() - start_time) * 1000)
+
+        all_sections = impact_sections + financial_sections
+
+        logger.info(
+            f"Successfully generated report with {len(all_sections)} sections "
+            f"(impact: {len(impact_sections)}, financial: {len(financial_sections)}, "
+            f"failed: {failed_sections}, cached: {sum(1 for t in section_timings if t.status == 'cached')}) "
+            f"in {processing_time_ms}ms "
+            f"(slowest section: {max((t.duration_ms for t in section_timings), default=0)}ms)"
+        )
+
+        return ReportGenerationResponse(
+            success=True,
+            report_html=full_html,
+            sections=all_sections,
+            metadata=ProcessingMetadata(
+                processing_time_ms=processing_time_ms,
+                ai_model="gpt-4",
+                tokens_used=None,
+                sources_used=["internal_kpi", "issue_pool"],
+                total_issues=len(request.issues),
+                sections_generated=len(all_sections) - failed_sections,
+                section_timings=section_timings,
+                failed_sections=failed_sections,
+                prompt_version=self.prompts.version,
+                cached_sections=[
+                    f"{timing.materiality_type}-{timing.issue_id}"
+                    for timing in section_timings
+                    if timing.status == "cached"
+                ],
+            ),
+        )
+
+    def _section_cache_key(
+        self,
+        request: ReportGenerationRequest,
+        materiality_type: str,
+        rank: int,
+        issue: IssueForReport,
+    ) -> str:
+        """
+        섹션 캐시 키
+
+        (회사, 연도, 이슈 ID, 중대성 유형, 순위, KPI 해시, 프롬프트 버전, 모델)에 더해
+        프롬프트에 들어가는 회사명/업종, 이슈명/카테고리/점수도 포함합니다.
+        """
+        company = request.company_context
+        kpi_data = request.kpi_data_by_issue.get(issue.get_issue_id, [])
+        kpi_hash = hashlib.sha256(
+            json.dumps([kpi.model_dump() for kpi in kpi_data], sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        prompt_name = PROMPT_IMPACT_SECTION if materiality_type == "impact" else PROMPT_FINANCIAL_SECTION
+        return section_cache_key(
+            company_id=company.company_id,
+            company_name=company.company_name,
+            industry=company.industry,
+            year=company.year,
+            issue_id=issue.get_issue_id,
+            issue_name=issue.get_issue_name,
+            category=issue.category,
+            score=issue.impact_score if materiality_type == "impact" else issue.financial_score,
+            materiality_type=materiality_type,
+            priority_rank=rank,
+            kpi_hash=kpi_hash,
+            prompt_version=self.prompts.get(prompt_name).version,
+            model=get_openai_client().model,
+        )
+
+    async def _generate_sections(
+        self,
+        request: ReportGenerationRequest,
+        section_specs: list[tuple[str, int, IssueForReport]],
+        on_section: Optional[Callable[[SectionData, SectionTiming], None]] = None,
+        on_delta: Optional[Callable[[str, int, IssueForReport, str], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> list[tuple[SectionData, SectionTiming]]:
+        """
+        섹션 동시 생성 (REPORT_SECTION_CONCURRENCY 상한)
+
+        한 섹션이 실패해도 나머지는 계속 생성하고, 실패한 섹션은 안내문 섹션으로 대체합니다.
+        입력이 같은 섹션은 섹션 캐시에서 재사용합니다 (request.use_cache=False면 새로 생성해 캐시 갱신).
+
+        Args:
+            on_section: 섹션 완료 즉시 호출 (section, timing)
+            on_delta: 토큰 스트리밍 시 호출 (materiality_type, rank, issue, delta)
+            semaphore: 공유 동시 생성 슬롯 (없으면 REPORT_SECTION_CONCURRENCY 크기로 생성)
+            rate_limiter: 공유 호출 속도 상한 (캐시 적중 섹션은 소비하지 않음)
+
+        Returns:
+            section_specs 순서의 (섹션, 생성 시간) 목록
+        """
+        semaphore = semaphore or asyncio.Semaphore(max(1, settings.REPORT_SECTION_CONCURRENCY))
+        company = request.company_context
+
+        cache = get_report_section_cache() if settings.REPORT_SECTION_CACHE_ENABLED else None
+        cache_keys = [self._section_cache_key(request, *spec) for spec in section_specs] if cache else []
+        cached: dict[str, dict[str, Any]] = {}
+        if cache is not None and request.use_cache:
+            try:
+                cached = await asyncio.to_thread(cache.get_many, cache_keys)
+            except Exception as e:
+                logger.warning(f"Section cache lookup failed: {e}")
+
+        async def _run(
+            index: int, materiality_type: str, rank: int, issue: IssueForReport
+        ) -> tuple[SectionData, SectionTiming]:
+            cache_key = cache_keys[index] if cache is not None else None
+            if cache_key in cached:
+                section = SectionData(**{**cached[cache_key], "cached": True})
+                timing = SectionTiming(
+                    issue_id=issue.get_issue_id,
+                    materiality_type=materiality_type,
+                    priority_rank=rank,
+                    duration_ms=0,
+                    status="cached",
+                )
+                if on_section is not None:
+                    on_section(section, timing)
+                return section, timing
+
+            async with semaphore:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                started = time.perf_counter()
+                kpi_data = request.kpi_data_by_issue.get(issue.get_issue_id, [])
+                generate = (
+                    self._generate_impact_section if materiality_type == "impact"
+                    else self._generate_financial_section
+                )
+                section_delta = (
+                    (lambda delta: on_delta(materiality_type, rank, issue, delta)) if on_delta else None
+                )
+                try:
+                    section = await generate(request.company_context, issue, kpi_data, rank, on_delta=section_delta)
+                    status = "ok"
+                except Exception as e:
+                    logger.error(
+                        f"Failed to generate {materiality_type} section for {issue.get_issue_name} (rank {rank}): {e}"
+                    )
+                    section = self._failed_section(materiality_type, issue, kpi_data, rank, str(e))
+                    status = "error"
+                timing = SectionTiming(
+                    issue_id=issue.get_issue_id,
+                    materiality_type=materiality_type,
+                    priority_rank=rank,
+                    duration_ms=int((time.perf_counter() - started) * 1000),
+                    status=status,
+                )
+
+            if on_section is not None:
+                on_section(section, timing)
+            if cache_key is not None and status == "ok":
+                try:
+                    await asyncio.to_thread(
+                        cache.put_many, [(cache_key, company.company_id, company.year, section.model_dump())]
+                    )
+                except Exception as e:
+                    logger.warning(f"Section cache store failed: {e}")
+            return section, timing
+
+        generated = list(await asyncio.gather(*(_run(i, *spec) for i, spec in enumerate(section_specs))))
+        if cached:
+            logger.info(f"Section cache: {sum(1 for _, t in generated if t.status == 'cached')}/{len(generated)} hits")
+        return generated
+
+    async def iter_report_events(
+        self,
+        request: ReportGenerationRequest,
+        stream_tokens: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        보고서 생성 이벤트를 발생 순서대로 반환 (섹션 완료 즉시 전송)
+
+        Yields:
+            {"type": "start", "sections": [{"issue_id", "issue_name", "materiality_type", "priority_rank"}]}
+            {"type": "delta", "issue_id", "materiality_type", "priority_rank", "text"} - stream_tokens=True일 때
+            {"type": "section", "section": SectionData, "timing": SectionTiming}
+            {"type": "done", "report": ReportGenerationResponse} - 통합 HTML + 메타데이터
+            {"type": "error", "code", "message", "details"} - 섹션 생성 작업 자체가 실패한 경우 (마지막 이벤트)
+        """
+        start_time = time.time()
+        impact_issues, financial_issues = self._select_priority_issues(request)
+        section_specs = self._section_specs(impact_issues, financial_issues)
+        events: asyncio.Queue = asyncio.Queue()
+
+        yield {
+            "type": "start",
+            "sections": [
+                {
+                    "issue_id": issue.get_issue_id,
+                    "issue_name": issue.get_issue_name,
+                    "materiality_type": materiality_type,
+                    "priority_rank": rank,
+                }
+                for materiality_type, rank, issue in section_specs
+            ],
+        }
+
+        def _on_section(section: SectionData, timing: SectionTiming) -> None:
+            events.put_nowait({"type": "section", "section": section.model_dump(), "timing": timing.model_dump()})
+
+        def _on_delta(materiality_type: str, rank: int, issue: IssueForReport, delta: str) -> None:
+            events.put_nowait({
+                "type": "delta",
+                "issue_id": issue.get_issue_id,
+                "materiality_type": materiality_type,
+                "priority_rank": rank,
+                "text": delta,
+            })
+
+        task = asyncio.create_task(self._generate_sections(
+            request, section_specs, on_section=_on_section, on_delta=_on_delta if stream_tokens else None,
+        ))
+        try:
+            # 이벤트와 생성 작업을 함께 대기 (작업이 모든 섹션 이벤트 전에 예외로 끝나도 멈추지 않도록)
+            while not task.done():
+                getter = asyncio.ensure_future(events.get())
+                try:
+                    await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    if not getter.done():
+                        getter.cancel()
+                if getter.done() and not getter.cancelled():
+                    yield getter.result()
+            while not events.empty():
+                yield events.get_nowait()
+
+            error = asyncio.CancelledError("section generation cancelled") if task.cancelled() else task.exception()
+            if error is not None:
+                logger.error(f"Report section generation failed: {error!r}", exc_info=error)
+                yield {
+                    "type": "error",
+                    "code": "ESG-AI-RPT-001",
+                    "message": "보고서 생성 중 오류가 발생했습니다",
+                    "details": str(error),
+                }
+                return
+            generated = task.result()
+        finally:
+            # 소비자가 중단한 경우 (클라이언트 연결 종료) 남은 섹션 생성 취소
+            if not task.done():
+                task.cancel()
+
+        try:
+            response = self._build_report_response(
+                request, impact_issues, financial_issues, generated, start_time
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate report: {str(e)}", exc_info=True)
+            response = ReportGenerationResponse(
+                success=False,
+                error=ErrorInfo(code="ESG-AI-RPT-001", message="보고서 생성 실패", details=str(e)),
+            )
+        yield {"type": "done", "report": response.model_dump()}
+
+    def _failed_section(
+        self,
+        materiality_type: str,
+        issue: IssueForReport,
+        kpi_data: list[KPIData],
+        priority_rank: int,
+        error: str,
+    ) -> SectionData:
+        """생성 실패 섹션 (보고서 구조와 목차를 유지하기 위한 안내문)"""
+        _, missing_kpis = self._format_kpi_data(kpi_data)
+        category_kr = self._get_category_kr(issue.category)
+        badge_class = "priority-badge financial" if materiality_type == "financial" else "priority-badge"
+
+        wrapped_html = f"""
+<section class="{materiality_type}-issue-detail" id="{materiality_type}-{issue.get_issue_id}" data-issue-id="{issue.get_issue_id}" data-category="{issue.category}" data-priority="{priority_rank}" data-error="true">
+    <h3 class="issue-title"><span class="{badge_class}">{priority_rank}.</span>{issue.get_issue_name}<span class="category-badge category-{issue.category}">{category_kr}</span></h3>
+    <p class="no-data">※ 섹션 생성에 실패했습니다. 다시 생성해 주세요.</p>
+</section>
+"""
+        return SectionData(
+            issue_id=issue.get_issue_id,
+            issue_name=issue.get_issue_name,
+            category=issue.category,
+            materiality_type=materiality_type,
+            priority_rank=priority_rank,
+            section_html=wrapped_html,
+            has_kpi_data=any(not kpi.is_null for kpi in kpi_data),
+            missing_kpis=missing_kpis,
+            error=error,
+        )
+
     async def _generate_impact_section(
         self,
         company_context,
         issue: IssueForReport,
         kpi_data: list[KPIData],
         priority_rank: int,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> SectionData:
         """
         영향 중대성 이슈 섹션 HTML 생성
@@ -359,6 +667,7 @@ class ReportAssistantService:
             impact_score=issue.impact_score,
             kpi_data=kpi_data_dicts,
             priority_rank=priority_rank,
+            on_delta=on_delta,
         )
 
         # 섹션 HTML 래핑
@@ -389,6 +698,7 @@ class ReportAssistantService:
         issue: IssueForReport,
         kpi_data: list[KPIData],
         priority_rank: int,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> SectionData:
         """
         재무 중대성 이슈 섹션 HTML 생성
@@ -428,6 +738,7 @@ class ReportAssistantService:
             financial_score=issue.financial_score,
             kpi_data=kpi_data_dicts,
             priority_rank=priority_rank,
+            on_delta=on_delta,
         )
 
         # 섹션 HTML 래핑
@@ -807,6 +1118,10 @@ class ReportAssistantService:
         """
         자연어 명령으로 보고서 수정
 
+        생성 보고서 HTML이면 지시가 가리키는 섹션만 LLM에 보내고 결과를 원래 위치에
+        다시 끼워 넣습니다 (나머지 HTML은 그대로 유지). 섹션 구조가 없는 보고서만
+        전체를 보내 수정합니다.
+
         Args:
             request: 수정 요청 (현재 보고서 + 수정 지시)
 
@@ -818,22 +1133,38 @@ class ReportAssistantService:
                 f"Modifying report with instruction: {request.instruction[:50]}..."
             )
 
-            openai_client = get_openai_client()
+            blocks = split_report_blocks(request.current_report)
+            if not blocks:
+                return await self._modify_full_report(request)
 
-            modified_markdown = await openai_client.modify_report(
-                current_report=request.current_report,
-                instruction=request.instruction,
-            )
+            targets, located_by = await self._locate_blocks(blocks, request)
+            replacements, token_usage = await self._modify_blocks(targets, request)
+            if not replacements:
+                raise ReportGenerationError(
+                    message="수정된 섹션이 없습니다",
+                    details={"targets": [block.block_id for block in targets]},
+                )
 
-            modified_html = self._markdown_to_html(modified_markdown)
+            modified_html = splice_blocks(request.current_report, blocks, replacements)
+            modified_titles = [block.title for block in targets if block.block_id in replacements]
+            skipped = [block.block_id for block in targets if block.block_id not in replacements]
 
-            logger.info("Report modification completed successfully")
+            logger.info(
+                f"Report modification completed: {len(replacements)}/{len(blocks)} sections "
+                f"(located by {located_by}, saved {token_usage.saved_tokens} tokens"
+                f"{f', kept original: {skipped}' if skipped else ''})"
+            )
 
             return ReportModifyResponse(
                 success=True,
-                modified_report=modified_markdown,
+                modified_report=modified_html,
                 modified_html=modified_html,
+                changes_summary=f"수정된 섹션: {', '.join(modified_titles)}",
                 message="보고서가 성공적으로 수정되었습니다.",
+                scope="sections",
+                located_by=located_by,
+                modified_sections=list(replacements),
+                token_usage=token_usage,
             )
 
         except Exception as e:
@@ -848,6 +1179,149 @@ class ReportAssistantService:
                 ),
             )
 
+    async def _modify_full_report(self, request: ReportModifyRequest) -> ReportModifyResponse:
+        """섹션 구조가 없는 보고서 수정 (전체 전송, Markdown 응답을 HTML로 변환)"""
+        openai_client = get_openai_client()
+
+        modified_markdown = await openai_client.modify_report(
+            current_report=request.current_report,
+            instruction=request.instruction,
+        )
+
+        modified_html = self._markdown_to_html(modified_markdown)
+
+        logger.info("Report modification completed successfully (full report)")
+
+        return ReportModifyResponse(
+            success=True,
+            modified_report=modified_markdown,
+            modified_html=modified_html,
+            message="보고서가 성공적으로 수정되었습니다.",
+            scope="full",
+        )
+
+    async def _locate_blocks(
+        self, blocks: list[ReportBlock], request: ReportModifyRequest
+    ) -> tuple[list[ReportBlock], str]:
+        """
+        수정 대상 블록 찾기
+
+        우선순위: 요청의 section_ids → 보고서 전반 지시 → 이슈명/제목 → 임베딩 유사도
+        → (찾지 못하면) 모든 이슈/결론 섹션
+
+        Returns:
+            (대상 블록, 찾은 방법)
+        """
+        editable = [block for block in blocks if block.kind != BLOCK_ANALYSIS]
+
+        if request.section_ids:
+            wanted = set(request.section_ids)
+            targets = [
+                block for block in blocks
+                if block.block_id in wanted or block.block_id.split("-", 1)[-1] in wanted
+            ]
+            if not targets:
+                raise ReportGenerationError(
+                    message="요청한 섹션을 보고서에서 찾을 수 없습니다",
+                    details={"section_ids": request.section_ids},
+                )
+            return targets, "section_ids"
+
+        if is_global_instruction(request.instruction):
+            return editable, "global"
+
+        targets = match_blocks_by_name(blocks, request.instruction)
+        if targets:
+            return targets, "name"
+
+        try:
+            targets = await asyncio.to_thread(self._rank_blocks_by_embedding, blocks, request.instruction)
+        except Exception as e:
+            logger.warning(f"Embedding section lookup failed: {e}")
+            targets = []
+        if targets:
+            return targets, "embedding"
+
+        return editable, "all"
+
+    @staticmethod
+    def _rank_blocks_by_embedding(blocks: list[ReportBlock], instruction: str) -> list[ReportBlock]:
+        """지시문과 유사도가 임계값 이상인 블록 (최고 점수 근처만, 최대 REPORT_MODIFY_MAX_SECTIONS개)"""
+        embeddings = get_embeddings()
+        query = embeddings.embed_query(instruction)
+        vectors = embeddings.embed_documents([f"{block.title}\n{block.text[:1000]}" for block in blocks])
+
+        def _cosine(a: list[float], b: list[float]) -> float:
+            dot = sum(x * y for x, y in zip(a, b))
+            norm = (sum(x * x for x in a) ** 0.5) * (sum(y * y for y in b) ** 0.5)
+            return dot / norm if norm else 0.0
+
+        scored = sorted(
+            ((_cosine(query, vector), block) for vector, block in zip(vectors, blocks)),
+            key=lambda pair: pair[0],
+            reverse=True,
+        )
+        if not scored or scored[0][0] < settings.REPORT_MODIFY_SIMILARITY_THRESHOLD:
+            return []
+        best = scored[0][0]
+        selected = [
+            block for score, block in scored
+            if score >= settings.REPORT_MODIFY_SIMILARITY_THRESHOLD and best - score <= 0.05
+        ][:max(1, settings.REPORT_MODIFY_MAX_SECTIONS)]
+        logger.info(f"Located sections by embedding: {[(b.block_id, round(s, 3)) for s, b in scored[:3]]}")
+        return [block for block in blocks if block in selected]
+
+    async def _modify_blocks(
+        self, targets: list[ReportBlock], request: ReportModifyRequest
+    ) -> tuple[dict[str, str], ModifyTokenUsage]:
+        """
+        대상 블록 동시 수정 (REPORT_SECTION_CONCURRENCY 상한)
+
+        응답의 태그 짝이 맞지 않거나 호출이 실패한 블록은 원본을 유지합니다.
+
+        Returns:
+            ({block_id: 수정된 HTML}, 토큰 사용량)
+        """
+        openai_client = get_openai_client()
+        count_tokens = get_token_counter(openai_client.model)
+        instruction_tokens = count_tokens(request.instruction)
+        semaphore = asyncio.Semaphore(max(1, settings.REPORT_SECTION_CONCURRENCY))
+
+        async def _run(block: ReportBlock) -> tuple[ReportBlock, Optional[str], int]:
+            block_tokens = count_tokens(block.html)
+            async with semaphore:
+                try:
+                    result = await openai_client.modify_section(
+                        section_html=block.html,
+                        instruction=request.instruction,
+                        company_name=request.company_name,
+                        max_tokens=min(4096, max(1024, block_tokens * 2)),
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to modify section {block.block_id}: {e}")
+                    return block, None, 0
+            modified = rewrap_block(block, result)
+            if modified is None:
+                logger.warning(f"Discarded malformed HTML for section {block.block_id}")
+            return block, modified, count_tokens(result)
+
+        results = await asyncio.gather(*(_run(block) for block in targets))
+
+        replacements = {block.block_id: modified for block, modified, _ in results if modified is not None}
+        sent_tokens = sum(count_tokens(block.html) + instruction_tokens for block in targets)
+        returned_tokens = sum(tokens for _, _, tokens in results)
+        report_tokens = count_tokens(request.current_report)
+        # 전체 전송 방식: 보고서 + 지시 입력, 보고서 전체 출력
+        full_report_tokens = 2 * report_tokens + instruction_tokens
+        saved_tokens = full_report_tokens - sent_tokens - returned_tokens
+        return replacements, ModifyTokenUsage(
+            sent_tokens=sent_tokens,
+            returned_tokens=returned_tokens,
+            full_report_tokens=full_report_tokens,
+            saved_tokens=saved_tokens,
+            saved_ratio=round(saved_tokens / full_report_tokens, 3) if full_report_tokens else 0.0,
+        )
+
     def _markdown_to_html(self, markdown_text: str) -> str:
         """
         간단한 Markdown to HTML 변환
@@ -872,7 +1346,13 @@ class ReportAssistantService:
         return html
 
 
-# 서비스 인스턴스 생성을 위한 팩토리 함수
+# Singleton instance
+_report_assistant_service: Optional[ReportAssistantService] = None
+
+
 def get_report_assistant_service() -> ReportAssistantService:
-    """Get or create ReportAssistantService instance"""
-    return ReportAssistantService()
+    """Get or create ReportAssistantService singleton"""
+    global _report_assistant_service
+    if _report_assistant_service is None:
+        _report_assistant_service = ReportAssistantService()
+    return _report_assistant_service
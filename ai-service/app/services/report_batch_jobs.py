@@ -0,0 +1,156 @@
+"""
+Report Batch Generation Job
+
+여러 회사의 보고서 초안을 JobService 작업 하나로 생성
+- reports.generate_batch: 모든 회사의 섹션이 하나의 동시 생성 슬롯(REPORT_BATCH_CONCURRENCY)과
+  호출 속도 상한(REPORT_BATCH_SECTIONS_PER_MIN)을 공유
+- 프롬프트 레지스트리/섹션 캐시를 그대로 사용하므로 입력이 같은 섹션은 LLM을 호출하지 않음
+- 초안이 완성될 때마다 보고서 저장소에 기록하고 체크포인트 저장 (재시작 시 완료된 회사는 건너뜀)
+- 회사 하나의 생성/저장 실패는 해당 회사 결과에 오류로 기록하고 나머지 회사는 계속 진행
+- 결과: 회사별 report_id + 전체 처리량 (sections/min)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.repositories.report_document_repository import get_report_document_repository
+from app.schemas.report_schema import ReportGenerationRequest, SectionData, SectionTiming
+from app.services.job_service import JobContext, get_job_service, register_job_handler
+from app.services.report_assistant_service import get_report_assistant_service
+from app.utils.rate_limiter import AsyncRateLimiter
+
+logger = get_logger(__name__)
+
+JOB_KIND_REPORT_BATCH = "reports.generate_batch"
+
+_CANCEL_POLL_SEC = 1.0
+
+
+def submit_report_batch(
+    requests: List[ReportGenerationRequest],
+    concurrency: Optional[int] = None,
+    sections_per_minute: Optional[int] = None,
+):
+    """일괄 생성 작업 등록 (같은 요청 묶음이 진행 중이면 재사용)"""
+    payload = [request.model_dump() for request in requests]
+    dedupe_key = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+    return get_job_service().submit(
+        JOB_KIND_REPORT_BATCH,
+        {"requests": payload, "concurrency": concurrency, "sections_per_minute": sections_per_minute},
+        dedupe_key=dedupe_key,
+    )
+
+
+def _report_id(request: ReportGenerationRequest, job_id: str) -> str:
+    company = request.company_context
+    return f"{company.company_id}_{company.year}_{datetime.now():%Y%m%d%H%M%S}_{job_id[:6]}"
+
+
+async def run_report_batch(ctx: JobContext) -> Dict[str, Any]:
+    """보고서 일괄 생성 작업"""
+    requests = [ReportGenerationRequest(**params) for params in ctx.params.get("requests", [])]
+    concurrency = ctx.params.get("concurrency") or settings.REPORT_BATCH_CONCURRENCY
+    rate = ctx.params.get("sections_per_minute")
+    rate = settings.REPORT_BATCH_SECTIONS_PER_MIN if rate is None else rate
+
+    service = get_report_assistant_service()
+    store = get_report_document_repository()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    rate_limiter = AsyncRateLimiter(rate)
+
+    completed: Dict[str, Dict[str, Any]] = dict(ctx.checkpoint.get("completed", {}))
+    pending = [(index, request) for index, request in enumerate(requests) if str(index) not in completed]
+    # 회사당 최대 10개 섹션 (영향/재무 각 5개)
+    total_sections = sum(
+        len(request.impact_priority_issue_ids[:5]) + len(request.financial_priority_issue_ids[:5])
+        for _, request in pending
+    )
+    counts = {"sections": 0, "generated": 0, "cached": 0, "failed": 0}
+    started = time.perf_counter()
+
+    def _on_section(section: SectionData, timing: SectionTiming) -> None:
+        # 작업 파일 저장은 JobService가 JOB_PERSIST_INTERVAL_SEC 간격으로 모아서 수행
+        counts["sections"] += 1
+        key = {"ok": "generated", "cached": "cached"}.get(timing.status, "failed")
+        counts[key] += 1
+        ctx.report_progress(
+            "generate",
+            current=counts["sections"],
+            total=max(total_sections, counts["sections"]),
+            message=f"{len(completed)}/{len(requests)} drafts",
+        )
+
+    async def _run(index: int, request: ReportGenerationRequest) -> None:
+        company = request.company_context
+        entry: Dict[str, Any] = {"company_id": company.company_id, "year": company.year}
+        try:
+            response = await service.generate_report(
+                request, semaphore=semaphore, rate_limiter=rate_limiter, on_section=_on_section
+            )
+            entry["success"] = response.success
+            if response.success:
+                report_id = _report_id(request, ctx.job_id)
+                await store.save_report(
+                    report_id,
+                    {"company_context": company.model_dump(), "job_id": ctx.job_id, **response.model_dump()},
+                    company_id=company.company_id,
+                    year=company.year,
+                )
+                entry.update(
+                    report_id=report_id,
+                    sections=response.metadata.sections_generated if response.metadata else 0,
+                    cached_sections=len(response.metadata.cached_sections) if response.metadata else 0,
+                    failed_sections=response.metadata.failed_sections if response.metadata else 0,
+                )
+            else:
+                entry["error"] = response.error.details if response.error else "unknown error"
+        except Exception as e:
+            # 회사 하나의 실패(저장소 오류 등)가 나머지 회사 생성을 중단하지 않도록 결과에 기록
+            logger.error(f"Batch draft failed for {company.company_id} ({company.year}): {e}", exc_info=True)
+            entry = {"company_id": company.company_id, "year": company.year, "success": False, "error": str(e)}
+        completed[str(index)] = entry
+        ctx.save_checkpoint(completed=completed)
+        logger.info(f"Batch draft {len(completed)}/{len(requests)}: {company.company_id} ({company.year})")
+
+    ctx.report_progress("generate", 0, total_sections, f"{len(completed)}/{len(requests)} drafts")
+    tasks = {asyncio.create_task(_run(index, request)) for index, request in pending}
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, timeout=_CANCEL_POLL_SEC)
+            for task in done:
+                task.result()
+            ctx.check_cancelled()
+    finally:
+        # 취소/서버 종료 시 남은 회사 생성 중단 (완료분은 체크포인트에 남음)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    elapsed = time.perf_counter() - started
+    reports = [completed[str(index)] for index in range(len(requests)) if str(index) in completed]
+    ctx.report_progress("done", counts["sections"], total_sections)
+    return {
+        "success": all(report["success"] for report in reports),
+        "reports": reports,
+        "drafts": sum(1 for report in reports if report["success"]),
+        "sections_total": counts["sections"],
+        "sections_generated": counts["generated"],
+        "sections_cached": counts["cached"],
+        "sections_failed": counts["failed"],
+        "elapsed_sec": round(elapsed, 2),
+        "sections_per_min": round(counts["sections"] / elapsed * 60, 1) if elapsed else 0.0,
+        "generated_sections_per_min": round(counts["generated"] / elapsed * 60, 1) if elapsed else 0.0,
+        "concurrency": concurrency,
+        "sections_per_minute_limit": rate or None,
+    }
+
+
+register_job_handler(JOB_KIND_REPORT_BATCH, run_report_batch)
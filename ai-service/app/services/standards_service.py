@@ -15,15 +15,14 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from pypdf import PdfReader
-from openai import OpenAI
 from sentence_transformers import SentenceTransformer
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
 from app.config.config import settings
 from app.core.logging import get_logger
+from app.llm.clients.llm_gateway import get_llm_gateway
+from app.utils.pdf_extractor import extract_text
 
 logger = get_logger(__name__)
 
@@ -55,18 +54,14 @@ class StandardsExtractor:
     """GRI/SASB 표준에서 공시 요구사항 추출"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_llm_gateway().openai()
         self.model = "gpt-4o-mini"
         logger.info("StandardsExtractor initialized")
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """PDF 파일에서 텍스트 추출"""
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return extract_text(pdf_path, separator="\n")
         except Exception as e:
             logger.error(f"Error reading {pdf_path}: {e}")
             return ""
@@ -219,11 +214,11 @@ class KoreanMaterialityMapper:
         self.korean_items = KOREAN_MATERIALITY_ITEMS
 
         # 임베딩 생성
-        self.embeddings = OpenAIEmbeddings(
+        self.embeddings = get_llm_gateway().embeddings(
             model=settings.EMBEDDING_MODEL if hasattr(settings, 'OPENAI_EMBEDDING_MODEL')
             else "text-embedding-3-large"
         )
-        self.llm = ChatOpenAI(model=settings.OPENAI_MODEL)
+        self.llm = get_llm_gateway().chat_model(model=settings.OPENAI_MODEL)
 
         # 한국어 항목 임베딩 생성
         logger.info("Generating embeddings for Korean materiality items...")
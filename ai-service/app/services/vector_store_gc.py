@@ -0,0 +1,298 @@
+"""
+Vector Store Lifecycle / Garbage Collection
+
+보고서 벡터 스토어(<root>/<report_hash>)의 참조를 업로드 PDF 기준으로 추적하고
+더 이상 참조되지 않는 스토어를 정리
+- 참조: 업로드 폴더(벤치마킹/레거시)에 남아 있는 PDF의 보고서 해시, 그리고 업로드 폴더 밖
+  PDF 경로로 분석한 스토어는 메타데이터 sources에 기록된 원본 파일이 같은 내용으로 남아 있는 동안
+- 수집 대상: 참조 없는 스토어, chroma.sqlite3가 없는 불완전 스토어
+- 보호: 진행 중 수집(ingest) 작업의 스토어, 최근 VECTOR_STORE_GC_MIN_AGE_SEC 내 수정된 스토어,
+  질의 중인(풀에서 빌려간) 스토어 (다음 실행에서 다시 판단)
+- 남은 스토어는 SQLite 여유 페이지를 VACUUM으로 회수하고, 세그먼트 테이블에 없는
+  HNSW 세그먼트 디렉토리를 삭제
+- vector_stores.gc: 같은 정리를 JobService 작업으로 실행 (요청 시 + 배치 스케줄러)
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.config.config import settings
+from app.core.logging import get_logger
+from app.infra.benchmark_index import get_benchmark_index
+from app.infra.vector_store_pool import get_vector_store_pool
+from app.schemas.job_schema import ACTIVE_JOB_STATUSES
+from app.services.benchmark_service import (
+    BENCHMARK_UPLOADS_DIR,
+    BENCHMARK_VECTOR_STORE_DIR,
+    LEGACY_UPLOADS_DIR,
+    LEGACY_VECTOR_STORE_DIR,
+    get_benchmark_service,
+)
+from app.services.ingestion_jobs import COLLECTION_BENCHMARK, JOB_KIND_INGEST_DOCUMENT
+from app.services.job_service import JobContext, get_job_service, register_job_handler
+
+logger = get_logger(__name__)
+
+JOB_KIND_VECTOR_STORE_GC = "vector_stores.gc"
+
+CHROMA_DB_FILE = "chroma.sqlite3"
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _store_roots() -> Dict[str, Path]:
+    """컬렉션 → 스토어 루트 디렉토리"""
+    roots = {COLLECTION_BENCHMARK: BENCHMARK_VECTOR_STORE_DIR}
+    if LEGACY_VECTOR_STORE_DIR != BENCHMARK_VECTOR_STORE_DIR:
+        roots["legacy"] = LEGACY_VECTOR_STORE_DIR
+    return roots
+
+
+def live_report_hashes() -> Set[str]:
+    """업로드 폴더에 남아 있는 PDF와 스토어에 기록된 외부 원본 PDF의 보고서 해시 (스토어 참조 집합)"""
+    service = get_benchmark_service()
+    hashes: Set[str] = set()
+    for directory in {BENCHMARK_UPLOADS_DIR, LEGACY_UPLOADS_DIR}:
+        if directory.exists():
+            hashes.update(service.get_report_hash(str(p)) for p in directory.glob("*.pdf"))
+    for root in _store_roots().values():
+        if not root.exists():
+            continue
+        for store_dir in root.iterdir():
+            if store_dir.name in hashes or not store_dir.is_dir():
+                continue
+            # 파일이 바뀌었으면(해시 불일치) 더 이상 이 스토어를 참조하지 않음
+            if any(
+                os.path.isfile(source) and service.get_report_hash(source) == store_dir.name
+                for source in service.get_store_sources(store_dir)
+            ):
+                hashes.add(store_dir.name)
+    return hashes
+
+
+def _ingesting_hashes() -> Set[str]:
+    """진행 중 수집 작업이 쓰고 있는 보고서 해시 (dedupe 키: '<collection>:<hash>')"""
+    return {
+        job.dedupe_key.partition(":")[2]
+        for job in get_job_service().list_jobs(kind=JOB_KIND_INGEST_DOCUMENT)
+        if job.dedupe_key and job.status in ACTIVE_JOB_STATUSES
+    }
+
+
+def _orphan_segments(store_dir: Path) -> List[Path]:
+    """segments 테이블에 없는 세그먼트 디렉토리 (컬렉션 삭제/재생성 후 남은 HNSW 파일)"""
+    conn = sqlite3.connect(str(store_dir / CHROMA_DB_FILE))
+    try:
+        live = {row[0] for row in conn.execute("SELECT id FROM segments")}
+    finally:
+        conn.close()
+    return [d for d in store_dir.iterdir() if d.is_dir() and d.name not in live]
+
+
+def _vacuum(db_path: Path) -> None:
+    conn = sqlite3.connect(str(db_path), timeout=5)
+    try:
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+
+def _compact_store(store_dir: Path, dry_run: bool) -> int:
+    """
+    남은 스토어 압축
+
+    Returns:
+        회수한 바이트 (dry_run이면 예상치)
+    """
+    reclaimed = 0
+    for segment_dir in _orphan_segments(store_dir):
+        reclaimed += _dir_size(segment_dir)
+        if not dry_run:
+            shutil.rmtree(segment_dir)
+
+    db_path = store_dir / CHROMA_DB_FILE
+    conn = sqlite3.connect(str(db_path))
+    try:
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+    if free_pages < settings.VECTOR_STORE_GC_MIN_FREE_PAGES:
+        return reclaimed
+
+    if dry_run:
+        return reclaimed + free_pages * page_size
+    before = db_path.stat().st_size
+    _vacuum(db_path)
+    return reclaimed + max(0, before - db_path.stat().st_size)
+
+
+def release_report_stores(report_hashes: Iterable[str]) -> Dict[str, int]:
+    """
+    참조가 사라진 보고서의 스토어 즉시 정리 (PDF 삭제 직후 호출)
+
+    아직 다른 업로드가 같은 보고서를 참조하면 유지하고, 질의 중인 스토어는 다음 GC 실행에 맡깁니다.
+
+    Returns:
+        {report_hash: 회수한 바이트} (삭제한 것만)
+    """
+    candidates = set(report_hashes)
+    if not candidates:
+        return {}
+    dead = candidates - live_report_hashes() - _ingesting_hashes()
+    released: Dict[str, int] = {}
+    for report_hash in dead:
+        reclaimed = _remove_report(report_hash)
+        if reclaimed is not None:
+            released[report_hash] = reclaimed
+    return released
+
+
+def _discard_store(report_hash: str, store_dirs: List[Path]) -> bool:
+    """
+    질의 중이 아니면 보고서의 열린 스토어/페이지 캐시와 스토어 디렉토리 삭제
+
+    Returns:
+        삭제했으면 True, 풀에서 빌려간 스토어가 있어 건너뛰었으면 False
+    """
+    def _remove() -> None:
+        get_benchmark_service().forget_report(report_hash)
+        for store_dir in store_dirs:
+            shutil.rmtree(store_dir)
+
+    return get_vector_store_pool().discard_if_idle(report_hash, _remove)
+
+
+def _remove_report(report_hash: str) -> Optional[int]:
+    """보고서 해시의 모든 스토어/인덱스 항목/페이지 캐시 삭제 (삭제한 것이 없으면 None)"""
+    removed = get_benchmark_index().delete_report(report_hash)
+    store_dirs = [root / report_hash for root in _store_roots().values() if (root / report_hash).is_dir()]
+    reclaimed = sum(_dir_size(store_dir) for store_dir in store_dirs)
+    if store_dirs:
+        if _discard_store(report_hash, store_dirs):
+            removed = True
+        else:
+            logger.info(f"Vector store {report_hash} is in use; left for the next GC run")
+            reclaimed = 0
+    if not removed:
+        return None
+    logger.info(f"Released vector store {report_hash} ({reclaimed / 1024 / 1024:.1f} MB)")
+    return reclaimed
+
+
+def collect_garbage(dry_run: bool = False, compact: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    벡터 스토어 GC 1회 실행
+
+    Args:
+        dry_run: True면 삭제/압축 없이 회수 가능한 용량만 보고
+        compact: 남은 스토어 압축 여부 (기본 settings.VECTOR_STORE_GC_COMPACT)
+
+    Returns:
+        {"removed": [...], "compacted": [...], "skipped": [...], "reclaimed_bytes": int, ...}
+    """
+    compact = settings.VECTOR_STORE_GC_COMPACT if compact is None else compact
+    started = time.perf_counter()
+    live = live_report_hashes()
+    protected = _ingesting_hashes()
+    pool = get_vector_store_pool()
+    min_age = settings.VECTOR_STORE_GC_MIN_AGE_SEC
+    now = time.time()
+
+    removed: List[Dict[str, Any]] = []
+    compacted: List[Dict[str, Any]] = []
+    skipped: List[Dict[str, Any]] = []
+    scanned = 0
+
+    for collection, root in _store_roots().items():
+        if not root.exists():
+            continue
+        for store_dir in sorted(d for d in root.iterdir() if d.is_dir()):
+            scanned += 1
+            report_hash = store_dir.name
+            complete = (store_dir / CHROMA_DB_FILE).exists()
+            reason = None if complete and report_hash in live else ("orphan" if complete else "incomplete")
+
+            if report_hash in protected:
+                skipped.append({"report_hash": report_hash, "collection": collection, "reason": "ingesting"})
+                continue
+
+            if reason is not None:
+                if now - store_dir.stat().st_mtime < min_age:
+                    skipped.append({"report_hash": report_hash, "collection": collection, "reason": "recent"})
+                    continue
+                size = _dir_size(store_dir)
+                in_use = pool.is_in_use(report_hash) if dry_run else not _discard_store(report_hash, [store_dir])
+                if in_use:
+                    # 질의 중인 스토어는 다음 실행에서 다시 판단
+                    skipped.append({"report_hash": report_hash, "collection": collection, "reason": "in_use"})
+                    continue
+                removed.append(
+                    {"report_hash": report_hash, "collection": collection, "reason": reason, "bytes": size}
+                )
+                continue
+
+            if not compact or now - (store_dir / CHROMA_DB_FILE).stat().st_mtime < min_age:
+                continue
+            if pool.is_open(report_hash):
+                # 열린 SQLite 연결이 있는 스토어는 다음 실행에서 압축
+                skipped.append({"report_hash": report_hash, "collection": collection, "reason": "open"})
+                continue
+            try:
+                reclaimed = _compact_store(store_dir, dry_run)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to compact vector store {store_dir}: {e}")
+                skipped.append({"report_hash": report_hash, "collection": collection, "reason": "locked"})
+                continue
+            if reclaimed:
+                compacted.append({"report_hash": report_hash, "collection": collection, "bytes": reclaimed})
+
+    # 스토어가 없어도 통합 인덱스에 남아 있는 보고서
+    index = get_benchmark_index()
+    index_removed = [h for h in index.list_reports() if h not in live and h not in protected]
+    if not dry_run:
+        for report_hash in index_removed:
+            index.delete_report(report_hash)
+
+    reclaimed_bytes = sum(r["bytes"] for r in removed) + sum(c["bytes"] for c in compacted)
+    result = {
+        "dry_run": dry_run,
+        "scanned": scanned,
+        "live_reports": len(live),
+        "removed": removed,
+        "compacted": compacted,
+        "skipped": skipped,
+        "index_reports_removed": index_removed,
+        "reclaimed_bytes": reclaimed_bytes,
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+    logger.info(
+        f"Vector store GC{' (dry run)' if dry_run else ''}: scanned={scanned}, removed={len(removed)}, "
+        f"compacted={len(compacted)}, reclaimed={reclaimed_bytes / 1024 / 1024:.1f} MB"
+    )
+    return result
+
+
+def submit_gc(dry_run: bool = False):
+    """GC 작업 등록 (진행 중인 GC가 있으면 재사용)"""
+    return get_job_service().submit(
+        JOB_KIND_VECTOR_STORE_GC, {"dry_run": dry_run}, dedupe_key="dry_run" if dry_run else "gc"
+    )
+
+
+async def run_vector_store_gc(ctx: JobContext) -> Dict[str, Any]:
+    """벡터 스토어 GC 작업"""
+    ctx.report_progress("collect")
+    result = await asyncio.to_thread(collect_garbage, bool(ctx.params.get("dry_run", False)))
+    ctx.report_progress("done")
+    return {"success": True, **result}
+
+
+register_job_handler(JOB_KIND_VECTOR_STORE_GC, run_vector_store_gc)
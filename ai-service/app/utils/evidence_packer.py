@@ -0,0 +1,161 @@
+"""Evidence packing utilities for retrieval-augmented prompts.
+
+Retrieved chunks are deduplicated, reordered with MMR for diversity and
+packed into a token budget before they are stuffed into an LLM prompt.
+"""
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Set
+
+from langchain_core.documents import Document
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SHINGLE_SIZE = 5
+_MIN_OVERLAP_CHARS = 30
+_MAX_OVERLAP_CHARS = 400
+
+
+@dataclass
+class PackedEvidence:
+    """Result of packing retrieved chunks into a token budget."""
+    documents: List[Document] = field(default_factory=list)
+    input_chunks: int = 0
+    input_tokens: int = 0
+    packed_tokens: int = 0
+    duplicates_removed: int = 0
+
+    @property
+    def packed_chunks(self) -> int:
+        return len(self.documents)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.input_tokens - self.packed_tokens)
+
+
+@lru_cache(maxsize=4)
+def get_token_counter(model: str = "gpt-4o") -> Callable[[str], int]:
+    """Return a tiktoken based token counter (falls back to a char estimate if unavailable)."""
+    try:
+        import tiktoken
+
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable for {model}, estimating tokens: {e}")
+        return lambda text: max(1, len(text) // 2)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def _shingles(text: str) -> Set[str]:
+    if len(text) <= _SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _suffix_prefix_overlap(previous: str, current: str) -> int:
+    """Length of the longest suffix of `previous` that is a prefix of `current` (splitter overlap)."""
+    limit = min(len(previous), len(current), _MAX_OVERLAP_CHARS)
+    for size in range(limit, _MIN_OVERLAP_CHARS - 1, -1):
+        if previous.endswith(current[:size]):
+            return size
+    return 0
+
+
+def pack_evidence(
+    documents: List[Document],
+    token_budget: int,
+    mmr_lambda: float = 0.7,
+    dedup_threshold: float = 0.85,
+    model: str = "gpt-4o",
+) -> PackedEvidence:
+    """
+    Deduplicate, diversify and pack retrieved chunks into a token budget.
+
+    1. Drop exact and near-identical chunks (character shingle Jaccard >= dedup_threshold)
+       and trim text-splitter overlap shared with an already kept chunk of the same page.
+    2. Reorder with MMR: relevance is the retrieval rank, redundancy is shingle similarity.
+    3. Greedily keep chunks in MMR order until the token budget is used.
+
+    Args:
+        documents: Retrieved chunks, most relevant first
+        token_budget: Maximum total tokens of packed chunk text
+        mmr_lambda: Relevance/diversity trade-off (1.0 = rank order only)
+        dedup_threshold: Similarity above which a chunk counts as a duplicate
+        model: Model name used to pick the tiktoken encoding
+
+    Returns:
+        PackedEvidence with packed documents and token statistics
+    """
+    count_tokens = get_token_counter(model)
+    result = PackedEvidence(input_chunks=len(documents))
+    result.input_tokens = sum(count_tokens(doc.page_content) for doc in documents)
+
+    # 1. Deduplicate
+    kept: List[Document] = []
+    kept_shingles: List[Set[str]] = []
+    for doc in documents:
+        text = doc.page_content
+        page = doc.metadata.get("page")
+        for other in kept:
+            if other.metadata.get("page") == page:
+                overlap = _suffix_prefix_overlap(other.page_content, text)
+                if overlap:
+                    text = text[overlap:]
+                    break
+
+        normalized = _normalize(text)
+        if not normalized:
+            result.duplicates_removed += 1
+            continue
+        shingles = _shingles(normalized)
+        if any(_jaccard(shingles, seen) >= dedup_threshold for seen in kept_shingles):
+            result.duplicates_removed += 1
+            continue
+
+        kept.append(Document(page_content=text, metadata=dict(doc.metadata)))
+        kept_shingles.append(shingles)
+
+    # 2. MMR ordering (incremental max-redundancy over a pairwise similarity matrix)
+    total = len(kept)
+    similarity = [[0.0] * total for _ in range(total)]
+    for i in range(total):
+        for j in range(i + 1, total):
+            similarity[i][j] = similarity[j][i] = _jaccard(kept_shingles[i], kept_shingles[j])
+
+    relevance = [1.0 - rank / total for rank in range(total)]
+    redundancy = [0.0] * total
+    remaining = set(range(total))
+    order: List[int] = []
+    while remaining:
+        best = max(remaining, key=lambda i: (mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy[i], -i))
+        order.append(best)
+        remaining.discard(best)
+        for i in remaining:
+            redundancy[i] = max(redundancy[i], similarity[i][best])
+
+    # 3. Pack to budget
+    for i in order:
+        tokens = count_tokens(kept[i].page_content)
+        if result.packed_tokens + tokens > token_budget:
+            continue
+        result.documents.append(kept[i])
+        result.packed_tokens += tokens
+
+    return result
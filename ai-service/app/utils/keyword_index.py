@@ -0,0 +1,120 @@
+"""
+Page-level keyword inverted index.
+
+보고서 페이지 텍스트를 Aho-Corasick 오토마톤으로 한 번만 훑어 키워드별
+페이지 출현 횟수를 기록합니다.
+- 키워드 수와 관계없이 페이지 텍스트 1회 스캔
+- 출현 0회 키워드는 LLM 호출 없이 바로 "No" 판정 가능
+- 출현 페이지 목록으로 벡터 검색 범위 제한
+"""
+
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 공백 정규화 (PDF 줄바꿈으로 끊긴 키워드도 매칭)"""
+    return re.sub(r"\s+", " ", text).lower()
+
+
+class AhoCorasick:
+    """Pure-Python Aho-Corasick automaton counting every pattern occurrence."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = sorted({p for p in patterns if p})
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            self._add(pattern, index)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, index: int) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(index)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """패턴별 출현 횟수 (출현한 패턴만)"""
+        counts: Dict[int, int] = {}
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                counts[index] = counts.get(index, 0) + 1
+        return {self.patterns[index]: n for index, n in counts.items()}
+
+
+@lru_cache(maxsize=8)
+def get_automaton(patterns: Tuple[str, ...]) -> AhoCorasick:
+    """정규화된 패턴 집합별 오토마톤 (기본 이슈 키워드 오토마톤은 프로세스당 1회 생성)"""
+    return AhoCorasick(patterns)
+
+
+class PageKeywordIndex:
+    """Inverted index: normalized keyword -> {page: hit count} for one report."""
+
+    def __init__(self, text_content: List[Dict[str, Any]], keywords: Iterable[str] = ()):
+        self._pages: List[Tuple[int, str]] = [
+            (item["page"], normalize_text(item["text"])) for item in text_content
+        ]
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._lock = threading.Lock()
+        self.ensure(keywords)
+
+    def ensure(self, keywords: Iterable[str]) -> None:
+        """아직 색인되지 않은 키워드를 한 번의 페이지 스캔으로 추가 (ad-hoc 키워드)"""
+        with self._lock:
+            missing = tuple(sorted({normalize_text(k).strip() for k in keywords} - set(self._postings) - {""}))
+            if not missing:
+                return
+            automaton = get_automaton(missing)
+            for keyword in missing:
+                self._postings[keyword] = {}
+            for page, text in self._pages:
+                for keyword, count in automaton.count(text).items():
+                    self._postings[keyword][page] = count
+
+    def page_hits(self, keyword: str) -> Dict[int, int]:
+        """키워드의 페이지별 출현 횟수"""
+        key = normalize_text(keyword).strip()
+        self.ensure([key])
+        return self._postings[key]
+
+    def stats(self, keyword: str) -> Dict[str, Any]:
+        """{"hits": 총 출현 횟수, "hit_pages": 출현 페이지 목록}"""
+        postings = self.page_hits(keyword)
+        return {"hits": sum(postings.values()), "hit_pages": sorted(postings)}
+
+    def hit_pages(self, keywords: Iterable[str]) -> List[int]:
+        """키워드 중 하나라도 출현한 페이지 목록"""
+        pages = set()
+        for keyword in keywords:
+            pages.update(self.page_hits(keyword))
+        return sorted(pages)
@@ -0,0 +1,77 @@
+"""
+Bounded LRU mapping
+
+보고서 해시 단위 메모리 캐시(페이지 텍스트, 키워드 역색인 등)의 크기 제한용
+- 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+- Thread-safe: 벤치마킹 블로킹 작업 스레드에서 함께 사용
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe mapping that keeps at most max_entries recently used items."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> V:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict_locked()
+            return value
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """있으면 반환, 없으면 factory()로 만들어 등록 (동시 생성 시 먼저 등록된 값 사용)"""
+        value = self.get(key)
+        if value is not None:
+            return value
+        created = factory()
+        with self._lock:
+            value = self._entries.setdefault(key, created)
+            self._entries.move_to_end(key)
+            self._evict_locked()
+            return value
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
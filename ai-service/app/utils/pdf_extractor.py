@@ -0,0 +1,173 @@
+"""
+Shared PDF text extraction engine.
+
+모든 PDF 텍스트 추출 경로(벤치마킹 보고서, ESG 표준, 문서 로더)가 사용하는 공용 엔진
+- pypdf: 빠른 텍스트 추출 (레이아웃 불필요 시)
+- pdfplumber: 레이아웃 기반 추출 (느리지만 표/다단 구성에 강함)
+- auto: pypdf로 추출하고 빈 페이지/실패 페이지만 pdfplumber로 재시도
+- 큰 문서는 페이지 묶음 단위로 프로세스 풀에서 병렬 추출하고 페이지 순서대로 스트리밍
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.config.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ENGINE_AUTO = "auto"
+ENGINE_PYPDF = "pypdf"
+ENGINE_PDFPLUMBER = "pdfplumber"
+ENGINES = (ENGINE_AUTO, ENGINE_PYPDF, ENGINE_PDFPLUMBER)
+
+# (page_number, text) - 1부터 시작하는 페이지 번호
+PageText = Tuple[int, str]
+
+
+def count_pages(pdf_path: str) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(pdf_path).pages)
+
+
+def _iter_range(pdf_path: str, start: int, end: Optional[int], engine: str) -> Iterator[PageText]:
+    """
+    페이지 범위 [start, end) 추출 (end=None이면 마지막 페이지까지)
+
+    문서는 범위당 한 번만 엽니다. auto 엔진은 pypdf 결과가 비었거나 실패한 페이지만
+    pdfplumber로 다시 읽습니다.
+    """
+    plumber = None
+    try:
+        if engine == ENGINE_PDFPLUMBER:
+            import pdfplumber
+
+            plumber = pdfplumber.open(pdf_path)
+            pages = plumber.pages[start:end]
+            for offset, page in enumerate(pages):
+                yield start + offset + 1, page.extract_text() or ""
+            return
+
+        from pypdf import PdfReader
+
+        reader = PdfReader(pdf_path)
+        for index in range(start, len(reader.pages) if end is None else end):
+            try:
+                text = reader.pages[index].extract_text() or ""
+            except Exception:
+                text = ""
+            if engine == ENGINE_AUTO and not text.strip():
+                if plumber is None:
+                    import pdfplumber
+
+                    plumber = pdfplumber.open(pdf_path)
+                try:
+                    text = plumber.pages[index].extract_text() or ""
+                except Exception:
+                    pass
+            yield index + 1, text
+    finally:
+        if plumber is not None:
+            plumber.close()
+
+
+def _extract_range(pdf_path: str, start: int, end: int, engine: str) -> List[PageText]:
+    """프로세스 풀 워커 작업 단위"""
+    return list(_iter_range(pdf_path, start, end, engine))
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _worker_count() -> int:
+    return max(1, settings.PDF_EXTRACT_WORKERS or os.cpu_count() or 1)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """추출 전용 프로세스 풀 (spawn: 서버 프로세스의 스레드/Chroma 상태를 복제하지 않음)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = _worker_count()
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"PDF extraction process pool started: {workers} workers")
+        return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def iter_pages(
+    pdf_path: str,
+    engine: Optional[str] = None,
+    parallel: Optional[bool] = None,
+) -> Iterator[PageText]:
+    """
+    PDF 페이지 텍스트를 페이지 순서대로 스트리밍
+
+    Args:
+        pdf_path: PDF 파일 경로
+        engine: auto | pypdf | pdfplumber (기본 settings.PDF_EXTRACT_ENGINE)
+        parallel: 프로세스 풀 사용 여부 (기본: 워커가 2개 이상이면 사용)
+                  PDF_EXTRACT_PARALLEL_MIN_PAGES 미만 문서는 항상 현재 프로세스에서 추출
+
+    Yields:
+        (page_number, text) - 텍스트가 없는 페이지도 빈 문자열로 포함
+    """
+    engine = engine or settings.PDF_EXTRACT_ENGINE
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown PDF extraction engine: {engine}")
+
+    workers = _worker_count()
+    if parallel is None:
+        parallel = workers > 1
+    total = count_pages(pdf_path) if parallel else 0
+    if not parallel or total < max(settings.PDF_EXTRACT_PARALLEL_MIN_PAGES, 2):
+        yield from _iter_range(pdf_path, 0, None, engine)
+        return
+
+    # 워커당 2개 정도의 묶음 (문서를 여는 비용이 페이지 추출보다 크지 않도록 최소 BATCH_PAGES)
+    batch = max(settings.PDF_EXTRACT_BATCH_PAGES, -(-total // (workers * 2)), 1)
+    ranges = [(start, min(start + batch, total)) for start in range(0, total, batch)]
+    executor = _get_executor()
+    futures: List[Future] = [executor.submit(_extract_range, pdf_path, start, end, engine) for start, end in ranges]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def extract_pages(
+    pdf_path: str,
+    engine: Optional[str] = None,
+    parallel: Optional[bool] = None,
+) -> List[Dict[str, object]]:
+    """텍스트가 있는 페이지만 [{"page": int, "text": str}, ...]로 반환"""
+    return [
+        {"page": page, "text": text}
+        for page, text in iter_pages(pdf_path, engine=engine, parallel=parallel)
+        if text.strip()
+    ]
+
+
+def extract_text(
+    pdf_path: str,
+    engine: Optional[str] = None,
+    separator: str = "\n",
+) -> str:
+    """전체 텍스트를 한 문자열로 반환 (페이지 사이 separator)"""
+    return separator.join(text for _, text in iter_pages(pdf_path, engine=engine) if text)
@@ -0,0 +1,39 @@
+"""
+Async rate limiter
+
+여러 작업이 공유하는 호출 속도 상한 (분당 N회, 균등 간격)
+- acquire()는 다음 호출 가능 시각까지 대기
+- rate_per_min <= 0이면 제한 없음
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Spaces calls evenly so that at most rate_per_min start per minute."""
+
+    def __init__(self, rate_per_min: Optional[float]):
+        self.rate_per_min = rate_per_min or 0
+        self.interval = 60.0 / self.rate_per_min if self.rate_per_min > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """
+        다음 호출 슬롯 예약 후 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.interval <= 0:
+            return 0.0
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        wait = slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
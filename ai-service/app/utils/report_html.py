@@ -0,0 +1,193 @@
+"""
+Report HTML block utilities
+
+생성 보고서 HTML(_combine_sections_to_report 구조)을 수정 단위 블록으로 나누고 다시 합침
+- issue: <section class="impact-issue-detail|financial-issue-detail" id="<type>-<issue_id>">
+- analysis: <div class="analysis-section" id="impact-analysis|financial-analysis">
+- conclusion: <section class="conclusion">
+- 블록 위치는 원문 문자 오프셋으로 보관하므로 나머지 HTML(스타일/목차/헤더)은 바이트 그대로 유지
+"""
+
+import html as html_lib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+BLOCK_ISSUE = "issue"
+BLOCK_ANALYSIS = "analysis"
+BLOCK_CONCLUSION = "conclusion"
+
+_BLOCK_OPEN_RE = re.compile(
+    r'<(section|div)\s[^>]*?class="(impact-issue-detail|financial-issue-detail|analysis-section(?: financial)?|conclusion)"[^>]*>'
+)
+_ID_RE = re.compile(r'\bid="([^"]+)"')
+_H3_RE = re.compile(r"<h3[^>]*>(.*?)</h3>", re.S)
+_SPAN_RE = re.compile(r"<span[^>]*>.*?</span>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_CODE_FENCE_RE = re.compile(r"^```(?:html)?\s*|\s*```$")
+
+_ANALYSIS_TITLES = {"impact-analysis": "영향 중대성 핵심 이슈 분석", "financial-analysis": "재무 중대성 핵심 이슈 분석"}
+
+# 특정 블록이 아닌 보고서 전반을 가리키는 표현
+_GLOBAL_KEYWORDS = ("전체", "모든", "전반", "보고서 전체", "all sections", "entire report")
+
+
+@dataclass
+class ReportBlock:
+    block_id: str
+    kind: str
+    materiality_type: Optional[str]
+    title: str
+    tag: str
+    open_tag: str
+    start: int
+    end: int
+    html: str
+
+    @property
+    def text(self) -> str:
+        return html_to_text(self.html)
+
+
+def html_to_text(fragment: str) -> str:
+    return re.sub(r"\s+", " ", html_lib.unescape(_TAG_RE.sub(" ", fragment))).strip()
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text).lower()
+
+
+def _element_end(source: str, tag: str, pos: int) -> int:
+    """pos(여는 태그 직후)부터 같은 태그의 짝이 맞는 닫는 태그 끝 위치 (없으면 -1)"""
+    depth = 1
+    for match in re.finditer(rf"<(/?){tag}\b[^>]*>", source[pos:], re.I):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return pos + match.end()
+    return -1
+
+
+def split_report_blocks(report_html: str) -> List[ReportBlock]:
+    """
+    보고서 HTML → 수정 단위 블록 목록 (문서 순서)
+
+    생성 보고서 구조가 아니면 빈 목록을 반환합니다.
+    """
+    blocks: List[ReportBlock] = []
+    pos = 0
+    while True:
+        match = _BLOCK_OPEN_RE.search(report_html, pos)
+        if match is None:
+            break
+        tag, css_class = match.group(1), match.group(2)
+        end = _element_end(report_html, tag, match.end())
+        if end < 0:
+            break
+        id_match = _ID_RE.search(match.group(0))
+        fragment = report_html[match.start():end]
+
+        if css_class == "conclusion":
+            block_id, kind, materiality_type = "conclusion", BLOCK_CONCLUSION, None
+        elif css_class.startswith("analysis-section"):
+            block_id = id_match.group(1) if id_match else f"analysis-{len(blocks)}"
+            kind, materiality_type = BLOCK_ANALYSIS, block_id.split("-", 1)[0]
+        else:
+            materiality_type = css_class.split("-", 1)[0]
+            block_id = id_match.group(1) if id_match else f"{materiality_type}-{len(blocks)}"
+            kind = BLOCK_ISSUE
+
+        if kind == BLOCK_ANALYSIS:
+            title = _ANALYSIS_TITLES.get(block_id, "핵심 이슈 분석")
+        else:
+            h3 = _H3_RE.search(fragment)
+            title = html_to_text(_SPAN_RE.sub("", h3.group(1))) if h3 else block_id
+
+        blocks.append(ReportBlock(
+            block_id=block_id,
+            kind=kind,
+            materiality_type=materiality_type,
+            title=title,
+            tag=tag,
+            open_tag=match.group(0),
+            start=match.start(),
+            end=end,
+            html=fragment,
+        ))
+        pos = end
+    return blocks
+
+
+def is_global_instruction(instruction: str) -> bool:
+    lowered = instruction.lower()
+    return any(keyword in lowered for keyword in _GLOBAL_KEYWORDS)
+
+
+def match_blocks_by_name(blocks: List[ReportBlock], instruction: str) -> List[ReportBlock]:
+    """
+    지시문에 등장하는 이슈명/이슈 ID/블록 제목으로 대상 블록 선택
+
+    "영향"/"재무" 중 하나만 언급되면 해당 중대성 유형의 블록만 남깁니다.
+    """
+    normalized = _normalize(instruction)
+    matched: List[ReportBlock] = []
+    for block in blocks:
+        if block.kind == BLOCK_ISSUE:
+            issue_id = block.block_id.split("-", 1)[1]
+            if (block.title and _normalize(block.title) in normalized) or (
+                len(issue_id) > 2 and issue_id.lower() in normalized
+            ):
+                matched.append(block)
+        elif block.kind == BLOCK_ANALYSIS:
+            if "분석표" in normalized or "핵심이슈분석" in normalized:
+                matched.append(block)
+        elif block.kind == BLOCK_CONCLUSION:
+            if "결론" in normalized or "향후방향" in normalized:
+                matched.append(block)
+
+    mentions_impact = "영향중대성" in normalized or "impact" in normalized
+    mentions_financial = "재무" in normalized or "financial" in normalized
+    if mentions_impact != mentions_financial:
+        wanted = "impact" if mentions_impact else "financial"
+        scoped = [b for b in matched if b.materiality_type in (None, wanted)]
+        matched = scoped or matched
+    return matched
+
+
+def clean_fragment(fragment: str) -> str:
+    """LLM 응답에서 코드 펜스 제거"""
+    return _CODE_FENCE_RE.sub("", fragment.strip()).strip()
+
+
+def rewrap_block(block: ReportBlock, fragment: str) -> Optional[str]:
+    """
+    수정된 블록 HTML 정리
+
+    - 원래 여는 태그(클래스/id/data-*)로 시작하면 그대로 사용
+    - 내부 내용만 돌아온 경우 원래 여는 태그로 감쌈
+    - 태그 짝이 맞지 않으면 None (원본 유지)
+    """
+    fragment = clean_fragment(fragment)
+    if not fragment:
+        return None
+    head = re.match(rf"<{block.tag}\b[^>]*>", fragment)
+    if head is None or (block.kind != BLOCK_CONCLUSION and f'id="{block.block_id}"' not in head.group(0)):
+        fragment = f"{block.open_tag}\n{fragment}\n</{block.tag}>"
+        head = re.match(rf"<{block.tag}\b[^>]*>", fragment)
+    end = _element_end(fragment, block.tag, head.end())
+    if end != len(fragment):
+        return None
+    return fragment
+
+
+def splice_blocks(report_html: str, blocks: List[ReportBlock], replacements: Dict[str, str]) -> str:
+    """블록 HTML 교체 (나머지 HTML은 그대로)"""
+    parts: List[str] = []
+    pos = 0
+    for block in blocks:
+        if block.block_id not in replacements:
+            continue
+        parts.append(report_html[pos:block.start])
+        parts.append(replacements[block.block_id])
+        pos = block.end
+    parts.append(report_html[pos:])
+    return "".join(parts)
@@ -0,0 +1,112 @@
+"""
+Single-flight request coalescing
+
+같은 키로 동시에 들어온 호출을 하나의 실행으로 합치고 결과를 공유
+- do(): asyncio 호출. 실제 실행은 별도 태스크에서 돌고 모든 대기자가 그 태스크를 기다림
+  - 대기자 하나가 취소돼도(클라이언트 연결 끊김 등) 나머지는 계속 결과를 받음
+  - 마지막 대기자까지 취소되면 실행 태스크도 취소
+- do_sync(): 스레드 호출. 첫 호출자가 실행하고 나머지는 결과를 기다림
+- 예외는 모든 대기자에게 그대로 전파되고, 완료(성공/실패) 즉시 키를 비우므로 결과를 캐시하지 않음
+
+결과 객체는 대기자끼리 공유되므로 변경 가능한 값이면 호출부에서 복사해 사용합니다.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._async_flights: Dict[Hashable, _AsyncFlight] = {}
+        self._sync_flights: Dict[Hashable, Future] = {}
+        self._counters: Dict[str, int] = {"calls": 0, "executions": 0, "coalesced": 0, "abandoned": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """key가 같은 실행이 진행 중이면 합류, 아니면 fn() 실행"""
+        with self._lock:
+            self._counters["calls"] += 1
+            flight = self._async_flights.get(key)
+            if flight is None:
+                self._counters["executions"] += 1
+                flight = _AsyncFlight(asyncio.ensure_future(fn()))
+                self._async_flights[key] = flight
+                flight.task.add_done_callback(lambda _, k=key, f=flight: self._forget_async(k, f))
+            else:
+                self._counters["coalesced"] += 1
+            flight.waiters += 1
+
+        cancelled = False
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = cancelled and flight.waiters == 0 and not flight.task.done()
+                if abandoned:
+                    # 취소 중인 실행에 새 호출이 합류하지 않도록 먼저 키를 비움
+                    self._forget_async_locked(key, flight)
+                    self._counters["abandoned"] += 1
+            if abandoned:
+                flight.task.cancel()
+
+    def do_sync(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """스레드용 do(): 진행 중인 같은 키의 실행 결과를 기다리거나 직접 실행"""
+        with self._lock:
+            self._counters["calls"] += 1
+            future = self._sync_flights.get(key)
+            leader = future is None
+            if leader:
+                self._counters["executions"] += 1
+                future = Future()
+                self._sync_flights[key] = future
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._sync_flights.get(key) is future:
+                    del self._sync_flights[key]
+
+    def _forget_async(self, key: Hashable, flight: _AsyncFlight) -> None:
+        with self._lock:
+            self._forget_async_locked(key, flight)
+
+    def _forget_async_locked(self, key: Hashable, flight: _AsyncFlight) -> None:
+        if self._async_flights.get(key) is flight:
+            del self._async_flights[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "in_flight": len(self._async_flights) + len(self._sync_flights),
+            }
@@ -0,0 +1,114 @@
+"""
+Embedding provider latency comparison.
+
+벤치마킹 보고서 청크를 provider별로 임베딩하여 지연 시간을 비교합니다.
+
+Usage (ai-service 디렉토리에서):
+    python -m benchmarks.embedding_latency --pdf data/benchmark_uploads/report.pdf
+    python -m benchmarks.embedding_latency --providers bge-m3 --max-chunks 64 --batch-sizes 8,32
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import List
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from app.config.config import settings
+from app.llm.clients.embedding_provider import (
+    LocalSentenceTransformerEmbeddings,
+    get_embeddings,
+    provider_id,
+)
+from app.utils.pdf_extractor import iter_pages
+
+_BASE_DIR = Path(__file__).parent.parent
+
+
+def load_chunks(pdf_path: Path, max_chunks: int) -> List[str]:
+    """BenchmarkService와 같은 분할 규칙으로 보고서 청크 생성"""
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=2000,
+        chunk_overlap=200,
+        length_function=len,
+        separators=["\n\n", "\n", "。", ". ", " ", ""],
+    )
+    chunks: List[str] = []
+    pages = iter_pages(str(pdf_path))
+    for _, text in pages:
+        if text:
+            chunks.extend(splitter.split_text(text))
+        if len(chunks) >= max_chunks:
+            pages.close()
+            break
+    return chunks[:max_chunks]
+
+
+def time_provider(name: str, embeddings, chunks: List[str], queries: int) -> dict:
+    """문서 임베딩 1회 + 질의 임베딩 N회 시간 측정"""
+    start = time.perf_counter()
+    embeddings.embed_documents(chunks)
+    documents_sec = time.perf_counter() - start
+
+    query_times = []
+    for i in range(queries):
+        start = time.perf_counter()
+        embeddings.embed_query(f"기후변화 대응 전략 {i}")
+        query_times.append(time.perf_counter() - start)
+
+    return {
+        "provider": name,
+        "chunks": len(chunks),
+        "documents_sec": documents_sec,
+        "per_chunk_ms": documents_sec / max(len(chunks), 1) * 1000,
+        "query_p50_ms": statistics.median(query_times) * 1000 if query_times else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, help="보고서 PDF (기본: 업로드 폴더의 첫 PDF)")
+    parser.add_argument("--providers", default="openai,bge-m3", help="비교할 provider 목록")
+    parser.add_argument("--max-chunks", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--batch-sizes", default=str(settings.LOCAL_EMBEDDING_BATCH_SIZE),
+                        help="로컬 모델 배치 크기 목록 (예: 8,32,64)")
+    args = parser.parse_args()
+
+    pdf_path = args.pdf or next((_BASE_DIR / settings.BENCHMARK_UPLOADS_DIR).glob("*.pdf"), None)
+    if pdf_path is None:
+        parser.error("PDF를 찾을 수 없습니다 (--pdf 지정)")
+
+    chunks = load_chunks(pdf_path, args.max_chunks)
+    print(f"{pdf_path.name}: {len(chunks)} chunks")
+
+    results = []
+    for provider in args.providers.split(","):
+        pid = provider_id(provider.strip())
+        if pid.startswith("openai") and not settings.OPENAI_API_KEY:
+            print(f"skip {pid}: OPENAI_API_KEY not set")
+            continue
+
+        if pid.startswith("openai"):
+            results.append(time_provider(pid, get_embeddings(pid), chunks, args.queries))
+            continue
+
+        # 모델 로드 시간은 제외 (워밍업 후 배치 크기별 측정)
+        model_name = pid.partition(":")[2]
+        LocalSentenceTransformerEmbeddings(model_name, batch_size=1).embed_query("warmup")
+        for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+            embeddings = LocalSentenceTransformerEmbeddings(model_name, batch_size=batch_size)
+            results.append(time_provider(f"{pid} (batch={batch_size})", embeddings, chunks, args.queries))
+
+    print(f"\n{'provider':<40} {'chunks':>6} {'total(s)':>9} {'ms/chunk':>9} {'query p50(ms)':>14}")
+    for r in results:
+        print(
+            f"{r['provider']:<40} {r['chunks']:>6} {r['documents_sec']:>9.2f} "
+            f"{r['per_chunk_ms']:>9.1f} {r['query_p50_ms']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+PDF text extraction throughput comparison.
+
+업로드 폴더의 보고서(내용 해시 기준 중복 제거)를 추출 방식별로 처리하여 처리량을 비교합니다.
+- pdfplumber (순차): 기존 벤치마킹 추출 경로
+- pypdf (순차): 기존 표준 문서 추출 경로
+- engine: app.utils.pdf_extractor (엔진/프로세스 풀 설정 적용)
+
+측정 예시 (1 CPU): 업로드 폴더의 PDF 9개가 모두 같은 내용이라 고유 보고서 1개(44페이지)로 측정
+    pdfplumber (순차) 7.3 pages/s, pypdf (순차) 22.2 pages/s,
+    engine=auto 18.5 pages/s, engine=auto (pool) 15.4 pages/s (단일 코어에서는 풀 오버헤드만 추가)
+보고서 간 편차(스캔 페이지 비율, 레이아웃)는 서로 다른 보고서를 여러 개 넣어 확인하세요.
+
+Usage (ai-service 디렉토리에서):
+    python -m benchmarks.pdf_extraction
+    python -m benchmarks.pdf_extraction --max-files 3 --engines auto,pypdf --workers 4
+"""
+
+import argparse
+import hashlib
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from app.config.config import settings
+from app.utils import pdf_extractor
+from app.utils.pdf_extractor import count_pages, iter_pages
+
+_BASE_DIR = Path(__file__).parent.parent
+
+
+def unique_pdfs(directory: Path, max_files: int) -> List[Path]:
+    """내용이 같은 업로드 사본은 한 번만 측정"""
+    seen: Dict[str, Path] = {}
+    for path in sorted(directory.glob("*.pdf")):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        seen.setdefault(digest, path)
+    return list(seen.values())[:max_files]
+
+
+def sequential_pdfplumber(pdf_path: Path) -> List[str]:
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def sequential_pypdf(pdf_path: Path) -> List[str]:
+    from pypdf import PdfReader
+
+    return [page.extract_text() or "" for page in PdfReader(str(pdf_path)).pages]
+
+
+def engine_runner(engine: str, parallel: bool) -> Callable[[Path], List[str]]:
+    def run(pdf_path: Path) -> List[str]:
+        return [text for _, text in iter_pages(str(pdf_path), engine=engine, parallel=parallel)]
+
+    return run
+
+
+def time_method(name: str, extract: Callable[[Path], List[str]], pdfs: List[Path], pages: int) -> dict:
+    start = time.perf_counter()
+    chars = 0
+    empty = 0
+    for pdf_path in pdfs:
+        for text in extract(pdf_path):
+            chars += len(text)
+            empty += not text.strip()
+    elapsed = time.perf_counter() - start
+    return {
+        "method": name,
+        "seconds": elapsed,
+        "pages_per_sec": pages / elapsed if elapsed else 0.0,
+        "chars": chars,
+        "empty_pages": empty,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, default=_BASE_DIR / settings.BENCHMARK_UPLOADS_DIR)
+    parser.add_argument("--max-files", type=int, default=5)
+    parser.add_argument("--engines", default="auto,pypdf,pdfplumber", help="비교할 엔진 목록")
+    parser.add_argument("--workers", type=int, help="프로세스 풀 워커 수 (기본: PDF_EXTRACT_WORKERS)")
+    parser.add_argument("--skip-baseline", action="store_true", help="순차 pdfplumber/pypdf 측정 생략")
+    args = parser.parse_args()
+
+    if args.workers:
+        settings.PDF_EXTRACT_WORKERS = args.workers
+
+    pdfs = unique_pdfs(args.dir, args.max_files)
+    if not pdfs:
+        parser.error(f"PDF를 찾을 수 없습니다: {args.dir}")
+    pages = sum(count_pages(str(p)) for p in pdfs)
+    uploads = len(list(args.dir.glob("*.pdf")))
+    print(f"{len(pdfs)} unique PDFs ({uploads} uploads), {pages} pages")
+
+    # 프로세스 풀 기동 시간은 제외 (워밍업)
+    list(iter_pages(str(pdfs[0]), engine="pypdf", parallel=True))
+
+    methods = []
+    if not args.skip_baseline:
+        methods += [("pdfplumber (sequential)", sequential_pdfplumber), ("pypdf (sequential)", sequential_pypdf)]
+    for engine in (e.strip() for e in args.engines.split(",")):
+        methods.append((f"engine={engine}", engine_runner(engine, parallel=False)))
+        methods.append((f"engine={engine} (pool)", engine_runner(engine, parallel=True)))
+
+    results = [time_method(name, extract, pdfs, pages) for name, extract in methods]
+    pdf_extractor.shutdown_executor()
+
+    print(f"\n{'method':<32} {'total(s)':>9} {'pages/s':>9} {'chars':>10} {'empty':>6}")
+    for r in results:
+        print(
+            f"{r['method']:<32} {r['seconds']:>9.2f} {r['pages_per_sec']:>9.1f} "
+            f"{r['chars']:>10} {r['empty_pages']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()